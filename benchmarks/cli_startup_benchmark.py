@@ -0,0 +1,77 @@
+"""Benchmark the cold start of the headless CLI against the GUI import path.
+
+Usage:
+    python benchmarks/cli_startup_benchmark.py [--runs 5] [--budget 9000]
+
+Each run is a fresh interpreter that loads the catalog and solves one
+budget. The GUI run does it the way src/main.py does, with the GUI
+modules and Tk imported, but without opening a window, so it is a lower
+bound for the GUI's time to a first result.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+
+GUI_STARTUP = """
+import main
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.services.snapshot_cache import SnapshotCache
+from src.services.optimizer import OptimizerService
+file_service = FileService(journal=True)
+item_service = ItemService(file_service, snapshot_cache=SnapshotCache(file_service.file_path.with_suffix(".snapshot")))
+OptimizerService().solve({budget}, item_service.snapshot(), item_service.fingerprint)
+"""
+
+
+def time_command(command: list, env: dict, runs: int) -> list:
+    """Wall times of running a command in a fresh interpreter."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=REPO_ROOT, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=int, default=9000)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([REPO_ROOT, SRC_DIR])
+
+    cli = [sys.executable, "-m", "src.cli", "optimize", "--budget", str(args.budget), "--json"]
+    gui = [sys.executable, "-c", GUI_STARTUP.format(budget=args.budget)]
+    bare = [sys.executable, "-c", "pass"]
+
+    interpreter = time_command(bare, env, args.runs)
+    cli_times = time_command(cli, env, args.runs)
+    gui_times = time_command(gui, env, args.runs)
+
+    # The CLI must not load Tk at all
+    check = subprocess.run(
+        [sys.executable, "-c", "import sys, src.cli; print('tkinter' in sys.modules)"],
+        cwd=REPO_ROOT, env=env, check=True, capture_output=True, text=True)
+
+    base_ms = statistics.median(interpreter) * 1000
+    cli_ms = statistics.median(cli_times) * 1000
+    gui_ms = statistics.median(gui_times) * 1000
+    print(f"Interpreter alone:          {base_ms:8.1f} ms median of {args.runs}")
+    print(f"CLI optimize:               {cli_ms:8.1f} ms median of {args.runs}")
+    print(f"GUI path (no window):       {gui_ms:8.1f} ms median of {args.runs}")
+    print(f"Budget: {args.budget}")
+    print(f"CLI imports tkinter: {check.stdout.strip()}")
+
+
+if __name__ == "__main__":
+    main()
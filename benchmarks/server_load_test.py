@@ -0,0 +1,176 @@
+"""Load test the HTTP service at several concurrency levels.
+
+Usage:
+    python benchmarks/server_load_test.py [--concurrency 1,4,16,64] [--requests 400]
+        [--distinct 100] [--processes N] [--url http://host:port]
+
+Without --url a server is started on a free local port and stopped
+afterwards. Each level runs --requests requests over one keep-alive
+connection per concurrent client. Requests are drawn from a pool of
+--distinct optimize, top-k and frontier queries, so later requests hit
+the server's cache or join a solve in flight. Raise --distinct to
+measure cold solves.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import quote, urlsplit
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+REPO_ITEMS = os.path.join(REPO_ROOT, "src", "items.json")
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples), max(1, math.ceil(fraction * len(samples)))) - 1]
+
+
+def build_targets(count: int, seed: int) -> list:
+    """Request targets mixing endpoints, budgets and profiles."""
+    with open(REPO_ITEMS, 'r') as f:
+        profiles = [name for name in json.load(f)['weights'] if name != "Base Weights"]
+    rng = random.Random(seed)
+    targets = []
+    for _ in range(count):
+        chosen = rng.sample(profiles, rng.randint(0, min(2, len(profiles))))
+        params = f"profiles={quote(','.join(chosen))}"
+        if chosen and rng.random() < 0.5:
+            params += f"&scales={quote(f'{chosen[0]}:{rng.randint(0, 10) / 10}')}"
+        kind = rng.random()
+        if kind < 0.8:
+            targets.append(f"/optimize?budget={rng.randrange(3500, 9001, 500)}&{params}")
+        elif kind < 0.9:
+            targets.append(f"/top-k?budget={rng.randrange(3500, 6001, 500)}&k=3&{params}")
+        else:
+            targets.append(f"/frontier?max={rng.randrange(5000, 8001, 1000)}&step=1000&{params}")
+    return targets
+
+
+async def request(reader, writer, host: str, target: str) -> tuple:
+    """Send one GET on a keep-alive connection; returns (status, body)."""
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def run_level(host: str, port: int, targets: list, concurrency: int, total: int, seed: int) -> dict:
+    """Run total requests with the given number of concurrent clients."""
+    rng = random.Random(seed)
+    queue = [rng.choice(targets) for _ in range(total)]
+    latencies, statuses = [], {}
+
+    async def client():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while queue:
+                target = queue.pop()
+                start = time.perf_counter()
+                status, _ = await request(reader, writer, host, target)
+                latencies.append(time.perf_counter() - start)
+                statuses[status] = statuses.get(status, 0) + 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+        "statuses": statuses,
+    }
+
+
+async def health(host: str, port: int) -> dict:
+    """Counters reported by /health."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, body = await request(reader, writer, host, "/health")
+        return json.loads(body)
+    finally:
+        writer.close()
+
+
+def start_server(processes) -> tuple:
+    """Start a server on a free port and wait until it answers."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    command = [sys.executable, "-m", "src.server", "--port", str(port)]
+    if processes is not None:
+        command += ["--processes", str(processes)]
+    process = subprocess.Popen(command, cwd=REPO_ROOT,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            asyncio.run(health("127.0.0.1", port))
+            return process, port
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Existing server, e.g. http://192.168.1.20:8765")
+    parser.add_argument("--processes", type=int, help="Solver processes of the started server")
+    parser.add_argument("--concurrency", default="1,4,16,64")
+    parser.add_argument("--requests", type=int, default=400, help="Requests per level")
+    parser.add_argument("--distinct", type=int, default=100, help="Distinct queries in the pool")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        process, port = start_server(args.processes)
+        host = "127.0.0.1"
+
+    targets = build_targets(args.distinct, args.seed)
+    try:
+        print(f"{'clients':>7} {'requests':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}  statuses")
+        for level, concurrency in enumerate(int(c) for c in args.concurrency.split(",")):
+            result = asyncio.run(run_level(host, port, targets, concurrency, args.requests, args.seed + level))
+            print(f"{result['concurrency']:>7} {result['requests']:>8} {result['rps']:>8.1f} "
+                  f"{result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['max_ms']:>8.1f}  "
+                  f"{result['statuses']}")
+        counters = asyncio.run(health(host, port))
+        print(f"Server: {counters['solves']} solves, {counters['cache_hits']} cache hits, "
+              f"{counters['coalesced']} coalesced, {counters['timeouts']} timeouts")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark handing the catalog to workers pickled versus in shared memory.
+
+Usage:
+    python benchmarks/shared_table_benchmark.py [--copies 1,10,50,200] [--runs 20]
+
+The repo catalog is replicated under new names to simulate larger
+catalogs. For each size it reports:
+
+    pickle    bytes a worker receives at startup with the table state
+    load      worker-side time to unpickle the state and build the items
+    attach    worker-side time to map the shared table (no items built)
+    build     worker-side time to build the items from the shared table
+    task      per-task cost of shipping Dict[str, Item] with every task,
+              versus checking the shared table's version
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import pickle
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.item import Item
+from src.models.item_table import ItemTable
+from src.services.shared_item_table import SharedItemTable, SharedItemView
+
+REPO_ITEMS = os.path.join(os.path.dirname(__file__), "..", "src", "items.json")
+
+
+def build_table(copies: int) -> ItemTable:
+    """Table with the repo items replicated under new names."""
+    with open(REPO_ITEMS, 'r') as f:
+        data = json.load(f)
+    items = [
+        Item.from_dict(f"{name} #{copy}", item)
+        for copy in range(copies)
+        for name, item in data['items'].items()
+    ]
+    return ItemTable.from_items(items)
+
+
+def median_ms(func, runs: int) -> float:
+    """Median wall time of func in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", default="1,10,50,200")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'items':>7} {'pickle KB':>10} {'load ms':>8} {'attach ms':>10} {'build ms':>9} "
+          f"{'task pickled ms':>16} {'task shared us':>15}")
+    for copies in (int(c) for c in args.copies.split(",")):
+        with contextlib.redirect_stdout(io.StringIO()):
+            table = build_table(copies)
+        state = pickle.dumps(table.to_state())
+        items = table.to_items()
+
+        shared = SharedItemTable()
+        try:
+            shared.publish(table, 1)
+            load_ms = median_ms(lambda: ItemTable.from_state(pickle.loads(state)).to_items(), args.runs)
+
+            def attach():
+                SharedItemView(shared.name).close()
+            attach_ms = median_ms(attach, args.runs)
+
+            view = SharedItemView(shared.name)
+            build_ms = median_ms(view.to_items, args.runs)
+            task_pickled_ms = median_ms(lambda: pickle.loads(pickle.dumps(items)), args.runs)
+            task_shared_us = median_ms(view.refresh, args.runs * 50) * 1000
+            view.close()
+        finally:
+            shared.close()
+
+        print(f"{len(table):>7} {len(state) / 1024:>10.1f} {load_ms:>8.2f} {attach_ms:>10.3f} "
+              f"{build_ms:>9.2f} {task_pickled_ms:>16.2f} {task_shared_us:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
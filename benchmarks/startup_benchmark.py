@@ -0,0 +1,79 @@
+"""Benchmark ItemService startup with and without the snapshot cache.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--copies 50] [--runs 5]
+
+The repo catalog is replicated ``--copies`` times under new names to
+simulate a large multi-hero catalog.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.services.snapshot_cache import SnapshotCache
+
+REPO_ITEMS = os.path.join(os.path.dirname(__file__), "..", "src", "items.json")
+
+
+def build_catalog(path: str, copies: int) -> int:
+    """Write a catalog with the repo items replicated under new names."""
+    with open(REPO_ITEMS, 'r') as f:
+        data = json.load(f)
+    items = {}
+    for copy in range(copies):
+        for name, item in data['items'].items():
+            items[f"{name} #{copy}"] = item
+    data['items'] = items
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+    return len(items)
+
+
+def time_startup(items_path: str, cache_path: str, runs: int, use_cache: bool) -> list:
+    """Time ItemService construction."""
+    timings = []
+    for _ in range(runs):
+        cache = SnapshotCache(cache_path) if use_cache else None
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            ItemService(FileService(items_path), snapshot_cache=cache)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        items_path = os.path.join(tmp, "items.json")
+        cache_path = os.path.join(tmp, "items.snapshot")
+        count = build_catalog(items_path, args.copies)
+
+        cold = time_startup(items_path, cache_path, args.runs, use_cache=False)
+        # Prime the cache once, then measure warm starts
+        time_startup(items_path, cache_path, 1, use_cache=True)
+        warm = time_startup(items_path, cache_path, args.runs, use_cache=True)
+
+    cold_ms = statistics.median(cold) * 1000
+    warm_ms = statistics.median(warm) * 1000
+    print(f"Items: {count}")
+    print(f"Cold start (JSON):  {cold_ms:8.1f} ms median of {args.runs}")
+    print(f"Warm start (cache): {warm_ms:8.1f} ms median of {args.runs}")
+    print(f"Speedup: {cold_ms / warm_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""Headless command line interface for the optimizer.
+
+Loads only the item services and the optimizer, never tkinter, so it
+starts fast and runs without a display:
+
+    python -m src.cli optimize --budget 9000 --profile Tank --top-k 5 --json
+    python -m src.cli sweep --min 3500 --max 20000 --step 500
+    python -m src.cli frontier --max 20000 --query "category:weapon"
+    python -m src.cli batch --input queries.jsonl --processes 8 > results.jsonl
+
+The items file is only read: profile changes made with --profile apply
+to this run and are never saved. Diagnostics go to stderr, so stdout
+only carries the results. See batch_runner.py for the batch query format.
+"""
+import argparse
+import contextlib
+import json
+import sys
+from typing import Dict, List, Optional, Sequence
+from src.models.build_result import BuildResult
+from src.models.item import Item
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.services.query_engine import QueryError
+from src.services.snapshot_cache import SnapshotCache
+from src.utils.constants import BatchConstant, GameConstant
+
+
+class ReadOnlyFileService(FileService):
+    """FileService that loads normally but never writes the items file."""
+
+    def save_data(self, *args, **kwargs) -> bool:
+        """Ignore a full save."""
+        return True
+
+    def save_changes(self, *args, **kwargs) -> bool:
+        """Ignore a delta save."""
+        return True
+
+
+def load_service(items_path: Optional[str] = None, use_cache: bool = True) -> ItemService:
+    """Load the catalog without a GUI.
+
+    Args:
+        items_path: Items JSON file, by default the app's own
+        use_cache: Start from the binary snapshot cache when it is valid
+
+    Returns:
+        ItemService over a read-only file service
+    """
+    file_service = ReadOnlyFileService(items_path, journal=True)
+    snapshot_cache = None
+    if use_cache:
+        snapshot_cache = SnapshotCache(file_service.file_path.with_suffix(".snapshot"))
+    return ItemService(file_service, snapshot_cache=snapshot_cache)
+
+
+def apply_profiles(item_service: ItemService, profiles: Sequence[str]) -> None:
+    """Enable exactly the given custom profiles and reweigh the items.
+
+    Args:
+        item_service: Service to update in memory
+        profiles: Names of the custom weight profiles to enable
+
+    Raises:
+        ValueError: If a profile does not exist
+    """
+    unknown = [name for name in profiles if name not in item_service.weights]
+    if unknown:
+        raise ValueError(f"Unknown weight profile(s): {', '.join(unknown)}")
+    with item_service.batch():
+        for name in item_service.weights:
+            item_service.toggle_weight_profile(name, name in profiles)
+    item_service.calculate_and_apply_output_weights()
+    item_service.recalculate_weights()
+
+
+def select_items(item_service: ItemService, query: Optional[str]) -> Dict[str, Item]:
+    """Items the optimizer may choose from.
+
+    Args:
+        item_service: Loaded service
+        query: Optional item query, see ItemQuery.parse
+
+    Returns:
+        Snapshot of all items, or the matching subset
+    """
+    snapshot = item_service.snapshot()
+    if not query:
+        return snapshot
+    return {name: snapshot[name] for name in item_service.query_items(query) if name in snapshot}
+
+
+def _print_table(results: List[BuildResult], out) -> None:
+    """Human-readable rows, one per result."""
+    for result in results:
+        print(f"{result.budget:>7}  {result.price:>7}  {result.weight:>9.2f}  "
+              f"{', '.join(result.names) or '-'}", file=out)
+
+
+def _budgets(args) -> List[int]:
+    """Budgets of a sweep or frontier command."""
+    if args.step <= 0 or args.max < args.min:
+        raise ValueError("Expected --step > 0 and --max >= --min")
+    return list(range(args.min, args.max + 1, args.step))
+
+
+def run(args) -> List[BuildResult]:
+    """Load the catalog and run one command.
+
+    Args:
+        args: Parsed command line
+
+    Returns:
+        Results of the command
+    """
+    from src.services.optimizer import OptimizerService
+
+    item_service = load_service(args.items, use_cache=not args.no_cache)
+    if args.profile is not None:
+        apply_profiles(item_service, args.profile)
+    items = select_items(item_service, args.query)
+    optimizer = OptimizerService()
+
+    if args.command == "optimize":
+        if args.top_k > 1:
+            results = optimizer.find_top_builds(args.budget, items, args.top_k)
+        else:
+            results = [optimizer.solve(args.budget, items)]
+    else:
+        results = optimizer.sweep(_budgets(args), items, item_service.fingerprint)
+        if args.command == "frontier":
+            results = optimizer.frontier(results)
+    return results
+
+
+def run_batch(args, out) -> int:
+    """Stream batch query results as JSON Lines.
+
+    Args:
+        args: Parsed command line
+        out: Stream the records are written to
+
+    Returns:
+        Process exit code
+    """
+    from src.services.batch_runner import BatchRunner
+
+    item_service = load_service(args.items, use_cache=not args.no_cache)
+    if args.profile is not None:
+        apply_profiles(item_service, args.profile)
+    runner = BatchRunner(item_service, args.processes, args.chunk_size, args.shared_memory)
+
+    def write(record: Dict) -> None:
+        out.write(json.dumps(record))
+        out.write("\n")
+
+    if args.input in (None, "-"):
+        runner.run(sys.stdin, write)
+    else:
+        with open(args.input, "r", encoding="utf-8") as f:
+            runner.run(f, write)
+    out.flush()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line parser with the optimize, sweep, frontier and batch commands."""
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description=__doc__.splitlines()[0])
+    catalog = argparse.ArgumentParser(add_help=False)
+    catalog.add_argument("--items", help="Items JSON file (default: the app's items.json)")
+    catalog.add_argument("--profile", action="append", metavar="NAME",
+                         help="Enable this custom weight profile; repeat for several. "
+                              "When given, all other custom profiles are disabled")
+    catalog.add_argument("--no-cache", action="store_true", help="Ignore the snapshot cache")
+    common = argparse.ArgumentParser(add_help=False, parents=[catalog])
+    common.add_argument("--query", help='Only consider matching items, e.g. "category:weapon price<5000"')
+    common.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    optimize = commands.add_parser("optimize", parents=[common], help="Best build for one budget")
+    optimize.add_argument("--budget", type=int, required=True)
+    optimize.add_argument("--top-k", type=int, default=1, help="Number of best builds to list")
+    for name, help_text in (("sweep", "Best build for each budget in a range"),
+                            ("frontier", "Price/weight Pareto frontier over a budget range")):
+        command = commands.add_parser(name, parents=[common], help=help_text)
+        command.add_argument("--min", type=int, default=GameConstant.MIN_BUDGET)
+        command.add_argument("--max", type=int, required=True)
+        command.add_argument("--step", type=int, default=500)
+    batch = commands.add_parser("batch", parents=[catalog],
+                                help="Solve JSON Lines queries in worker processes")
+    batch.add_argument("--input", help="Queries file (default: stdin)")
+    batch.add_argument("--processes", type=int,
+                       help="Worker processes (default: one per CPU; 0 solves in this process)")
+    batch.add_argument("--chunk-size", type=int, default=BatchConstant.CHUNK_SIZE,
+                       help="Queries sent to a worker at a time")
+    batch.add_argument("--shared-memory", action="store_true",
+                       help="Hand workers the catalog in shared memory instead of a pickled copy")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv: Arguments, by default sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    out = sys.stdout
+    try:
+        # Services print progress; keep stdout for results only
+        with contextlib.redirect_stdout(sys.stderr):
+            if args.command == "batch":
+                return run_batch(args, out)
+            results = run(args)
+    except (QueryError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        json.dump([result.to_record() for result in results], out, indent=2)
+        out.write("\n")
+    else:
+        print(f"{'budget':>7}  {'price':>7}  {'weight':>9}  items", file=out)
+        _print_table(results, out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,15 +9,27 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h> // For automatic conversion of std::vector, std::tuple, etc.
 
+namespace py = pybind11;
+
+// Search nodes between polls of the cancel event, as CANCEL_CHECK_NODES in optimizer.py
+constexpr long long kCancelCheckNodes = 4096;
+
+// Thrown out of the search when the caller's cancel event was set;
+// registered as knapsack_optimizer_cpp.SolveCancelled
+struct SolveCancelledError : std::exception {
+    const char* what() const noexcept override { return "Solve cancelled"; }
+};
+
 // Helper structure to hold item data along with its efficiency for sorting
 struct ItemWithEfficiency {
     std::string name;
     int price;
     double total_weight;
     double efficiency;
+    int index; // Position in the caller's input list
 
-    ItemWithEfficiency(std::string n, int p, double w)
-        : name(std::move(n)), price(p), total_weight(w) {
+    ItemWithEfficiency(std::string n, int p, double w, int idx)
+        : name(std::move(n)), price(p), total_weight(w), index(idx) {
         if (price == 0) {
             if (total_weight > 0) {
                 efficiency = std::numeric_limits<double>::infinity();
@@ -32,49 +44,79 @@ struct ItemWithEfficiency {
     }
 };
 
+// Search result with the instrumentation counters reported back to Python
+struct SolveStats {
+    std::vector<int> best_indices;
+    int best_price = 0;
+    double best_weight = 0.0;
+    long long nodes_expanded = 0;
+    long long nodes_pruned = 0;
+};
+
 // The core C++ implementation
-// Renamed to avoid direct conflict if we were to also expose the Python version's name directly
-// This C++ function will be called internally by the Python interface.
-std::tuple<std::vector<std::string>, int, double>
-optimize_items_cpp_logic(
+// Tracks the original input index of every selected item and counts visited
+// and skipped search nodes, so the Python side can build a BuildResult.
+// The search runs without the GIL; given a cancel event, it takes the GIL
+// every kCancelCheckNodes nodes to poll cancel->is_set().
+SolveStats
+solve_items_cpp_core(
     int budget,
     const std::vector<std::tuple<std::string, int, double>>& input_items_data,
-    int max_items_allowed) {
+    int max_items_allowed,
+    const py::object* cancel = nullptr) {
 
     std::vector<ItemWithEfficiency> items_list;
     items_list.reserve(input_items_data.size());
-    for (const auto& item_tuple : input_items_data) {
-        items_list.emplace_back(std::get<0>(item_tuple), std::get<1>(item_tuple), std::get<2>(item_tuple));
+    for (size_t idx = 0; idx < input_items_data.size(); ++idx) {
+        const auto& item_tuple = input_items_data[idx];
+        // Items priced above the whole budget can never be picked
+        if (std::get<1>(item_tuple) > budget) {
+            continue;
+        }
+        items_list.emplace_back(std::get<0>(item_tuple), std::get<1>(item_tuple), std::get<2>(item_tuple),
+                                static_cast<int>(idx));
     }
 
-    std::sort(items_list.begin(), items_list.end(), [](const ItemWithEfficiency& a, const ItemWithEfficiency& b) {
+    std::stable_sort(items_list.begin(), items_list.end(), [](const ItemWithEfficiency& a, const ItemWithEfficiency& b) {
         return a.efficiency > b.efficiency;
     });
 
-    std::vector<std::string> best_combination;
-    double best_weight = 0.0;
-    int best_price = 0;
-
-    std::vector<std::string> current_items_stack;
+    SolveStats stats;
+    std::vector<int> current_items_stack;
 
     std::function<void(size_t, int, double)> backtrack =
         [&](size_t start_idx, int current_price, double current_weight) {
-        if (current_weight > best_weight && current_price <= budget) {
-            best_combination = current_items_stack;
-            best_weight = current_weight;
-            best_price = current_price;
+        ++stats.nodes_expanded;
+        if (cancel != nullptr && stats.nodes_expanded % kCancelCheckNodes == 0) {
+            bool cancelled;
+            {
+                py::gil_scoped_acquire acquire;
+                cancelled = cancel->attr("is_set")().cast<bool>();
+            }
+            if (cancelled) {
+                throw SolveCancelledError();
+            }
+        }
+        if (current_weight > stats.best_weight && current_price <= budget) {
+            stats.best_indices = current_items_stack;
+            stats.best_weight = current_weight;
+            stats.best_price = current_price;
         }
 
         if (start_idx >= items_list.size() || current_items_stack.size() >= static_cast<size_t>(max_items_allowed)) {
+            if (start_idx < items_list.size()) {
+                ++stats.nodes_pruned;
+            }
             return;
         }
 
         for (size_t i = start_idx; i < items_list.size(); ++i) {
             const auto& item = items_list[i];
             if (current_price + item.price > budget) {
+                ++stats.nodes_pruned;
                 continue;
             }
-            current_items_stack.push_back(item.name);
+            current_items_stack.push_back(item.index);
             backtrack(
                 i + 1,
                 current_price + item.price,
@@ -84,21 +126,63 @@ optimize_items_cpp_logic(
     };
 
     backtrack(0, 0, 0.0);
+    return stats;
+}
+
+// Legacy entry point returning (names, total_price, total_weight)
+std::tuple<std::vector<std::string>, int, double>
+optimize_items_cpp_logic(
+    int budget,
+    const std::vector<std::tuple<std::string, int, double>>& input_items_data,
+    int max_items_allowed) {
 
-    return std::make_tuple(best_combination, best_price, best_weight);
+    SolveStats stats = solve_items_cpp_core(budget, input_items_data, max_items_allowed);
+    std::vector<std::string> best_combination;
+    best_combination.reserve(stats.best_indices.size());
+    for (int idx : stats.best_indices) {
+        best_combination.push_back(std::get<0>(input_items_data[idx]));
+    }
+    return std::make_tuple(best_combination, stats.best_price, stats.best_weight);
 }
 
-// pybind11 module definition
-namespace py = pybind11;
+// Instrumented entry point returning
+// (item_indices, total_price, total_weight, nodes_expanded, nodes_pruned)
+std::tuple<std::vector<int>, int, double, long long, long long>
+optimize_items_cpp_stats(
+    int budget,
+    const std::vector<std::tuple<std::string, int, double>>& input_items_data,
+    int max_items_allowed,
+    const py::object& cancel) {
+
+    SolveStats stats = solve_items_cpp_core(
+        budget, input_items_data, max_items_allowed, cancel.is_none() ? nullptr : &cancel);
+    return std::make_tuple(stats.best_indices, stats.best_price, stats.best_weight,
+                           stats.nodes_expanded, stats.nodes_pruned);
+}
 
+// pybind11 module definition
 PYBIND11_MODULE(knapsack_optimizer_cpp, m) { // Module name seen by Python: import knapsack_optimizer_cpp
     m.doc() = "Pybind11 plugin for the knapsack-like item optimizer"; // Optional module docstring
 
+    py::register_exception<SolveCancelledError>(m, "SolveCancelled");
+
     m.def("solve_knapsack_cpp", // Function name exposed to Python
           &optimize_items_cpp_logic,
           "Solves the knapsack-like problem to find optimal items using C++.",
           py::arg("budget"),
           py::arg("input_items_data"), // std::vector<std::tuple<std::string, int, double>>
-          py::arg("max_items_allowed")
+          py::arg("max_items_allowed"),
+          // The search only touches C++ data, so let other Python threads run
+          py::call_guard<py::gil_scoped_release>()
+    );
+
+    m.def("solve_knapsack_stats_cpp",
+          &optimize_items_cpp_stats,
+          "Solves the knapsack-like problem and returns item indices plus search counters.",
+          py::arg("budget"),
+          py::arg("input_items_data"),
+          py::arg("max_items_allowed"),
+          py::arg("cancel") = py::none(), // threading.Event polled during the search
+          py::call_guard<py::gil_scoped_release>()
     );
 }
\ No newline at end of file
@@ -2,8 +2,14 @@ import sys
 import subprocess
 from src.services.file_service import FileService
 from src.services.item_service import ItemService
+from src.services.save_scheduler import SaveScheduler
+from src.services.snapshot_cache import SnapshotCache
 from src.services.optimizer import OptimizerService
 from src.ui.main_menu import MainMenu
+from src.ui.perf_monitor import PerfMonitor
+
+# Metrics file written on exit when started with --perf
+PERF_METRICS_FILE = "perf_metrics.json"
 
 
 def ensure_requirements():
@@ -20,13 +26,22 @@ def ensure_requirements():
 def main():
     ensure_requirements()
     
-    file_service = FileService()
-    item_service = ItemService(file_service)
+    file_service = FileService(journal=True)
+    save_scheduler = SaveScheduler(file_service)
+    snapshot_cache = SnapshotCache(file_service.file_path.with_suffix(".snapshot"))
+    item_service = ItemService(file_service, save_scheduler, snapshot_cache)
     optimizer_service = OptimizerService()
+    perf_monitor = PerfMonitor() if "--perf" in sys.argv else None
     
     # Create and run main window
-    app = MainMenu(item_service, optimizer_service)
-    app.run()
+    app = MainMenu(item_service, optimizer_service, perf_monitor)
+    try:
+        app.run()
+    finally:
+        item_service.flush()
+        save_scheduler.close()
+        if perf_monitor is not None:
+            perf_monitor.dump(PERF_METRICS_FILE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+"""Result of a single optimizer solve, with per-solve instrumentation."""
+from typing import Dict, List, Optional
+
+
+class BuildResult:
+    """Outcome of one optimizer solve.
+
+    Behaves like the legacy ``(names, total_price, total_weight)`` tuple: it can be
+    unpacked, indexed and compared against a 3-tuple, so existing callers keep
+    working while telemetry reads the extra attributes.
+    """
+
+    __slots__ = (
+        "names",
+        "price",
+        "weight",
+        "item_indices",
+        "stat_totals",
+        "budget",
+        "engine",
+        "wall_time",
+        "nodes_expanded",
+        "nodes_pruned",
+        "cache_hit",
+        "reduction_stats",
+    )
+
+    def __init__(
+        self,
+        names: List[str],
+        price: int,
+        weight: float,
+        item_indices: Optional[List[int]] = None,
+        stat_totals: Optional[Dict[str, float]] = None,
+        budget: int = 0,
+        engine: str = "",
+        wall_time: float = 0.0,
+        nodes_expanded: int = 0,
+        nodes_pruned: int = 0,
+        cache_hit: bool = False,
+        reduction_stats: Optional[Dict[str, int]] = None,
+    ):
+        """Initialize the build result.
+
+        Args:
+            names: Names of the selected items
+            price: Total price of the selected items
+            weight: Total weight of the selected items
+            item_indices: Positions of the selected items in the input mapping
+            stat_totals: Summed stat values of the selected items
+            budget: Budget the solve was run with
+            engine: Solver engine used ("cpp" or "python")
+            wall_time: Wall-clock solve time in seconds
+            nodes_expanded: Number of search nodes visited
+            nodes_pruned: Number of branches skipped by budget or item cap
+            cache_hit: True if the result was served from a cache
+            reduction_stats: Counts describing the input reduction before search
+        """
+        self.names = names
+        self.price = price
+        self.weight = weight
+        self.item_indices = item_indices if item_indices is not None else []
+        self.stat_totals = stat_totals if stat_totals is not None else {}
+        self.budget = budget
+        self.engine = engine
+        self.wall_time = wall_time
+        self.nodes_expanded = nodes_expanded
+        self.nodes_pruned = nodes_pruned
+        self.cache_hit = cache_hit
+        self.reduction_stats = reduction_stats if reduction_stats is not None else {}
+
+    def as_tuple(self) -> tuple:
+        """Return the legacy ``(names, price, weight)`` tuple."""
+        return (self.names, self.price, self.weight)
+
+    def to_dict(self) -> Dict:
+        """Convert the result to a JSON-serializable dictionary."""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def to_record(self) -> Dict:
+        """Summarize the result for command line and batch output."""
+        return {
+            "budget": self.budget,
+            "names": self.names,
+            "price": self.price,
+            "weight": round(self.weight, 6),
+            "stat_totals": self.stat_totals,
+            "engine": self.engine,
+            "wall_time_ms": round(self.wall_time * 1000, 3),
+            "cache_hit": self.cache_hit,
+        }
+
+    def __iter__(self):
+        return iter(self.as_tuple())
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index):
+        return self.as_tuple()[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BuildResult):
+            return self.as_tuple() == other.as_tuple()
+        if isinstance(other, tuple):
+            return self.as_tuple() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"BuildResult(names={self.names!r}, price={self.price}, "
+            f"weight={self.weight}, engine={self.engine!r}, "
+            f"wall_time={self.wall_time:.6f}, nodes_expanded={self.nodes_expanded}, "
+            f"nodes_pruned={self.nodes_pruned}, cache_hit={self.cache_hit})"
+        )
@@ -0,0 +1,211 @@
+"""Immutable, hashable catalog snapshots with structural sharing."""
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from .item import Item
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+_HASH_BITS = 64
+_MAX_SHIFT = _HASH_BITS - _BITS
+_EMPTY_NODE = (None,) * _WIDTH
+
+
+class _Leaf:
+    """One or more entries sharing a full key hash."""
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, key_hash: int, entries: Tuple[Tuple[str, Item], ...]):
+        self.hash = key_hash
+        self.entries = entries
+
+
+def _key_hash(key: str) -> int:
+    return hash(key) & ((1 << _HASH_BITS) - 1)
+
+
+def _assoc(node: tuple, shift: int, key_hash: int, key: str, value: Item) -> Tuple[tuple, bool]:
+    """Return a copy of the path to key with value set, and whether the key is new."""
+    index = (key_hash >> shift) & _MASK
+    slot = node[index]
+    if slot is None:
+        new_slot = _Leaf(key_hash, ((key, value),))
+        added = True
+    elif isinstance(slot, _Leaf):
+        if slot.hash == key_hash:
+            entries = tuple(entry for entry in slot.entries if entry[0] != key)
+            added = len(entries) == len(slot.entries)
+            new_slot = _Leaf(key_hash, entries + ((key, value),))
+        else:
+            # Push the existing leaf one level down and retry
+            child = list(_EMPTY_NODE)
+            child[(slot.hash >> (shift + _BITS)) & _MASK] = slot
+            new_slot, added = _assoc(tuple(child), shift + _BITS, key_hash, key, value)
+    else:
+        new_slot, added = _assoc(slot, shift + _BITS, key_hash, key, value)
+    return node[:index] + (new_slot,) + node[index + 1:], added
+
+
+def _dissoc(node: tuple, shift: int, key_hash: int, key: str) -> Tuple[Optional[tuple], bool]:
+    """Return a copy of the path to key without it (None if the node empties), and whether it existed."""
+    index = (key_hash >> shift) & _MASK
+    slot = node[index]
+    if slot is None:
+        return node, False
+    if isinstance(slot, _Leaf):
+        if slot.hash != key_hash:
+            return node, False
+        entries = tuple(entry for entry in slot.entries if entry[0] != key)
+        if len(entries) == len(slot.entries):
+            return node, False
+        new_slot = _Leaf(key_hash, entries) if entries else None
+    else:
+        new_slot, removed = _dissoc(slot, shift + _BITS, key_hash, key)
+        if not removed:
+            return node, False
+    new_node = node[:index] + (new_slot,) + node[index + 1:]
+    if all(child is None for child in new_node):
+        return None, True
+    return new_node, True
+
+
+def _iter_entries(node: tuple) -> Iterator[Tuple[str, Item]]:
+    for slot in node:
+        if slot is None:
+            continue
+        if isinstance(slot, _Leaf):
+            yield from slot.entries
+        else:
+            yield from _iter_entries(slot)
+
+
+class CatalogSnapshot(Mapping):
+    """Read-only mapping of item name to Item for one catalog version.
+    
+    Snapshots are persistent hash tries: set and remove return a new
+    snapshot that shares every untouched branch with the old one, so a new
+    version costs O(changed items) and old versions stay valid for readers
+    without locks. Stored items must be treated as frozen; writers put
+    copies in. Iteration order is unspecified.
+    """
+
+    __slots__ = ("_root", "_len", "_content_hash", "version")
+
+    def __init__(self):
+        """Initialize an empty snapshot."""
+        self._root = _EMPTY_NODE
+        self._len = 0
+        self._content_hash = 0
+        self.version = 0
+
+    @classmethod
+    def from_items(cls, items: Dict[str, Item], version: int = 0) -> 'CatalogSnapshot':
+        """Build a snapshot from a dictionary of items.
+        
+        Args:
+            items: Items to include; they are stored as given
+            version: Version number of the snapshot
+        """
+        return cls().evolve(items.items(), (), version)
+
+    def evolve(self, puts: Iterable[Tuple[str, Item]], removes: Iterable[str] = (),
+               version: Optional[int] = None) -> 'CatalogSnapshot':
+        """Create a new snapshot with entries set and removed.
+        
+        Args:
+            puts: (name, item) pairs to add or replace
+            removes: Names to remove
+            version: Version of the new snapshot, default this version + 1
+            
+        Returns:
+            New CatalogSnapshot; this one is unchanged
+        """
+        root, length, content_hash = self._root, self._len, self._content_hash
+        for name in removes:
+            old = self.get(name)
+            if old is None:
+                continue
+            root, _ = _dissoc(root, 0, _key_hash(name), name)
+            root = root or _EMPTY_NODE
+            length -= 1
+            content_hash ^= _entry_hash(name, old)
+        for name, item in puts:
+            old = _lookup(root, name)
+            root, added = _assoc(root, 0, _key_hash(name), name, item)
+            if added:
+                length += 1
+            else:
+                content_hash ^= _entry_hash(name, old)
+            content_hash ^= _entry_hash(name, item)
+        snapshot = CatalogSnapshot()
+        snapshot._root = root
+        snapshot._len = length
+        snapshot._content_hash = content_hash
+        snapshot.version = self.version + 1 if version is None else version
+        return snapshot
+
+    def set(self, name: str, item: Item) -> 'CatalogSnapshot':
+        """Create a new snapshot with one item added or replaced."""
+        return self.evolve(((name, item),))
+
+    def remove(self, name: str) -> 'CatalogSnapshot':
+        """Create a new snapshot without one item."""
+        return self.evolve((), (name,))
+
+    def __getitem__(self, name: str) -> Item:
+        item = _lookup(self._root, name)
+        if item is None:
+            raise KeyError(name)
+        return item
+
+    def __contains__(self, name) -> bool:
+        return isinstance(name, str) and _lookup(self._root, name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in _iter_entries(self._root))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def items(self):
+        """Iterate (name, item) pairs directly from the trie."""
+        return _iter_entries(self._root)
+
+    def values(self):
+        """Iterate items directly from the trie."""
+        return (item for _, item in _iter_entries(self._root))
+
+    def __hash__(self) -> int:
+        return hash((self._len, self._content_hash))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CatalogSnapshot):
+            if self._root is other._root:
+                return True
+            if self._len != other._len or self._content_hash != other._content_hash:
+                return False
+        return Mapping.__eq__(self, other)
+
+    def __repr__(self) -> str:
+        return f"CatalogSnapshot(version={self.version}, items={self._len})"
+
+
+def _lookup(node: tuple, name: str) -> Optional[Item]:
+    key_hash = _key_hash(name)
+    shift = 0
+    while True:
+        slot = node[(key_hash >> shift) & _MASK]
+        if slot is None:
+            return None
+        if isinstance(slot, _Leaf):
+            if slot.hash == key_hash:
+                for key, value in slot.entries:
+                    if key == name:
+                        return value
+            return None
+        node = slot
+        shift += _BITS
+
+
+def _entry_hash(name: str, item: Item) -> int:
+    return hash((name, item.fingerprint()))
@@ -1,8 +1,15 @@
-from dataclasses import dataclass, field
-from typing import Dict
+from dataclasses import dataclass, field, replace
+from typing import Dict, Tuple
 from .category import Category
 
 
+# Keys of an item dictionary that are not stats
+NON_STAT_FIELDS = frozenset({
+    'Price', 'Adjustment', 'Effect Value', 'Effects',
+    'Favorite', 'Category', 'Total Weight', 'weight_per_1k'
+})
+
+
 @dataclass
 class Item:
     """Represents an item in the game with its properties and stats."""
@@ -20,13 +27,10 @@ class Item:
     @classmethod
     def from_dict(cls, name: str, data: Dict) -> 'Item':
         """Create an Item instance from a dictionary representation."""
-        stats = {}
-        for key, value in data.items():
-            if key not in [
-                'Price', 'Adjustment', 'Effect Value', 'Effects',
-                'Favorite', 'Category', 'Total Weight', 'weight_per_1k'
-            ]:
-                stats[key] = value
+        stats = {
+            key: value for key, value in data.items()
+            if key not in NON_STAT_FIELDS
+        }
 
         return cls(
             name=name,
@@ -75,4 +79,16 @@ class Item:
         self.total_weight = round(total, 2)
         self.weight_per_1k = (
             round((total * 1000) / self.price, 2) if self.price else 0
-        ) 
\ No newline at end of file
+        )
+
+    def fingerprint(self) -> Tuple:
+        """Return a hashable value that changes whenever any field changes."""
+        return (
+            self.name, self.price, self.adjustment, self.effect_value, self.effects,
+            self.favorite, Category(self.category).value, self.total_weight, self.weight_per_1k,
+            tuple(sorted(self.stats.items()))
+        )
+
+    def frozen_copy(self) -> 'Item':
+        """Return a copy that shares nothing mutable with this item."""
+        return replace(self, stats=dict(self.stats))
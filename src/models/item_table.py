@@ -0,0 +1,151 @@
+"""Columnar representation of an item catalog."""
+import math
+from array import array
+from typing import Dict, Iterable, List
+from .category import Category
+from .item import Item
+
+_CATEGORIES = {category.value: category for category in Category}
+
+
+class ItemTable:
+    """Stores items column by column for compact caching and bulk access.
+    
+    Numeric columns are typed arrays. Stats are kept as one sparse dict per
+    row; stat_matrix builds the dense numeric form when bulk math needs it.
+    """
+
+    _ARRAY_COLUMNS = ('prices', 'adjustments', 'effect_values', 'favorites',
+                      'total_weights', 'weight_per_1k')
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self.names: List[str] = []
+        self.prices = array('q')
+        self.adjustments = array('q')
+        self.effect_values = array('q')
+        self.effects: List[str] = []
+        self.favorites = array('b')
+        self.categories: List[str] = []
+        self.total_weights = array('d')
+        self.weight_per_1k = array('d')
+        self.stats: List[Dict[str, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> 'ItemTable':
+        """Build a table from Item objects.
+        
+        Args:
+            items: Items to store, in order
+            
+        Returns:
+            New ItemTable
+        """
+        table = cls()
+        for item in items:
+            table.append(item)
+        return table
+
+    def append(self, item: Item) -> None:
+        """Append one item.
+        
+        Args:
+            item: Item to append
+        """
+        self.names.append(item.name)
+        self.prices.append(item.price)
+        self.adjustments.append(item.adjustment)
+        self.effect_values.append(item.effect_value)
+        self.effects.append(item.effects)
+        self.favorites.append(1 if item.favorite else 0)
+        self.categories.append(Category(item.category).value)
+        self.total_weights.append(item.total_weight)
+        self.weight_per_1k.append(item.weight_per_1k)
+        self.stats.append(dict(item.stats))
+
+    def extend(self, items: Iterable[Item]) -> None:
+        """Append several items.
+        
+        Args:
+            items: Items to append, in order
+        """
+        for item in items:
+            self.append(item)
+
+    def stat_names(self) -> List[str]:
+        """Get every stat name used by any row, in first-seen order.
+        
+        Returns:
+            List of stat names
+        """
+        names: Dict[str, None] = {}
+        for row in self.stats:
+            names.update(dict.fromkeys(row))
+        return list(names)
+
+    def stat_matrix(self, stat_names: List[str]) -> array:
+        """Build a dense row-major stat matrix.
+        
+        Args:
+            stat_names: Stat columns to include, in order
+            
+        Returns:
+            array('d') of len(self) * len(stat_names) values; NaN marks a
+            stat the item does not have
+        """
+        matrix = array('d')
+        for row in self.stats:
+            matrix.extend(row.get(stat, math.nan) for stat in stat_names)
+        return matrix
+
+    def to_items(self) -> Dict[str, Item]:
+        """Rebuild Item objects from the table.
+        
+        Returns:
+            Dictionary of item name to Item, in table order
+        """
+        columns = zip(
+            self.names, self.prices.tolist(), self.adjustments.tolist(),
+            self.effect_values.tolist(), self.effects, self.favorites.tolist(),
+            self.categories, self.total_weights.tolist(), self.weight_per_1k.tolist(),
+            self.stats
+        )
+        return {
+            name: Item(name, price, adjustment, effect_value, effects, bool(favorite),
+                       _CATEGORIES[category], total_weight, weight_per_1k, dict(stats))
+            for (name, price, adjustment, effect_value, effects, favorite,
+                 category, total_weight, weight_per_1k, stats) in columns
+        }
+
+    def to_state(self) -> Dict:
+        """Convert the table to marshal-friendly primitives.
+        
+        Returns:
+            Dictionary of lists, strings and bytes
+        """
+        state = {column: getattr(self, column).tobytes() for column in self._ARRAY_COLUMNS}
+        state.update(names=self.names, effects=self.effects,
+                     categories=self.categories, stats=self.stats)
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'ItemTable':
+        """Rebuild a table from the output of to_state.
+        
+        Args:
+            state: Dictionary produced by to_state
+            
+        Returns:
+            New ItemTable
+        """
+        table = cls()
+        table.names = list(state['names'])
+        table.effects = list(state['effects'])
+        table.categories = list(state['categories'])
+        table.stats = list(state['stats'])
+        for column in cls._ARRAY_COLUMNS:
+            getattr(table, column).frombytes(state[column])
+        return table
@@ -0,0 +1,447 @@
+"""Local HTTP service for build recommendations.
+
+Serves JSON over plain HTTP/1.1 with asyncio from the standard library:
+
+    python -m src.server [--host 0.0.0.0] [--port 8765] [--processes N]
+
+Endpoints take GET query parameters or a POST JSON object:
+
+    /optimize   budget, profiles, scales, query
+    /top-k      the same plus k
+    /sweep      min, max, step, profiles, scales, query
+    /frontier   like /sweep, keeping only the price/weight Pareto frontier
+    /health     counters
+
+In a query string, profiles is comma separated and scales reads
+"name:0.8,other:0.2"; see batch_runner.py for their meaning. Any request
+may set deadline_ms. Past it the request fails with 504, but the solve
+finishes in the background and still fills the cache. Identical requests
+in flight share one solve. The catalog is loaded read-only at start.
+"""
+import argparse
+import asyncio
+import contextlib
+import functools
+import json
+import signal
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+from src.cli import apply_profiles, load_service
+from src.services.batch_runner import BatchRunner, BatchSolver, call_solver, init_worker
+from src.services.item_service import ItemService
+from src.services.shared_item_table import SharedItemTable
+from src.utils.constants import GameConstant, ServerConstant
+
+# Largest k accepted by /top-k
+MAX_TOP_K = 50
+# Most header lines read per request
+MAX_HEADERS = 100
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 504: "Gateway Timeout"}
+
+
+class HttpError(Exception):
+    """Request failure reported to the client with a status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class OptimizationServer:
+    """Answers optimizer requests over one read-only catalog.
+
+    Solves run in an executor: worker processes each holding the item
+    table, or with processes=0 a single thread in this process. Results
+    are kept in an LRU cache, and a request identical to one in flight
+    waits for the same solve instead of starting another.
+    """
+
+    def __init__(self, item_service: ItemService, processes: Optional[int] = None,
+                 shared_memory: bool = False):
+        """Initialize the server; call start() before serving.
+
+        Args:
+            item_service: Loaded service; its state is captured here
+            processes: Worker processes; None for one per CPU, 0 to solve
+                in a thread of this process
+            shared_memory: Hand workers the catalog in shared memory
+        """
+        # Only used to validate queries and for its captured item table
+        self.queries = BatchRunner(item_service, processes, shared_memory=shared_memory)
+        self.processes = self.queries.processes
+        self.executor: Optional[Executor] = None
+        self._shared: Optional[SharedItemTable] = None
+        self._solver: Optional[BatchSolver] = None
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._results: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self.counters = {"requests": 0, "solves": 0, "cache_hits": 0,
+                         "coalesced": 0, "timeouts": 0, "errors": 0}
+        self.started = time.time()
+        self._routes = {
+            "/optimize": self._optimize,
+            "/top-k": self._top_k,
+            "/sweep": functools.partial(self._sweep, frontier=False),
+            "/frontier": functools.partial(self._sweep, frontier=True),
+            "/health": self._health,
+        }
+
+    def start(self) -> None:
+        """Start the executor."""
+        if self.processes == 0:
+            # BatchSolver's caches are not thread-safe, so one thread
+            self._solver = BatchSolver(self.queries.table_state, self.queries.weights)
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            table = self.queries.table_state
+            if self.queries.shared_memory:
+                self._shared = self.queries.publish()
+                table = self._shared.name
+            self.executor = ProcessPoolExecutor(
+                self.processes, initializer=init_worker,
+                initargs=(table, self.queries.weights))
+
+    def close(self) -> None:
+        """Stop the executor, dropping queued solves."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    async def compute(self, key: Tuple, deadline: float, method: str, *args) -> Any:
+        """Result of a BatchSolver call, from the cache, a solve in flight or a new solve.
+
+        Args:
+            key: Identifies the result; equal keys share results
+            deadline: Seconds to wait
+            method: BatchSolver method to run
+            *args: Its arguments
+
+        Returns:
+            The method's result
+
+        Raises:
+            HttpError: 504 when the deadline passes first
+        """
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            self.counters["cache_hits"] += 1
+            return cached
+
+        future = self._inflight.get(key)
+        if future is None:
+            if self._solver is not None:
+                call = functools.partial(getattr(self._solver, method), *args)
+            else:
+                call = functools.partial(call_solver, method, *args)
+            future = asyncio.get_running_loop().run_in_executor(self.executor, call)
+            self._inflight[key] = future
+            future.add_done_callback(functools.partial(self._finish, key))
+            self.counters["solves"] += 1
+        else:
+            self.counters["coalesced"] += 1
+
+        try:
+            # shield: a waiter giving up must not cancel the shared solve
+            return await asyncio.wait_for(asyncio.shield(future), deadline)
+        except asyncio.TimeoutError:
+            self.counters["timeouts"] += 1
+            raise HttpError(504, f"No result within {deadline * 1000:.0f} ms")
+
+    def _finish(self, key: Tuple, future: asyncio.Future) -> None:
+        """Move a finished solve from in flight to the cache."""
+        self._inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._results[key] = future.result()
+        if len(self._results) > ServerConstant.RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+
+    async def _optimize(self, fields: Dict, deadline: float) -> Dict:
+        """Best build for one budget."""
+        query = self.queries.validate(dict(fields, top_k=1))
+        record = await self.compute(("solve", query), deadline, "solve", query)
+        return {key: value for key, value in record.items() if key != "id"}
+
+    async def _top_k(self, fields: Dict, deadline: float) -> Dict:
+        """The k best distinct builds for one budget."""
+        k = fields.get("k", 5)
+        if isinstance(k, bool) or not isinstance(k, int) or not 1 <= k <= MAX_TOP_K:
+            raise ValueError(f"k must be an integer from 1 to {MAX_TOP_K}")
+        # top_k=1 would take the cached single-solve path
+        query = self.queries.validate(dict(fields, top_k=max(k, 2)))
+        record = await self.compute(("solve", query), deadline, "solve", query)
+        return {"budget": query.budget, "builds": record["builds"][:k]}
+
+    async def _sweep(self, fields: Dict, deadline: float, frontier: bool) -> Dict:
+        """Best builds over a budget range, or their Pareto frontier."""
+        low = fields.get("min", GameConstant.MIN_BUDGET)
+        high = fields.get("max")
+        step = fields.get("step", 500)
+        if not all(isinstance(value, int) and not isinstance(value, bool) for value in (low, high, step)):
+            raise ValueError("min, max and step must be integers")
+        if step <= 0 or high < low or low < 0:
+            raise ValueError("Expected step > 0 and max >= min >= 0")
+        budgets = list(range(low, high + 1, step))
+        if len(budgets) > ServerConstant.MAX_SWEEP_POINTS:
+            raise ValueError(f"At most {ServerConstant.MAX_SWEEP_POINTS} budgets per sweep")
+        query = self.queries.validate(dict(fields, budget=high, top_k=1))
+        # Budget and id do not affect a sweep, so they are not part of the key
+        key = ("sweep", query._replace(budget=0), tuple(budgets), frontier)
+        records = await self.compute(key, deadline, "sweep", query, budgets, frontier)
+        return {"results": records}
+
+    async def _health(self, fields: Dict, deadline: float) -> Dict:
+        """Liveness and counters."""
+        return dict(self.counters, status="ok", processes=self.processes,
+                    in_flight=len(self._inflight), cached=len(self._results),
+                    uptime_s=round(time.time() - self.started, 1))
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Dict]:
+        """Route one request.
+
+        Args:
+            method: HTTP method
+            target: Request target, path and query string
+            body: Request body
+
+        Returns:
+            Status code and JSON body
+        """
+        self.counters["requests"] += 1
+        try:
+            url = urlsplit(target)
+            handler = self._routes.get(url.path.rstrip("/") or "/")
+            if handler is None:
+                raise HttpError(404, f"Unknown endpoint {url.path}")
+            if method not in ("GET", "POST"):
+                raise HttpError(405, "Use GET or POST")
+            fields = parse_query_string(url.query)
+            if body:
+                try:
+                    posted = json.loads(body)
+                except ValueError:
+                    raise HttpError(400, "Body must be a JSON object")
+                if not isinstance(posted, dict):
+                    raise HttpError(400, "Body must be a JSON object")
+                fields.update(posted)
+            # Results are shared between requests, so they carry no id
+            fields.pop("id", None)
+            deadline_ms = fields.pop("deadline_ms", ServerConstant.DEADLINE_MS)
+            if isinstance(deadline_ms, bool) or not isinstance(deadline_ms, (int, float)) or deadline_ms <= 0:
+                raise HttpError(400, "deadline_ms must be a positive number")
+            deadline = min(deadline_ms, ServerConstant.MAX_DEADLINE_MS) / 1000
+            return 200, await handler(fields, deadline)
+        except HttpError as e:
+            self.counters["errors"] += 1
+            return e.status, {"error": str(e)}
+        except ValueError as e:
+            # Invalid fields, including QueryError
+            self.counters["errors"] += 1
+            return 400, {"error": str(e)}
+        except Exception as e:
+            self.counters["errors"] += 1
+            print(f"Error handling {method} {target}: {e}", file=sys.stderr)
+            return 500, {"error": "Internal error"}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until it closes."""
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as e:
+                    write_response(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, body, keep_alive = request
+                status, payload = await self.dispatch(method, target, body)
+                write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def parse_query_string(query: str) -> Dict:
+    """Turn query parameters into the typed fields a POST body would carry.
+
+    Args:
+        query: URL query string
+
+    Returns:
+        Dictionary of fields
+
+    Raises:
+        ValueError: If a number or scale cannot be parsed
+    """
+    fields: Dict[str, Any] = {}
+    for name, values in parse_qs(query, keep_blank_values=True).items():
+        value = values[-1]
+        if name in ("budget", "k", "min", "max", "step"):
+            try:
+                fields[name] = int(value)
+            except ValueError:
+                raise ValueError(f"{name} must be an integer")
+        elif name == "deadline_ms":
+            try:
+                fields[name] = float(value)
+            except ValueError:
+                raise ValueError("deadline_ms must be a number")
+        elif name == "profiles":
+            fields[name] = [profile.strip() for profile in value.split(",") if profile.strip()]
+        elif name == "scales":
+            scales = {}
+            for part in filter(None, value.split(",")):
+                profile, _, scale = part.rpartition(":")
+                try:
+                    scales[profile.strip()] = float(scale)
+                except ValueError:
+                    raise ValueError(f"Invalid scale {part!r}, expected name:0.5")
+            fields[name] = scales
+        else:
+            fields[name] = value
+    return fields
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bytes, bool]]:
+    """Read one HTTP/1.x request.
+
+    Args:
+        reader: Connection stream
+
+    Returns:
+        (method, target, body, keep_alive), or None when the client closed
+        the connection
+
+    Raises:
+        HttpError: If the request is malformed or too large
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+        raise HttpError(400, "Malformed request line")
+    method, target, version = parts
+
+    headers: Dict[str, str] = {}
+    for _ in range(MAX_HEADERS):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HttpError(400, "Too many headers")
+
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(400, "Invalid Content-Length")
+    if length < 0 or length > ServerConstant.MAX_BODY_BYTES:
+        raise HttpError(413, f"Body larger than {ServerConstant.MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+    return method.upper(), target, body, keep_alive
+
+
+def write_response(writer: asyncio.StreamWriter, status: int, payload: Dict, keep_alive: bool) -> None:
+    """Write a JSON response.
+
+    Args:
+        writer: Connection stream
+        status: HTTP status code
+        payload: JSON body
+        keep_alive: Whether the connection stays open
+    """
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+
+
+async def serve(server: OptimizationServer, host: str, port: int) -> None:
+    """Accept connections until cancelled or sent SIGTERM.
+
+    Args:
+        server: Started OptimizationServer
+        host: Interface to listen on
+        port: TCP port; 0 picks a free one
+    """
+    stop = asyncio.Event()
+    # Return normally on SIGTERM, so the caller shuts the workers down
+    with contextlib.suppress(NotImplementedError, AttributeError):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    listener = await asyncio.start_server(server.handle_connection, host, port)
+    address = listener.sockets[0].getsockname()
+    print(f"Serving on http://{address[0]}:{address[1]}", flush=True)
+    async with listener:
+        await stop.wait()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the HTTP service.
+
+    Args:
+        argv: Arguments, by default sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.server", description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Interface to listen on; 0.0.0.0 serves the whole LAN")
+    parser.add_argument("--port", type=int, default=ServerConstant.DEFAULT_PORT)
+    parser.add_argument("--processes", type=int,
+                        help="Solver processes (default: one per CPU; 0 solves in a thread)")
+    parser.add_argument("--shared-memory", action="store_true",
+                        help="Hand solver processes the catalog in shared memory")
+    parser.add_argument("--items", help="Items JSON file (default: the app's items.json)")
+    parser.add_argument("--profile", action="append", metavar="NAME",
+                        help="Default custom weight profile for requests without profiles; repeatable")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the snapshot cache")
+    args = parser.parse_args(argv)
+
+    # Services print progress per load and solve; keep it all on stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            item_service = load_service(args.items, use_cache=not args.no_cache)
+            if args.profile is not None:
+                apply_profiles(item_service, args.profile)
+        except ValueError as e:
+            print(f"error: {e}")
+            return 2
+
+        server = OptimizationServer(item_service, args.processes, args.shared_memory)
+        server.start()
+        try:
+            asyncio.run(serve(server, args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""Coroutine interface to OptimizerService for asyncio callers."""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+from src.models.build_result import BuildResult
+from src.models.item import Item
+from src.services.optimizer import OptimizerService
+
+
+class AsyncOptimizerService:
+    """Runs OptimizerService solves in a managed pool, awaitable from asyncio.
+
+    With the default thread pool, the C++ search releases the GIL, so
+    solves run in parallel; the Python fallback holds it, so it gains
+    from executor="process" instead. A semaphore limits how many solves
+    run or queue at once.
+
+    Cancelling the awaiting task cancels a solve that has not started.
+    A running search in a thread, C++ or Python, stops at its next check
+    of the cancel event; searches in other processes finish in the
+    background and their results are discarded.
+
+    The result cache is the wrapped OptimizerService's; it is only
+    touched from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        optimizer: Optional[OptimizerService] = None,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        executor: str = "thread"
+    ):
+        """Initialize the service; the pool starts on first use.
+
+        Args:
+            optimizer: Service whose cache and solver are used; a new one by default
+            max_workers: Pool size, one per CPU by default
+            max_concurrency: Solves admitted at once, max_workers by default
+            executor: "thread" or "process"
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor {executor!r}, expected 'thread' or 'process'")
+        self.optimizer = optimizer or OptimizerService()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor_kind = executor
+        self._executor: Optional[Executor] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency or self.max_workers)
+        # Cancel events of the thread solves running now
+        self._running: Set[threading.Event] = set()
+
+    def _pool(self) -> Executor:
+        """The pool, started on first use."""
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="optimizer")
+        return self._executor
+
+    async def solve(
+        self,
+        budget: int,
+        items: Dict[str, Item],
+        cache_key: Optional[Hashable] = None
+    ) -> BuildResult:
+        """Find the optimal items without blocking the event loop.
+
+        Args:
+            budget: Maximum total price
+            items: Dictionary (or snapshot) of items to choose from; must
+                not change while the solve runs
+            cache_key: Value identifying the exact items, see
+                OptimizerService.solve; without one, nothing is cached
+
+        Returns:
+            BuildResult; cache_hit is True if it came from the cache
+        """
+        if cache_key is not None:
+            hit = self.optimizer.cached(budget, cache_key)
+            if hit is not None:
+                return hit
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            if self.executor_kind == "process":
+                cancel = None
+                call = functools.partial(OptimizerService.find_optimal_items, budget, items)
+            else:
+                cancel = threading.Event()
+                call = functools.partial(self.optimizer.find_optimal_items, budget, items, cancel)
+                self._running.add(cancel)
+            try:
+                result = await loop.run_in_executor(self._pool(), call)
+            except asyncio.CancelledError:
+                if cancel is not None:
+                    cancel.set()
+                raise
+            finally:
+                self._running.discard(cancel)
+
+        if cache_key is not None:
+            self.optimizer.remember(budget, cache_key, result)
+        return result
+
+    async def solve_many(
+        self,
+        budgets: Iterable[int],
+        items: Dict[str, Item],
+        cache_key: Optional[Hashable] = None
+    ) -> List[BuildResult]:
+        """Solve several budgets concurrently, up to the concurrency limit.
+
+        If one solve fails or the caller is cancelled, the others are
+        cancelled too.
+
+        Args:
+            budgets: Budgets to solve
+            items: Dictionary (or snapshot) of items to choose from
+            cache_key: Passed to solve(), see there
+
+        Returns:
+            One BuildResult per budget, in the order given
+        """
+        tasks = [asyncio.ensure_future(self.solve(budget, items, cache_key)) for budget in budgets]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def sweep(
+        self,
+        budgets: Iterable[int],
+        items: Dict[str, Item],
+        cache_key: Optional[Hashable] = None
+    ) -> List[BuildResult]:
+        """Solve the same items for several budgets, like OptimizerService.sweep.
+
+        Budgets are solved from the largest down, one at a time, so that
+        each build is reused for the smaller budgets it fits in; run
+        several sweeps at once to use more of the pool.
+
+        Args:
+            budgets: Budgets to solve
+            items: Dictionary (or snapshot) of items to choose from
+            cache_key: Passed to solve(), see there
+
+        Returns:
+            One BuildResult per budget, in the order given
+        """
+        budgets = list(budgets)
+        results: Dict[int, BuildResult] = {}
+        best: Optional[BuildResult] = None
+        for budget in sorted(set(budgets), reverse=True):
+            if best is not None and best.price <= budget:
+                results[budget] = OptimizerService.reuse_for_budget(best, budget)
+                continue
+            best = await self.solve(budget, items, cache_key)
+            results[budget] = best
+        return [results[budget] for budget in budgets]
+
+    def close(self) -> None:
+        """Stop running Python searches and shut the pool down."""
+        for cancel in list(self._running):
+            cancel.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> 'AsyncOptimizerService':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
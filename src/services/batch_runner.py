@@ -0,0 +1,421 @@
+"""Run many optimizer queries from JSON Lines in a process pool.
+
+Each input line is one query:
+
+    {"id": "q1", "budget": 9000, "profiles": ["Tank"], "scales": {"Tank": 0.8},
+     "query": "category:weapon", "top_k": 1}
+
+Only budget is required. id defaults to the line number, profiles to the
+service's enabled profiles, scales to the profiles' saved slider positions
+and top_k to 1. query limits the items the query may pick, see
+ItemQuery.parse. Every output record carries the query's id and comes out
+in input order; invalid queries produce an "error" record instead.
+"""
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from src.models.item import Item
+from src.models.item_table import ItemTable
+from src.services.item_service import ItemService, combine_output_weights
+from src.services.optimizer import OptimizerService
+from src.services.shared_item_table import SharedItemTable, SharedItemView
+from src.utils.constants import BatchConstant
+
+# Seconds between progress reports
+PROGRESS_INTERVAL = 5.0
+
+
+class BatchQuery(NamedTuple):
+    """A validated query, ready to send to a worker."""
+    id: Any
+    budget: int
+    profiles: Tuple[str, ...]
+    scales: Tuple[Tuple[str, float], ...]
+    # Table positions of the items the query may pick; None for all items
+    positions: Optional[Tuple[int, ...]]
+    top_k: int
+
+
+class BatchStats:
+    """Counts and timing of a batch run."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.queries = 0
+        self.errors = 0
+        self.start = time.perf_counter()
+        self.seconds = 0.0
+
+    @property
+    def queries_per_second(self) -> float:
+        """Throughput over the whole run so far."""
+        seconds = self.seconds or time.perf_counter() - self.start
+        return self.queries / seconds if seconds else 0.0
+
+    def to_dict(self) -> Dict:
+        """Summary for reports."""
+        return {
+            "queries": self.queries,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 3),
+            "queries_per_second": round(self.queries_per_second, 1),
+        }
+
+
+class BatchSolver:
+    """Solves queries against one item table.
+
+    Each worker process builds one once, from a pickled table state or
+    from a SharedItemTable. Item weights depend on the profiles and scales
+    of a query, so the weighted items of the most recently used
+    combinations are kept, and the optimizer's own cache serves repeated
+    budgets. With a shared table, every task first checks its version and
+    reloads the items when the owner published a new one.
+    """
+
+    def __init__(self, table: Union[Dict, str], weights: Dict[str, Dict[str, float]]):
+        """Initialize the solver.
+
+        Args:
+            table: ItemTable.to_state() of the catalog, or the name of a
+                SharedItemTable holding it
+            weights: Weight profiles by name
+        """
+        self.weights = weights
+        self.optimizer = OptimizerService()
+        self._weighted: "OrderedDict[Tuple, Dict[str, Item]]" = OrderedDict()
+        self.shared: Optional[SharedItemView] = None
+        if isinstance(table, str):
+            self.shared = SharedItemView(table)
+            self._load(self.shared.to_items())
+        else:
+            self._load(ItemTable.from_state(table).to_items())
+
+    def _load(self, items: Dict[str, Item]) -> None:
+        """Use a new version of the items, dropping what was derived from the old one."""
+        self.items = items
+        self.names = list(items)
+        self._weighted.clear()
+        self.optimizer.clear_cache()
+
+    def refresh(self) -> bool:
+        """Reload the items if the shared table has a new version.
+
+        Returns:
+            True if the items changed
+        """
+        if self.shared is None or not self.shared.refresh():
+            return False
+        self._load(self.shared.to_items())
+        return True
+
+    def weighted_items(self, profiles: Tuple[str, ...], scales: Tuple[Tuple[str, float], ...]) -> Dict[str, Item]:
+        """Items weighed by the given profiles.
+
+        Args:
+            profiles: Enabled profiles besides Base Weights
+            scales: Slider positions overriding the saved ones
+
+        Returns:
+            Dictionary of item name to weighed copy
+        """
+        key = (profiles, scales)
+        items = self._weighted.get(key)
+        if items is not None:
+            self._weighted.move_to_end(key)
+            return items
+        output_weights = combine_output_weights(self.weights, profiles, dict(scales))
+        items = {}
+        for name, item in self.items.items():
+            weighed = item.frozen_copy()
+            weighed.calculate_total_weight(output_weights)
+            items[name] = weighed
+        self._weighted[key] = items
+        if len(self._weighted) > BatchConstant.WEIGHTINGS_PER_WORKER:
+            self._weighted.popitem(last=False)
+        return items
+
+    def solve(self, query: BatchQuery) -> Dict:
+        """Solve one query.
+
+        Args:
+            query: Validated query
+
+        Returns:
+            Output record with the query's id
+        """
+        self.refresh()
+        items = self.weighted_items(query.profiles, query.scales)
+        if query.positions is not None:
+            items = {self.names[i]: items[self.names[i]] for i in query.positions}
+        if query.top_k > 1:
+            builds = self.optimizer.find_top_builds(query.budget, items, query.top_k)
+            return {"id": query.id, "builds": [build.to_record() for build in builds]}
+        result = self.optimizer.solve(
+            query.budget, items, (query.profiles, query.scales, query.positions))
+        record = {"id": query.id}
+        record.update(result.to_record())
+        return record
+
+    def sweep(self, query: BatchQuery, budgets: List[int], frontier: bool = False) -> List[Dict]:
+        """Solve a query for several budgets; query.budget is ignored.
+
+        Args:
+            query: Validated query
+            budgets: Budgets to solve
+            frontier: Keep only the price/weight Pareto frontier
+
+        Returns:
+            Output records, one per budget or frontier point
+        """
+        self.refresh()
+        items = self.weighted_items(query.profiles, query.scales)
+        if query.positions is not None:
+            items = {self.names[i]: items[self.names[i]] for i in query.positions}
+        results = self.optimizer.sweep(budgets, items, (query.profiles, query.scales, query.positions))
+        if frontier:
+            results = self.optimizer.frontier(results)
+        return [result.to_record() for result in results]
+
+    def solve_chunk(self, chunk: List[Union[BatchQuery, Dict]]) -> List[Dict]:
+        """Solve a chunk of queries; error records pass through unchanged."""
+        return [self.solve(query) if isinstance(query, BatchQuery) else query for query in chunk]
+
+
+# The solver of a worker process, set by init_worker
+_solver: Optional[BatchSolver] = None
+
+
+def init_worker(table: Union[Dict, str], weights: Dict[str, Dict[str, float]]) -> None:
+    """Build the worker's solver; runs once per process.
+
+    Args:
+        table: Table state or shared table name, see BatchSolver
+        weights: Weight profiles by name
+    """
+    global _solver
+    # The optimizer prints per solve; keep workers quiet
+    sys.stdout = open(os.devnull, "w")
+    _solver = BatchSolver(table, weights)
+
+
+def _solve_chunk(chunk: List[Union[BatchQuery, Dict]]) -> List[Dict]:
+    """Solve a chunk in a worker process."""
+    return _solver.solve_chunk(chunk)
+
+
+def call_solver(method: str, *args) -> Any:
+    """Call a BatchSolver method in a worker process started with init_worker.
+
+    Args:
+        method: Name of the method, e.g. "solve"
+        *args: Its arguments
+
+    Returns:
+        The method's result
+    """
+    return getattr(_solver, method)(*args)
+
+
+class BatchRunner:
+    """Reads queries, fans them out to worker processes and streams results.
+
+    The catalog is captured once, as a compact ItemTable state. Each
+    worker receives a pickled copy when it starts or, with shared_memory,
+    maps one SharedItemTable instead, so its startup does not grow with
+    the catalog. Queries are read lazily and at most two chunks per worker
+    are in flight, so memory stays flat however long the input is.
+    """
+
+    def __init__(
+        self,
+        item_service: ItemService,
+        processes: Optional[int] = None,
+        chunk_size: int = BatchConstant.CHUNK_SIZE,
+        shared_memory: bool = False
+    ):
+        """Initialize the runner.
+
+        Args:
+            item_service: Loaded service; its current items, profiles and
+                enabled profiles are captured here
+            processes: Worker processes; None for one per CPU, 0 to solve in
+                this process
+            chunk_size: Queries sent to a worker at a time
+            shared_memory: Hand workers the catalog in shared memory
+        """
+        self.item_service = item_service
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.chunk_size = max(1, chunk_size)
+        self.shared_memory = shared_memory
+        snapshot = item_service.snapshot()
+        self.version = snapshot.version
+        self.table_state = ItemTable.from_items(snapshot.values()).to_state()
+        # Queries name their profiles explicitly, so every profile is usable
+        self.weights = {
+            name: dict(profile, _enabled=True) for name, profile in item_service.weights.items()
+        }
+        self.default_profiles = tuple(sorted(
+            name for name in item_service.enabled_profiles if name != "Base Weights"))
+        self.positions = {name: i for i, name in enumerate(self.table_state["names"])}
+        self._query_positions: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
+
+    def publish(self) -> SharedItemTable:
+        """Publish the captured catalog in shared memory.
+
+        Returns:
+            SharedItemTable; the caller closes it when the workers are done
+        """
+        shared = SharedItemTable()
+        try:
+            shared.publish(ItemTable.from_state(self.table_state), max(1, self.version))
+        except BaseException:
+            shared.close()
+            raise
+        return shared
+
+    def parse(self, line: str, line_number: int) -> Union[BatchQuery, Dict]:
+        """Validate one input line.
+
+        Args:
+            line: JSON object text
+            line_number: 1-based line number, the default id
+
+        Returns:
+            BatchQuery, or an error record
+        """
+        query_id: Any = line_number
+        try:
+            data = json.loads(line)
+            if not isinstance(data, dict):
+                raise ValueError("Expected a JSON object")
+            query_id = data.get("id", line_number)
+            return self.validate(data, line_number)
+        except ValueError as e:
+            # QueryError and json.JSONDecodeError are ValueErrors
+            return {"id": query_id, "error": str(e)}
+
+    def validate(self, data: Dict, default_id: Any = None) -> BatchQuery:
+        """Check the fields of a query and resolve its item filter.
+
+        Args:
+            data: Query fields, see the module docstring
+            default_id: id when data has none
+
+        Returns:
+            BatchQuery
+
+        Raises:
+            ValueError: If a field is missing or invalid
+        """
+        budget = data.get("budget")
+        if isinstance(budget, bool) or not isinstance(budget, int) or budget < 0:
+            raise ValueError("budget must be a non-negative integer")
+        profiles = data.get("profiles")
+        if profiles is None:
+            profiles = self.default_profiles
+        else:
+            if not isinstance(profiles, list) or not all(isinstance(name, str) for name in profiles):
+                raise ValueError("profiles must be a list of profile names")
+            unknown = [name for name in profiles if name not in self.weights]
+            if unknown:
+                raise ValueError(f"Unknown weight profile(s): {', '.join(unknown)}")
+            profiles = tuple(sorted(set(profiles) - {"Base Weights"}))
+        scales = data.get("scales") or {}
+        if not isinstance(scales, dict):
+            raise ValueError("scales must map profile names to slider positions")
+        for name, scale in scales.items():
+            if name not in self.weights:
+                raise ValueError(f"Unknown weight profile: {name}")
+            if isinstance(scale, bool) or not isinstance(scale, (int, float)) or not 0 <= scale <= 1:
+                raise ValueError(f"Scale of {name} must be between 0 and 1")
+        top_k = data.get("top_k", 1)
+        if isinstance(top_k, bool) or not isinstance(top_k, int) or top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+        query = data.get("query")
+        if query is not None and not isinstance(query, str):
+            raise ValueError("query must be a string")
+        positions = self._resolve(query) if query else None
+        return BatchQuery(
+            data.get("id", default_id), budget, profiles,
+            tuple(sorted((name, float(scale)) for name, scale in scales.items())),
+            positions, top_k)
+
+    def _resolve(self, query: str) -> Tuple[int, ...]:
+        """Table positions of the items matching a query, memoized."""
+        positions = self._query_positions.get(query)
+        if positions is None:
+            names = self.item_service.query_items(query)
+            positions = tuple(sorted(self.positions[name] for name in names if name in self.positions))
+            self._query_positions[query] = positions
+            if len(self._query_positions) > BatchConstant.QUERY_CACHE_SIZE:
+                self._query_positions.popitem(last=False)
+        else:
+            self._query_positions.move_to_end(query)
+        return positions
+
+    def _chunks(self, lines: Iterable[str]) -> Iterator[List[Union[BatchQuery, Dict]]]:
+        """Parse lines lazily into chunks, skipping blank lines."""
+        chunk = []
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            chunk.append(self.parse(line, line_number))
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def run(self, lines: Iterable[str], write: Callable[[Dict], None]) -> BatchStats:
+        """Solve every query and write the records in input order.
+
+        Args:
+            lines: JSON Lines queries, e.g. an open file or sys.stdin
+            write: Receives each output record
+
+        Returns:
+            BatchStats of the run
+        """
+        stats = BatchStats()
+        next_report = stats.start + PROGRESS_INTERVAL
+
+        def emit(records: List[Dict]) -> None:
+            nonlocal next_report
+            for record in records:
+                write(record)
+            stats.queries += len(records)
+            stats.errors += sum(1 for record in records if "error" in record)
+            if time.perf_counter() >= next_report:
+                print(f"{stats.queries} queries, {stats.queries_per_second:.1f} queries/s")
+                next_report = time.perf_counter() + PROGRESS_INTERVAL
+
+        if self.processes == 0:
+            solver = BatchSolver(self.table_state, self.weights)
+            for chunk in self._chunks(lines):
+                emit(solver.solve_chunk(chunk))
+        else:
+            shared = self.publish() if self.shared_memory else None
+            table = shared.name if shared is not None else self.table_state
+            try:
+                with multiprocessing.Pool(self.processes, initializer=init_worker,
+                                          initargs=(table, self.weights)) as pool:
+                    pending: Deque = deque()
+                    for chunk in self._chunks(lines):
+                        pending.append(pool.apply_async(_solve_chunk, (chunk,)))
+                        if len(pending) >= 2 * self.processes:
+                            emit(pending.popleft().get())
+                    while pending:
+                        emit(pending.popleft().get())
+            finally:
+                if shared is not None:
+                    shared.close()
+
+        stats.seconds = time.perf_counter() - stats.start
+        print(f"Solved {stats.queries} queries ({stats.errors} errors) in {stats.seconds:.2f}s: "
+              f"{stats.queries_per_second:.1f} queries/s")
+        return stats
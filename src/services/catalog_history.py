@@ -0,0 +1,227 @@
+"""Versioned catalog history stored as a base snapshot plus patches."""
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from src.models.build_result import BuildResult
+from src.models.item import Item
+from src.services.optimizer import OptimizerService
+from src.services.patch_service import CatalogPatch, apply_fields, build_may_change, diff_catalogs
+
+# Every Nth version is kept in memory once materialized
+CHECKPOINT_INTERVAL = 8
+
+
+@dataclass
+class ReplayRow:
+    """One cell of a cross-version replay.
+    
+    Attributes:
+        version: Catalog version the result belongs to
+        label: Label of that version
+        weights_name: Name of the output weight set used
+        budget: Budget solved for
+        result: Optimal build for this cell
+        reused: True if the previous version's result was provably still optimal
+    """
+    version: int
+    label: str
+    weights_name: str
+    budget: int
+    result: BuildResult
+    reused: bool
+
+
+class CatalogHistory:
+    """Stores catalog versions as one base snapshot followed by patches.
+    
+    The history file is JSON Lines: the first line holds the base items,
+    each further line one CatalogPatch. Version 0 is the base.
+    """
+
+    def __init__(self, path: str):
+        """Open a history file, creating an empty history if it does not exist.
+        
+        Args:
+            path: Path of the history file
+        """
+        self.path = path
+        self._base: Dict[str, Dict] = {}
+        self._base_label = ""
+        self._patches: List[CatalogPatch] = []
+        self._checkpoints: Dict[int, Dict[str, Dict]] = {}
+        self._head: Optional[Dict[str, Dict]] = None
+        if os.path.exists(path):
+            self._read()
+
+    def __len__(self) -> int:
+        """Number of stored versions."""
+        return len(self._patches) + 1 if self._head is not None else 0
+
+    @property
+    def labels(self) -> List[str]:
+        """Labels of all versions, oldest first."""
+        if self._head is None:
+            return []
+        return [self._base_label] + [patch.label for patch in self._patches]
+
+    def commit(self, items: Dict[str, Dict], label: str = "") -> int:
+        """Record a new catalog version.
+        
+        Args:
+            items: Item dictionaries of the new version, keyed by name
+            label: Label of the version, e.g. the game patch
+            
+        Returns:
+            int: The new version number
+        """
+        if self._head is None:
+            self._base = _copy(items)
+            self._base_label = label
+            self._head = _copy(items)
+            self._checkpoints[0] = self._base
+            self._append({'type': 'base', 'label': label, 'items': self._base})
+            return 0
+        patch = diff_catalogs(self._head, items, label)
+        patch.apply_to(self._head)
+        self._patches.append(patch)
+        self._append({'type': 'patch', **patch.to_dict()})
+        return len(self._patches)
+
+    def patch(self, version: int) -> CatalogPatch:
+        """Get the patch that produced a version from its predecessor.
+        
+        Args:
+            version: Version number, at least 1
+        """
+        return self._patches[version - 1]
+
+    def get(self, version: int) -> Dict[str, Dict]:
+        """Read the catalog as it was at a version.
+        
+        Args:
+            version: Version number; negative numbers count from the newest
+            
+        Returns:
+            Item dictionaries keyed by name (a private copy)
+        """
+        version = self._resolve(version)
+        start = max(v for v in self._checkpoints if v <= version)
+        items = _copy(self._checkpoints[start])
+        for v in range(start + 1, version + 1):
+            self._patches[v - 1].apply_to(items)
+            if v % CHECKPOINT_INTERVAL == 0 and v not in self._checkpoints:
+                self._checkpoints[v] = _copy(items)
+        return items
+
+    def replay(
+        self,
+        budgets: Iterable[int],
+        weight_sets: Dict[str, Dict[str, float]],
+        versions: Optional[Iterable[int]] = None,
+        optimizer_service: Optional[OptimizerService] = None
+    ) -> Iterator[ReplayRow]:
+        """Solve a budget x weight-set grid against a range of versions.
+        
+        Versions are walked in order. Between consecutive versions only the
+        items touched by the patch are rebuilt and reweighed, and a cell's
+        previous result is reused whenever the patch provably cannot change it.
+        
+        Args:
+            budgets: Budgets to solve for
+            weight_sets: Output weight dictionaries by name
+            versions: Consecutive versions to replay, default all
+            optimizer_service: Solver to use
+            
+        Yields:
+            One ReplayRow per (version, weight set, budget)
+        """
+        optimizer = optimizer_service or OptimizerService()
+        budgets = list(budgets)
+        versions = list(range(len(self))) if versions is None else [self._resolve(v) for v in versions]
+        if not versions:
+            return
+        
+        labels = self.labels
+        catalog = self.get(versions[0])
+        weighed = {name: _weigh_all(catalog, weights) for name, weights in weight_sets.items()}
+        previous: Dict[Tuple[str, int], BuildResult] = {}
+        prev_version = versions[0]
+        
+        for version in versions:
+            if version < prev_version:
+                raise ValueError("Versions must be replayed in ascending order")
+            patches = [self._patches[v - 1] for v in range(prev_version + 1, version + 1)]
+            for name, weights in weight_sets.items():
+                items = weighed[name]
+                for patch in patches:
+                    before = {n: (items[n].price, items[n].total_weight) for n in patch.changed}
+                    for removed in patch.removed:
+                        del items[removed]
+                    for changed, fields in patch.changed.items():
+                        items[changed] = _weigh(changed, apply_fields(items[changed].to_dict(), fields), weights)
+                    for added, data in patch.added.items():
+                        items[added] = _weigh(added, data, weights)
+                    after = {n: (items[n].price, items[n].total_weight) for n in patch.changed}
+                    for key, result in list(previous.items()):
+                        if key[0] == name and result is not None and build_may_change(result, patch, before, after):
+                            previous[key] = None
+                
+                for budget in budgets:
+                    key = (name, budget)
+                    result = previous.get(key)
+                    reused = result is not None
+                    if not reused:
+                        result = optimizer.find_optimal_items(budget, items)
+                        previous[key] = result
+                    yield ReplayRow(version, labels[version], name, budget, result, reused)
+            prev_version = version
+
+    def _resolve(self, version: int) -> int:
+        """Turn a possibly negative version number into an index."""
+        count = len(self)
+        if version < 0:
+            version += count
+        if not 0 <= version < count:
+            raise IndexError(f"No catalog version {version}")
+        return version
+
+    def _append(self, record: Dict) -> None:
+        """Append a record to the history file."""
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + "\n")
+
+    def _read(self) -> None:
+        """Load the history file and rebuild the head version."""
+        with open(self.path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get('type') == 'base':
+                    self._base = record['items']
+                    self._base_label = record.get('label', '')
+                    self._head = _copy(self._base)
+                    self._checkpoints = {0: self._base}
+                    self._patches = []
+                else:
+                    patch = CatalogPatch.from_dict(record)
+                    patch.apply_to(self._head)
+                    self._patches.append(patch)
+
+
+def _copy(items: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Copy a catalog one level deep; item dictionaries hold only scalars."""
+    return {name: dict(data) for name, data in items.items()}
+
+
+def _weigh(name: str, data: Dict, weights: Dict[str, float]) -> Item:
+    """Create an Item and calculate its weight."""
+    item = Item.from_dict(name, data)
+    item.calculate_total_weight(weights)
+    return item
+
+
+def _weigh_all(items: Dict[str, Dict], weights: Dict[str, float]) -> Dict[str, Item]:
+    """Create and weigh Items for a whole catalog."""
+    return {name: _weigh(name, data, weights) for name, data in items.items()}
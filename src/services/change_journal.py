@@ -0,0 +1,215 @@
+"""Append-only journal of catalog and weight profile changes."""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+from src.utils.constants import StorageConstant
+
+
+class ChangeJournal:
+    """JSON Lines log of small deltas applied on top of the last snapshot.
+    
+    Each line is one record with an increasing ``seq`` and any of the keys
+    ``items`` (name -> item dict to add or replace), ``deleted`` (item names),
+    ``weights`` (all weight profiles), ``profiles`` (name -> weight profile
+    to replace, or None to remove) and ``output_weights``. Weight profiles
+    and output weights are only recorded when they changed since the
+    previous record.
+    
+    rotate() seals the current file as ``<path>.<last seq>`` and starts a
+    new one, so a snapshot can drop the records it contains by deleting
+    whole files instead of rewriting the journal. Sealed files no longer
+    count toward compaction, since the snapshot being written drops them.
+    """
+
+    def __init__(self, path: str, compact_threshold: int = StorageConstant.JOURNAL_COMPACT_BYTES):
+        """Initialize the journal.
+        
+        Args:
+            path: Path of the journal file
+            compact_threshold: Size in bytes after which compaction is due
+        """
+        self.path = Path(path)
+        self.compact_threshold = compact_threshold
+        self._lock = threading.Lock()
+        # Weights and output weights as of the last record; None until the
+        # first record in this session, which writes them in full
+        self._weights: Optional[Dict[str, Dict]] = None
+        self._output_weights: Optional[Dict] = None
+        # Records up to here are in a snapshot being written
+        self._rotated_seq = 0
+        self._repair_tail()
+        self.seq = max((record["seq"] for record in self.records()), default=0)
+
+    def _repair_tail(self) -> None:
+        """Cut off a torn last line so new records start on a fresh line."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def sealed_paths(self) -> List[Path]:
+        """Files sealed by rotate(), oldest first."""
+        prefix = self.path.name + "."
+        sealed = []
+        for path in self.path.parent.glob(prefix + "*"):
+            suffix = path.name[len(prefix):]
+            if suffix.isdigit():
+                sealed.append((int(suffix), path))
+        return [path for _, path in sorted(sealed)]
+
+    def paths(self) -> List[Path]:
+        """All journal files, in replay order."""
+        return self.sealed_paths() + [self.path]
+
+    @property
+    def size(self) -> int:
+        """Current size of all journal files in bytes."""
+        total = 0
+        for path in self.paths():
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+        return total
+
+    @property
+    def needs_compaction(self) -> bool:
+        """True if the records not yet in a snapshot have grown past the threshold."""
+        total = 0
+        for path in self.paths():
+            if path != self.path and int(path.name.rsplit(".", 1)[1]) <= self._rotated_seq:
+                continue
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+        return total >= self.compact_threshold
+
+    def append(
+        self,
+        items: Optional[Dict[str, Dict]] = None,
+        deleted: Optional[Iterable[str]] = None,
+        weights: Optional[Dict] = None,
+        output_weights: Optional[Dict] = None
+    ) -> int:
+        """Append one change record.
+        
+        Args:
+            items: Items added or replaced, keyed by name
+            deleted: Names of deleted items
+            weights: Full weight profiles dictionary; only the profiles
+                that changed since the previous record are written
+            output_weights: Calculated output weights; written if changed
+            
+        Returns:
+            int: Sequence number of the new record
+        """
+        with self._lock:
+            self.seq += 1
+            record = {"seq": self.seq}
+            if items:
+                record["items"] = items
+            if deleted:
+                record["deleted"] = list(deleted)
+            if weights is not None:
+                current = {name: dict(profile) for name, profile in weights.items()}
+                if self._weights is None:
+                    record["weights"] = current
+                else:
+                    profiles = {name: profile for name, profile in current.items()
+                                if self._weights.get(name) != profile}
+                    profiles.update((name, None) for name in self._weights if name not in current)
+                    if profiles:
+                        record["profiles"] = profiles
+                self._weights = current
+            if output_weights is not None and output_weights != self._output_weights:
+                record["output_weights"] = output_weights
+                self._output_weights = dict(output_weights)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(record, separators=(',', ':')) + "\n")
+            return self.seq
+
+    def records(self, after_seq: int = 0) -> Iterator[Dict]:
+        """Iterate over records newer than a sequence number.
+        
+        A torn last line from an interrupted append is skipped.
+        
+        Args:
+            after_seq: Only records with a greater seq are returned
+            
+        Yields:
+            Change records in append order
+        """
+        for path in self.paths():
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record.get("seq", 0) > after_seq:
+                        yield record
+
+    def rotate(self) -> int:
+        """Seal the current file and start a new one.
+        
+        Call before writing a snapshot that contains every record so far.
+        While it is written, needs_compaction ignores the sealed file, and
+        truncate_through drops it once the snapshot is on disk.
+        
+        Returns:
+            int: Sequence number of the last sealed record
+        """
+        with self._lock:
+            if os.path.exists(self.path) and os.path.getsize(self.path):
+                os.replace(self.path, f"{self.path}.{self.seq}")
+            self._rotated_seq = self.seq
+            return self.seq
+
+    def truncate_through(self, seq: int) -> None:
+        """Drop records already contained in a snapshot.
+        
+        Sealed files up to seq are deleted. The current file is emptied if
+        all its records are contained; otherwise it is left alone, since
+        replay skips the contained records and a later snapshot drops it.
+        
+        Args:
+            seq: Highest sequence number included in the snapshot
+        """
+        with self._lock:
+            for path in self.sealed_paths():
+                if int(path.name.rsplit(".", 1)[1]) <= seq:
+                    os.remove(path)
+            if self.seq <= seq and os.path.exists(self.path):
+                open(self.path, 'w').close()
+
+    @staticmethod
+    def apply(record: Dict, items: Dict, weights: Dict, output_weights: Dict) -> None:
+        """Apply one record to loaded data in place.
+        
+        Args:
+            record: Change record to apply
+            items: Items dictionary to update
+            weights: Weight profiles dictionary to update
+            output_weights: Output weights dictionary to update
+        """
+        for name in record.get("deleted", ()):
+            items.pop(name, None)
+        items.update(record.get("items", {}))
+        if "weights" in record:
+            weights.clear()
+            weights.update(record["weights"])
+        for name, profile in record.get("profiles", {}).items():
+            if profile is None:
+                weights.pop(name, None)
+            else:
+                weights[name] = profile
+        if "output_weights" in record:
+            output_weights.clear()
+            output_weights.update(record["output_weights"])
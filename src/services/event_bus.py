@@ -0,0 +1,127 @@
+"""Typed change notifications published by ItemService."""
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Type
+
+EMPTY: FrozenSet[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class CatalogEvent:
+    """Base class of all events; names are the affected item names."""
+    names: FrozenSet[str] = EMPTY
+
+
+@dataclass(frozen=True)
+class ItemChanged(CatalogEvent):
+    """Existing items were replaced under the same name."""
+
+
+@dataclass(frozen=True)
+class ItemAdded(CatalogEvent):
+    """New items were added (a rename adds the new name)."""
+
+
+@dataclass(frozen=True)
+class ItemRemoved(CatalogEvent):
+    """Items were deleted (a rename removes the old name)."""
+
+
+@dataclass(frozen=True)
+class WeightsRecomputed(CatalogEvent):
+    """Output weights or item weights were recalculated.
+    
+    names holds the items whose total weight changed; keys holds the output
+    weight fields whose value changed, appeared or disappeared.
+    """
+    keys: FrozenSet[str] = EMPTY
+
+
+@dataclass(frozen=True)
+class ProfileToggled(CatalogEvent):
+    """A weight profile was enabled or disabled."""
+    profile: str = ""
+    enabled: bool = False
+
+
+@dataclass(frozen=True)
+class ProfilesChanged(CatalogEvent):
+    """Weight profiles were added, edited or deleted."""
+    profiles: FrozenSet[str] = EMPTY
+
+
+Handler = Callable[[CatalogEvent], None]
+
+
+class EventBus:
+    """Synchronous publish/subscribe dispatcher.
+    
+    Handlers subscribed to a base class also receive its subclasses, so
+    subscribing to CatalogEvent receives everything.
+    """
+
+    def __init__(self):
+        """Initialize a bus without subscribers."""
+        self._handlers: Dict[Type[CatalogEvent], List[Handler]] = {}
+
+    def subscribe(self, event_type: Type[CatalogEvent], handler: Handler) -> Callable[[], None]:
+        """Register a handler for an event type.
+        
+        Args:
+            event_type: Event class to listen for
+            handler: Called with each matching event
+            
+        Returns:
+            Callable that removes the subscription
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+        
+        def unsubscribe():
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+        return unsubscribe
+
+    def publish(self, event: CatalogEvent) -> None:
+        """Deliver an event to every matching handler.
+        
+        A failing handler is reported and skipped so it cannot break the
+        mutation that published the event.
+        
+        Args:
+            event: Event to deliver
+        """
+        for event_type in type(event).__mro__:
+            for handler in list(self._handlers.get(event_type, ())):
+                try:
+                    handler(event)
+                except Exception as e:
+                    print(f"Error in event handler for {type(event).__name__}: {e}")
+
+
+def coalesce(events: List[CatalogEvent]) -> List[CatalogEvent]:
+    """Merge buffered weight and profile events into one event per kind.
+    
+    Args:
+        events: Events in publish order
+        
+    Returns:
+        At most one WeightsRecomputed, one ProfilesChanged and the last
+        ProfileToggled per profile, in first-seen order
+    """
+    merged: Dict[object, CatalogEvent] = {}
+    for event in events:
+        if isinstance(event, WeightsRecomputed):
+            previous = merged.get(WeightsRecomputed)
+            if previous is not None:
+                event = WeightsRecomputed(previous.names | event.names, previous.keys | event.keys)
+            merged[WeightsRecomputed] = event
+        elif isinstance(event, ProfilesChanged):
+            previous = merged.get(ProfilesChanged)
+            if previous is not None:
+                event = ProfilesChanged(profiles=previous.profiles | event.profiles)
+            merged[ProfilesChanged] = event
+        elif isinstance(event, ProfileToggled):
+            merged[(ProfileToggled, event.profile)] = event
+        else:
+            merged[id(event)] = event
+    return list(merged.values())
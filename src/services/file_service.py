@@ -1,19 +1,67 @@
 """Service for handling file operations."""
+import hashlib
 import json
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 from pathlib import Path
 import os
+import tempfile
+from src.services.change_journal import ChangeJournal
 
 class FileService:
     """Handles loading and saving data from/to JSON files."""
     
-    def __init__(self, file_path: str = None):
-        """Initialize the file service with the path to the items file."""
+    def __init__(self, file_path: str = None, journal: bool = False):
+        """Initialize the file service with the path to the items file.
+        
+        Args:
+            file_path: Path of the items JSON file
+            journal: Record changes in an append-only journal next to the
+                items file instead of rewriting the whole file on every save
+        """
         if file_path is None:
             # Always use the items.json in the repo root
             repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             file_path = os.path.join(repo_root, "items.json")
         self.file_path = Path(file_path)
+        self.journal: Optional[ChangeJournal] = None
+        if journal:
+            self.journal = ChangeJournal(self.file_path.with_suffix(".journal.jsonl"))
+
+    @property
+    def supports_incremental(self) -> bool:
+        """True if save_changes can record deltas instead of a full save."""
+        return self.journal is not None
+
+    @property
+    def needs_compaction(self) -> bool:
+        """True if pending deltas should be folded into a full snapshot."""
+        return self.journal is not None and self.journal.needs_compaction
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """True if deltas exist that are not part of the snapshot yet."""
+        return self.journal is not None and self.journal.size > 0
+
+    def source_signature(self) -> Optional[Tuple[Tuple[int, int, str], ...]]:
+        """Identify the current on-disk content for cache validation.
+        
+        Returns:
+            (mtime_ns, size, sha1) for the items file and, if present, the
+            journal; None if the items file does not exist
+        """
+        paths = [self.file_path]
+        if self.has_pending_changes:
+            paths.extend(path for path in self.journal.paths() if path.exists())
+        signature = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                with open(path, 'rb') as f:
+                    digest = hashlib.sha1(f.read()).hexdigest()
+            except OSError:
+                return None
+            signature.append((stat.st_mtime_ns, stat.st_size, digest))
+        return tuple(signature)
 
     def load_data(self) -> Tuple[Dict, Dict, Dict]:
         """Load items and weights from the JSON file.
@@ -21,18 +69,27 @@ class FileService:
         Returns:
             Tuple containing (items_dict, weights_dict, output_weights)
         """
-        if not os.path.exists(self.file_path):
+        if not os.path.exists(self.file_path) and not self.has_pending_changes:
             base_weights = self._create_default_weights()
             return {}, {"Base Weights": base_weights}, base_weights.copy()
             
         try:
-            with open(self.file_path, 'r') as f:
-                data = json.load(f)
+            data = {}
+            if os.path.exists(self.file_path):
+                with open(self.file_path, 'r') as f:
+                    data = json.load(f)
             
             items = data.get('items', {})
             weights = data.get('weights', {})
             output_weights = data.get('output_weights', {})
             
+            # Replay deltas recorded after the snapshot was written
+            if self.journal is not None:
+                snapshot_seq = data.get('journal_seq', 0)
+                for record in self.journal.records(snapshot_seq):
+                    ChangeJournal.apply(record, items, weights, output_weights)
+                self.journal.seq = max(self.journal.seq, snapshot_seq)
+            
             # Handle legacy format conversion
             if not weights:
                 # If weights is empty, create default
@@ -52,13 +109,19 @@ class FileService:
             base_weights = self._create_default_weights()
             return {}, {"Base Weights": base_weights}, base_weights.copy()
 
-    def save_data(self, items: Dict, weights: Dict, output_weights: Dict) -> bool:
+    def save_data(self, items: Dict, weights: Dict, output_weights: Dict,
+                  journal_seq: Optional[int] = None) -> bool:
         """Save items and weights to the JSON file.
         
+        With a journal, the snapshot also compacts it: records up to
+        journal_seq are dropped once the snapshot is on disk.
+        
         Args:
             items: Dictionary of items
             weights: Dictionary of weight profiles
             output_weights: Dictionary of calculated output weights
+            journal_seq: Last journal record contained in this data; defaults
+                to the journal's current sequence number
             
         Returns:
             bool: True if save was successful, False otherwise
@@ -69,13 +132,62 @@ class FileService:
                 'weights': weights,
                 'output_weights': output_weights
             }
-            with open(self.file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            if self.journal is not None:
+                if journal_seq is None:
+                    journal_seq = self.journal.seq
+                data['journal_seq'] = journal_seq
+            self._write_atomic(data)
+            if self.journal is not None:
+                self.journal.truncate_through(journal_seq)
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
             return False
 
+    def save_changes(self, items: Dict, deleted: Iterable[str],
+                     weights: Dict, output_weights: Dict) -> bool:
+        """Record a delta instead of rewriting the whole file.
+        
+        Args:
+            items: Items added or changed, keyed by name
+            deleted: Names of deleted items
+            weights: Dictionary of weight profiles
+            output_weights: Dictionary of calculated output weights
+            
+        Returns:
+            bool: True if the change was recorded, False otherwise
+        """
+        if self.journal is None:
+            return False
+        try:
+            self.journal.append(items, deleted, weights, output_weights)
+            return True
+        except Exception as e:
+            print(f"Error recording changes: {e}")
+            return False
+
+    def _write_atomic(self, data: Dict) -> None:
+        """Write data through a temp file and swap it into place.
+        
+        Readers never see a half-written file: the temp file lives in the same
+        directory and replaces the target with a single os.replace.
+        
+        Args:
+            data: JSON-serializable data to write
+        """
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".items-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
     def _create_default_weights(self) -> Dict[str, float]:
         """Create default weights dictionary."""
         weights = {
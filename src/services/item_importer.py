@@ -0,0 +1,190 @@
+"""Streaming importer for external item catalogs."""
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from src.models.category import Category
+from src.models.item import Item
+from src.utils.validators import validate_item_record
+
+# Receives each validated batch of items
+ItemSink = Callable[[List[Item]], None]
+
+_INT_FIELDS = ('Price', 'Adjustment', 'Effect Value')
+_TRUE_STRINGS = ('1', 'true', 'yes', 'y')
+
+
+@dataclass
+class ImportProgress:
+    """Progress of a running import."""
+    records_read: int = 0
+    imported: int = 0
+    rejected: int = 0
+    bytes_read: int = 0
+    total_bytes: int = 0
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the input consumed so far."""
+        return self.bytes_read / self.total_bytes if self.total_bytes else 1.0
+
+
+@dataclass
+class ImportReport:
+    """Summary of a finished import."""
+    records_read: int = 0
+    imported: int = 0
+    rejected: int = 0
+    errors: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+class CatalogImporter:
+    """Reads JSON Lines or CSV item records and hands them on in validated batches.
+    
+    Only one batch is held in memory at a time, so peak memory does not
+    depend on the size of the input file. Records use the items.json field
+    names plus a ``name`` (or ``Name``) field; other keys are stats.
+    """
+
+    def __init__(self, batch_size: int = 500,
+                 on_progress: Optional[Callable[[ImportProgress], None]] = None,
+                 max_errors: int = 100):
+        """Initialize the importer.
+        
+        Args:
+            batch_size: Number of records validated and delivered together
+            on_progress: Callback invoked after every batch
+            max_errors: Maximum number of error messages kept in the report
+        """
+        self.batch_size = batch_size
+        self.on_progress = on_progress
+        self.max_errors = max_errors
+
+    def run(self, path: str, sink: ItemSink) -> ImportReport:
+        """Import a catalog file.
+        
+        Args:
+            path: Path of a .jsonl or .csv file
+            sink: Callback receiving each batch of valid items, e.g.
+                ItemTable.extend or ItemService.add_items
+            
+        Returns:
+            ImportReport with counts and the first errors
+        """
+        start = time.perf_counter()
+        report = ImportReport()
+        progress = ImportProgress(total_bytes=os.path.getsize(path))
+        batch: List[Tuple[int, Dict]] = []
+        
+        for line_no, record, bytes_read in self._iter_records(path):
+            progress.bytes_read = bytes_read
+            batch.append((line_no, record))
+            if len(batch) >= self.batch_size:
+                self._flush(batch, sink, report, progress)
+                batch = []
+        if batch:
+            self._flush(batch, sink, report, progress)
+        
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _flush(self, batch: List[Tuple[int, Dict]], sink: ItemSink,
+               report: ImportReport, progress: ImportProgress) -> None:
+        """Validate one batch, deliver the valid items and report progress."""
+        items = []
+        for line_no, record in batch:
+            report.records_read += 1
+            item, error = self._to_item(record)
+            if item is None:
+                report.rejected += 1
+                if len(report.errors) < self.max_errors:
+                    report.errors.append(f"Record {line_no}: {error}")
+            else:
+                items.append(item)
+        if items:
+            sink(items)
+        report.imported += len(items)
+        
+        progress.records_read = report.records_read
+        progress.imported = report.imported
+        progress.rejected = report.rejected
+        if self.on_progress:
+            self.on_progress(progress)
+
+    def _iter_records(self, path: str) -> Iterator[Tuple[int, Dict, int]]:
+        """Yield (record number, raw record, bytes read) from the file."""
+        if path.lower().endswith('.csv'):
+            yield from self._iter_csv(path)
+        else:
+            yield from self._iter_jsonl(path)
+
+    @staticmethod
+    def _iter_jsonl(path: str) -> Iterator[Tuple[int, Dict, int]]:
+        """Yield records from a JSON Lines file."""
+        bytes_read = 0
+        with open(path, 'rb') as f:
+            for line_no, line in enumerate(f, start=1):
+                bytes_read += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    record = {'_error': f"Invalid JSON: {e.msg}"}
+                yield line_no, record, bytes_read
+
+    @staticmethod
+    def _iter_csv(path: str) -> Iterator[Tuple[int, Dict, int]]:
+        """Yield records from a CSV file with a header row; empty cells are dropped."""
+        bytes_read = 0
+        
+        def lines():
+            nonlocal bytes_read
+            with open(path, 'rb') as f:
+                for raw in f:
+                    bytes_read += len(raw)
+                    yield raw.decode('utf-8-sig')
+        
+        reader = csv.DictReader(lines())
+        for row_no, row in enumerate(reader, start=2):
+            record = {key: value for key, value in row.items() if key and value not in (None, '')}
+            yield row_no, record, bytes_read
+
+    @staticmethod
+    def _to_item(record: Dict) -> Tuple[Optional[Item], Optional[str]]:
+        """Validate a raw record and convert it to an Item.
+        
+        Returns:
+            Tuple of (item, None) on success or (None, error message)
+        """
+        if not isinstance(record, dict):
+            return None, "Record must be an object"
+        if '_error' in record:
+            return None, record['_error']
+        record = dict(record)
+        name = record.pop('name', None) or record.pop('Name', None)
+        if not name:
+            return None, "Name is required"
+        
+        valid, error = validate_item_record(name, record)
+        if not valid:
+            return None, error
+        
+        try:
+            # Derived weight fields are recalculated by the receiver
+            data = {key: int(value) for key, value in record.items()
+                    if key not in ('Effects', 'Favorite', 'Category', 'Total Weight', 'weight_per_1k')}
+            favorite = record.get('Favorite', False)
+            if isinstance(favorite, str):
+                favorite = favorite.strip().lower() in _TRUE_STRINGS
+            data['Favorite'] = bool(favorite)
+            data['Effects'] = str(record.get('Effects', ''))
+            data['Category'] = Category(record.get('Category', Category.NONE.value)).value
+        except ValueError as e:
+            return None, str(e)
+        for key in _INT_FIELDS:
+            data.setdefault(key, 0)
+        return Item.from_dict(str(name), data), None
@@ -0,0 +1,183 @@
+"""Incrementally sorted item orders and the ordered views built from them."""
+import bisect
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from src.models.category import Category
+from src.models.item import Item
+
+# Category order of the optimal build in the main menu
+CATEGORY_ORDER = (Category.WEAPON.value, Category.ABILITY.value,
+                  Category.SURVIVAL.value, Category.NONE.value)
+
+# Below this share of the indexed items, sorting a subset directly beats
+# walking the presorted lists
+_SUBSET_SORT_RATIO = 8
+
+
+class ItemView(NamedTuple):
+    """Items to display and their names per section, in display order.
+
+    Attributes:
+        items: Displayed items by name
+        sections: Names of each non-empty section in display order
+    """
+    items: Dict[str, Item]
+    sections: Tuple[Tuple[str, ...], ...]
+
+
+class ItemOrder:
+    """Item names per category, kept sorted by efficiency and by price.
+
+    Each list holds (key..., sequence, name) entries, where the keys are
+    the negated weight_per_1k or price and the sequence is the order in
+    which the name was first seen, so ties keep catalog order like a stable
+    sort. Changing an item moves its entries with two bisects per order
+    instead of re-sorting, and a view of any subset is read off the
+    presorted lists.
+    """
+
+    # "regular" is ItemList's regular order within a category: favorites
+    # first, then by efficiency
+    ORDERS = ('efficiency', 'price', 'regular')
+
+    def __init__(self, items: Optional[Dict[str, Item]] = None):
+        """Build the orders.
+
+        Args:
+            items: Items to index, if any
+        """
+        self.clear()
+        for name, item in (items or {}).items():
+            self._sequence[name] = self._next
+            self._next += 1
+            self._insert(name, item, sort=False)
+        for lists in self._lists.values():
+            for entries in lists.values():
+                entries.sort()
+
+    def clear(self) -> None:
+        """Remove every item."""
+        # Tie-break position of each name, in the order names were first seen
+        self._sequence: Dict[str, int] = {}
+        self._next = 0
+        # Per name, its category and entry per order
+        self._entries: Dict[str, Tuple[str, Dict[str, Tuple]]] = {}
+        # Order -> category -> sorted entries
+        self._lists: Dict[str, Dict[str, List[Tuple]]] = {order: {} for order in self.ORDERS}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _insert(self, name: str, item: Item, sort: bool = True) -> None:
+        """Add the entries of an item that is not indexed yet."""
+        category = getattr(item.category, "value", item.category)
+        sequence = self._sequence[name]
+        entries = {
+            'efficiency': (-item.weight_per_1k, sequence, name),
+            'price': (-item.price, sequence, name),
+            'regular': (not item.favorite, -item.weight_per_1k, sequence, name),
+        }
+        self._entries[name] = (category, entries)
+        for order, entry in entries.items():
+            target = self._lists[order].setdefault(category, [])
+            if sort:
+                bisect.insort(target, entry)
+            else:
+                target.append(entry)
+
+    def put(self, name: str, item: Item) -> None:
+        """Add an item, or move it after a change.
+
+        Args:
+            name: Item name
+            item: Item to index
+        """
+        if name in self._entries:
+            self.remove(name, keep_position=True)
+        else:
+            self._sequence[name] = self._next
+            self._next += 1
+        self._insert(name, item)
+
+    def remove(self, name: str, keep_position: bool = False) -> None:
+        """Remove an item if present.
+
+        Args:
+            name: Item name
+            keep_position: Keep the item's tie-break position for a re-put
+        """
+        indexed = self._entries.pop(name, None)
+        if indexed is None:
+            return
+        category, entries = indexed
+        for order, entry in entries.items():
+            target = self._lists[order][category]
+            del target[bisect.bisect_left(target, entry)]
+        if not keep_position:
+            del self._sequence[name]
+
+    def ordered(self, names: Iterable[str], order: str,
+                categories: Optional[Sequence[str]] = None) -> List[str]:
+        """Sort indexed names by an order.
+
+        Args:
+            names: Names to sort; names that are not indexed are dropped
+            order: "efficiency" (best weight per 1000 price first),
+                "price" (most expensive first) or "regular" (favorites
+                first, then by efficiency)
+            categories: Category values to group by, in this order; items of
+                other categories follow. None sorts across all categories
+
+        Returns:
+            The names in order
+        """
+        wanted = names if isinstance(names, (set, frozenset, dict)) else set(names)
+        lists = self._lists[order]
+        rank = {category: i for i, category in enumerate(categories or ())}
+
+        if len(wanted) * _SUBSET_SORT_RATIO < len(self._entries):
+            # Few names: sort their stored entries directly
+            indexed = self._entries
+            keys = []
+            for name in wanted:
+                if name in indexed:
+                    category, entries = indexed[name]
+                    group = rank.get(category, len(rank)) if categories is not None else 0
+                    keys.append((group, entries[order]))
+            keys.sort()
+            return [entry[-1] for _, entry in keys]
+
+        if categories is None:
+            groups = [list(lists.values())]
+        else:
+            groups = [[lists[category]] for category in categories if category in lists]
+            groups.append([entries for category, entries in lists.items() if category not in rank])
+        result = []
+        for group in groups:
+            # The lists are presorted runs, which sort() merges rather than re-sorts
+            entries = [entry for entries in group for entry in entries if entry[-1] in wanted]
+            if len(group) > 1:
+                entries.sort()
+            result.extend([entry[-1] for entry in entries])
+        return result
+
+    def sections(self, names: Iterable[str], optimal: Iterable[str] = ()) -> Tuple[Tuple[str, ...], ...]:
+        """Display sections of the item list.
+
+        The optimal items come first, best weight per 1000 price first. The
+        rest follow with the None category first, then favorites, then by
+        weight per 1000 price, like ItemList's regular_sort_key.
+
+        Args:
+            names: Names to show
+            optimal: Names of the optimal build
+
+        Returns:
+            Non-empty sections of names in display order
+        """
+        wanted = names if isinstance(names, (set, frozenset, dict)) else set(names)
+        optimal = set(optimal)
+        optimal_names = self.ordered((name for name in optimal if name in wanted), 'efficiency')
+        if optimal_names:
+            wanted = {name for name in wanted if name not in optimal}
+        regular = self.ordered(wanted, 'regular', (Category.NONE.value,))
+        return tuple(tuple(section) for section in (optimal_names, regular) if section)
@@ -1,29 +1,168 @@
 """Service for managing the collection of items."""
-from typing import Dict, List, Optional, Set
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from src.models.item import Item
+from src.models.catalog_snapshot import CatalogSnapshot
+from src.models.item_table import ItemTable
 from src.models.category import Category
+from src.services.event_bus import (
+    CatalogEvent, EventBus, ItemAdded, ItemChanged, ItemRemoved,
+    ProfilesChanged, ProfileToggled, WeightsRecomputed, coalesce
+)
 from src.services.file_service import FileService
+from src.services.save_scheduler import SaveScheduler
+from src.services.item_order import ItemOrder, ItemView
+from src.services.query_engine import ItemQuery, QueryEngine, QueryError
+from src.services.snapshot_cache import SnapshotCache
+from src.utils.constants import CacheConstant
+from src.utils.validators import validate_item_input
+
+
+def combine_output_weights(
+    weights: Dict[str, Dict[str, float]],
+    enabled_profiles: Iterable[str],
+    scales: Optional[Dict[str, float]] = None,
+    log: Optional[Callable[[str], None]] = None
+) -> Dict[str, float]:
+    """Combine weight profiles into output weights.
+    
+    Base Weights always applies unscaled. Every other enabled profile
+    multiplies in its non-1.0 weights, scaled by its slider position
+    between its _min and _max.
+    
+    Args:
+        weights: Weight profiles by name
+        enabled_profiles: Names of the enabled profiles besides Base Weights;
+            a profile counts only if its _enabled flag is set as well
+        scales: Slider positions (0 to 1) overriding the profiles' _scale
+        log: Receives progress messages, e.g. print
+        
+    Returns:
+        Output weight per field
+    """
+    log = log or (lambda message: None)
+    enabled_profiles = set(enabled_profiles)
+    scales = scales or {}
+    # Start with default values for all keys
+    all_keys = set()
+    for profile_name, profile in weights.items():
+        all_keys.update(k for k in profile.keys() if not k.startswith("_"))
+        
+    # Start with a weight of 1.0 for all fields
+    output = {key: 1.0 for key in all_keys}
+    log(f"Initial output weights: {output}")
+    
+    # Process Base Weights first (always enabled and not scaled)
+    if "Base Weights" in weights:
+        base_profile = weights["Base Weights"]
+        for key in all_keys:
+            if key in base_profile and not key.startswith("_"):
+                output[key] *= base_profile[key]
+        log(f"After applying Base Weights: {output}")
+    
+    # Process other enabled profiles with scaling
+    for profile_name, profile in weights.items():
+        if profile_name == "Base Weights":
+            continue  # Already processed
+            
+        # Skip disabled profiles - check both the _enabled flag and enabled_profiles set
+        if not profile.get("_enabled", False) or profile_name not in enabled_profiles:
+            log(f"Skipping disabled profile {profile_name}")
+            continue
+            
+        log(f"Processing enabled profile {profile_name}")
+        
+        # Get min, max, and scale values with defaults if not present
+        min_val = profile.get("_min", 0.1)
+        max_val = profile.get("_max", 2.0)
+        scale_percent = scales.get(profile_name, profile.get("_scale", 0.5))
+        
+        # Calculate scale factor using linear interpolation
+        scale_factor = min_val + scale_percent * (max_val - min_val)
+        log(f"Processing profile {profile_name} with scale factor {scale_factor}")
+        
+        # Apply scaled weights (only if the weight is not 1.0)
+        for key in all_keys:
+            if key in profile and not key.startswith("_"):
+                weight_value = profile[key]
+                # Only scale if not 1.0
+                if weight_value != 1.0:
+                    scaled_value = weight_value * scale_factor
+                    output[key] *= scaled_value
+        log(f"After applying {profile_name}: {output}")
+    
+    log(f"Final output weights: {output}")
+    return output
 
 
 class ItemService:
     """Service for managing the collection of items and their weights."""
     
-    def __init__(self, file_service: FileService):
+    def __init__(self, file_service: FileService, save_scheduler: Optional[SaveScheduler] = None,
+                 snapshot_cache: Optional[SnapshotCache] = None):
         """Initialize the item service.
         
         Args:
             file_service: Service for loading/saving items from/to file
+            save_scheduler: Optional scheduler that writes saves in the background;
+                without one, every save is written synchronously
+            snapshot_cache: Optional binary cache of the loaded state; a warm
+                start skips JSON parsing and weight recalculation
         """
         self.file_service = file_service
+        self.save_scheduler = save_scheduler
+        self.snapshot_cache = snapshot_cache
         self.items: Dict[str, Item] = {}
         self.weights: Dict[str, Dict[str, float]] = {}
         self.output_weights: Dict[str, float] = {}
         self.enabled_profiles: Set[str] = {"Base Weights"}  # Base Weights is always enabled
+        
+        # Change notifications, see event_bus.py
+        self.events = EventBus()
+        
+        # Name/category index for get_filtered_items, built on first use and
+        # kept current from the events
+        self._search_index: Optional[QueryEngine] = None
+        # Sorted orders for item_view, built and kept current the same way
+        self._item_order: Optional[ItemOrder] = None
+        # Ordered views by (query, categories, optimal set, snapshot version)
+        self._views: "OrderedDict[Tuple, ItemView]" = OrderedDict()
+        self.events.subscribe(ItemAdded, self._index_items)
+        self.events.subscribe(ItemChanged, self._index_items)
+        self.events.subscribe(WeightsRecomputed, self._index_items)
+        self.events.subscribe(ItemRemoved, self._unindex_items)
+        
+        # Batch state, see batch()
+        self._batch_depth = 0
+        self._batch_changed: Set[str] = set()
+        self._batch_removed: Set[str] = set()
+        self._batch_dirty = False
+        self._batch_undo: Dict[str, Optional[Item]] = {}
+        self._batch_republish = False
+        self._batch_events: List[CatalogEvent] = []
+        
+        # Latest published immutable view of self.items, see snapshot();
+        # after a wholesale change it is rebuilt on first use
+        self._snapshot = CatalogSnapshot()
+        self._snapshot_stale = False
+        
         self._load_data()
         # Don't automatically calculate output weights on startup
 
     def _load_data(self) -> None:
-        """Load items and weights from file."""
+        """Load items and weights from file, or from the snapshot cache if valid."""
+        signature = None
+        if self.snapshot_cache is not None:
+            signature = self.file_service.source_signature()
+            state = self.snapshot_cache.load(signature)
+            if state is not None:
+                self._restore_state(state)
+                self._publish_all()
+                self._search_index = None
+                self._item_order = None
+                return
+        
         items_dict, weights_dict, output_weights = self.file_service.load_data()
         self.weights = weights_dict
         self.output_weights = output_weights
@@ -33,6 +172,7 @@ class ItemService:
             name: Item.from_dict(name, data)
             for name, data in items_dict.items()
         }
+        self._publish_all()
         
         # Initialize enabled profiles and ensure profiles have required fields
         self.enabled_profiles = {"Base Weights"}  # Base Weights is always enabled
@@ -54,25 +194,320 @@ class ItemService:
         # Calculate weights for all items
         self._calculate_output_weights()
         self.recalculate_weights()
+        self._search_index = None
+        self._item_order = None
+        
+        if self.snapshot_cache is not None:
+            self.snapshot_cache.store(signature, self._capture_state())
 
-    def save_data(self) -> bool:
-        """Save current items and weights to file.
+    def _capture_state(self) -> Dict:
+        """Capture the fully loaded state for the snapshot cache.
         
         Returns:
-            bool: True if save was successful
+            Marshal-friendly dictionary of items, weights and enabled profiles
         """
-        items_dict = {
-            name: item.to_dict()
-            for name, item in self.items.items()
+        return {
+            'items': ItemTable.from_items(self.items.values()).to_state(),
+            'weights': self.weights,
+            'output_weights': self.output_weights,
+            'enabled_profiles': sorted(self.enabled_profiles),
+            'journal_seq': self.file_service.journal.seq if self.file_service.journal else 0,
         }
+
+    def _restore_state(self, state: Dict) -> None:
+        """Restore state captured by _capture_state.
+        
+        Args:
+            state: Cached state
+        """
+        self.items = ItemTable.from_state(state['items']).to_items()
+        self.weights = state['weights']
+        self.output_weights = state['output_weights']
+        self.enabled_profiles = set(state['enabled_profiles'])
+        # load_data was skipped, so carry the journal position over from the cache
+        journal = self.file_service.journal
+        if journal is not None:
+            journal.seq = max(journal.seq, state['journal_seq'])
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Get the latest immutable version of the catalog.
+        
+        The returned snapshot never changes, so it can be read from any thread
+        without locks, e.g. by a background solve. Every mutation publishes a
+        new snapshot that shares all untouched items with the previous one;
+        inside a batch, publishing waits for the outermost batch to commit.
+        
+        Returns:
+            CatalogSnapshot of item name to a frozen copy of the item
+        """
+        if self._snapshot_stale and not self._batch_depth:
+            self._snapshot = CatalogSnapshot.from_items(
+                {name: item.frozen_copy() for name, item in self.items.items()},
+                self._snapshot.version + 1
+            )
+            self._snapshot_stale = False
+        return self._snapshot
+
+    @property
+    def fingerprint(self) -> int:
+        """Order-independent fingerprint of the current problem.
+        
+        Combines the content hash of the published snapshot, which is updated
+        per changed item rather than recomputed, with the output weights and
+        enabled profiles. The cost does not depend on the catalog size, so
+        caches can check validity on every call. Values are only comparable
+        within one process.
+        
+        Returns:
+            int: Fingerprint that changes whenever items, prices, total
+            weights, output weights or enabled profiles change
+        """
+        return hash((
+            hash(self.snapshot()),
+            frozenset(self.output_weights.items()),
+            frozenset(self.enabled_profiles)
+        ))
+
+    def _publish(self, changed: Iterable[str] = (), removed: Iterable[str] = ()) -> None:
+        """Publish a new snapshot with the named items replaced or removed."""
+        if self._batch_depth:
+            return  # _commit_batch publishes everything touched
+        if self._snapshot_stale:
+            return  # The rebuild in snapshot() picks the change up
+        changed, removed = list(changed), list(removed)
+        if not changed and not removed:
+            return
+        self._snapshot = self._snapshot.evolve(
+            ((name, self.items[name].frozen_copy()) for name in changed if name in self.items),
+            removed
+        )
+
+    def _emit(self, event: CatalogEvent) -> None:
+        """Publish an event, or hold it until the outermost batch exits.
+        
+        Item events are not buffered inside a batch; _commit_batch derives
+        the net additions, changes and removals from the undo log instead.
+        """
+        if not self._batch_depth:
+            self.events.publish(event)
+        elif not isinstance(event, (ItemAdded, ItemChanged, ItemRemoved)):
+            self._batch_events.append(event)
+
+    def _publish_all(self) -> None:
+        """Republish every item, after the items were replaced wholesale.
+        
+        The new snapshot is only built when snapshot() is next called.
+        """
+        if self._batch_depth:
+            self._batch_republish = True
+            return
+        self._snapshot_stale = True
+
+    def save_data(
+        self,
+        changed_items: Optional[Iterable[str]] = None,
+        removed_items: Optional[Iterable[str]] = None
+    ) -> bool:
+        """Save current items and weights to file.
+        
+        If the file service records deltas, only the named items plus the
+        (small) weight profiles are written, and a full snapshot is only taken
+        once the journal is due for compaction. With a save scheduler, deltas
+        and full snapshots are coalesced and written in the background; the
+        current state is captured before returning.
+        
+        Args:
+            changed_items: Names of items added or changed since the last save
+            removed_items: Names of items deleted since the last save
+        
+        Returns:
+            bool: True if save was successful (or was scheduled)
+        """
+        if self._batch_depth:
+            # Deferred until the outermost batch exits
+            self._batch_changed.update(changed_items or ())
+            self._batch_removed.update(removed_items or ())
+            self._batch_dirty = True
+            return True
         
         # Mark profiles as enabled/disabled
         for profile in self.weights:
             if profile != "Base Weights":
                 self.weights[profile]["_enabled"] = profile in self.enabled_profiles
         
+        if self.file_service.supports_incremental:
+            changed = {
+                name: self.items[name].to_dict()
+                for name in (changed_items or ())
+                if name in self.items
+            }
+            if self.save_scheduler is not None:
+                self.save_scheduler.schedule_changes(
+                    changed, removed_items or (), self._copy_weights(), dict(self.output_weights))
+            elif not self.file_service.save_changes(
+                    changed, removed_items or (), self.weights, self.output_weights):
+                return False
+            if not self.file_service.needs_compaction:
+                return True
+            if self.save_scheduler is not None and self.save_scheduler.has_pending:
+                return True  # The snapshot already scheduled compacts the journal
+        
+        return self._save_snapshot()
+
+    def _save_snapshot(self) -> bool:
+        """Write a full snapshot, in the background if a scheduler is set.
+        
+        Returns:
+            bool: True if save was successful (or was scheduled)
+        """
+        if self.save_scheduler is not None:
+            self.save_scheduler.schedule(self._capture_save_payload())
+            return True
+        
+        items_dict = {
+            name: item.to_dict()
+            for name, item in self.items.items()
+        }
         return self.file_service.save_data(items_dict, self.weights, self.output_weights)
 
+    def flush(self) -> bool:
+        """Write any save still pending.
+        
+        Flushes the background scheduler and folds outstanding journal
+        records into a snapshot, so the items file is current afterwards.
+        
+        Returns:
+            bool: True if nothing was pending or the write succeeded
+        """
+        if self.file_service.has_pending_changes or (
+                self.save_scheduler is not None and self.save_scheduler.has_pending_changes):
+            self._save_snapshot()
+        if self.save_scheduler is None:
+            return True
+        return self.save_scheduler.flush()
+
+    def _capture_save_payload(self):
+        """Capture the current state for a deferred save.
+        
+        Only the immutable snapshot, the item order and copies of the weights
+        are taken here; the item records are built later on the scheduler
+        thread, since recalculation updates the live items in place.
+        
+        Returns:
+            Callable building the positional arguments for FileService.save_data
+        """
+        snapshot = self.snapshot()
+        names = list(self.items)
+        weights = self._copy_weights()
+        output_weights = dict(self.output_weights)
+        journal = self.file_service.journal
+        
+        def build():
+            items_dict = {name: snapshot[name].to_dict() for name in names}
+            # Changes requested after the capture are written after the
+            # snapshot, so the journal holds exactly the captured records
+            journal_seq = journal.rotate() if journal is not None else None
+            return items_dict, weights, output_weights, journal_seq
+        return build
+
+    def _copy_weights(self) -> Dict[str, Dict]:
+        """Copy the weight profiles for a save written on another thread."""
+        return {name: dict(profile) for name, profile in self.weights.items()}
+
+    @contextmanager
+    def batch(self) -> Iterator['ItemService']:
+        """Group several mutations into one recalculation and one save.
+        
+        Inside the block, add_item, update_item, delete_item and the weight
+        methods apply their changes to the in-memory state right away, but
+        items are only validated, not weighed, and nothing is saved. On exit,
+        only the touched items are recalculated and a single save is issued.
+        If the block raises, all item changes made in it are rolled back.
+        Batches may be nested; only the outermost one commits.
+        
+        Yields:
+            This service
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._rollback_batch()
+            raise
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self._commit_batch()
+
+    def _touch(self, name: str) -> None:
+        """Remember the pre-batch version of an item for rollback."""
+        if self._batch_depth and name not in self._batch_undo:
+            self._batch_undo[name] = self.items.get(name)
+
+    def _weigh(self, item: Item) -> None:
+        """Validate an item, then calculate its weight now or defer it inside a batch."""
+        valid, error = validate_item_input(
+            item.name, str(item.price), str(item.adjustment), str(item.effect_value))
+        if not valid:
+            raise ValueError(f"Invalid item {item.name!r}: {error}")
+        if not self._batch_depth:
+            item.calculate_total_weight(self.output_weights)
+
+    def _commit_batch(self) -> None:
+        """Recalculate touched items and issue the single deferred save."""
+        changed = {name for name in self._batch_changed if name in self.items}
+        removed = self._batch_removed - changed
+        dirty = self._batch_dirty
+        undo = self._batch_undo
+        republish = self._batch_republish
+        events = self._batch_events
+        self._reset_batch()
+        for name in changed:
+            self.items[name].calculate_total_weight(self.output_weights)
+        present = frozenset(name for name in undo if name in self.items)
+        absent = frozenset(name for name in undo if name not in self.items)
+        if republish:
+            self._publish_all()
+        else:
+            self._publish(present, absent)
+        
+        # Net effect of the batch: one event per kind
+        added = frozenset(name for name in present if undo[name] is None)
+        for event in (ItemAdded(added), ItemChanged(present - added),
+                      ItemRemoved(frozenset(name for name in absent if undo[name] is not None))):
+            if event.names:
+                self.events.publish(event)
+        for event in coalesce(events):
+            self.events.publish(event)
+        if dirty:
+            self.save_data(changed_items=changed, removed_items=removed)
+
+    def _rollback_batch(self) -> None:
+        """Restore every item touched in the batch to its pre-batch version."""
+        for name, item in self._batch_undo.items():
+            if item is None:
+                self.items.pop(name, None)
+            else:
+                self.items[name] = item
+        republish = self._batch_republish
+        events = self._batch_events
+        self._reset_batch()
+        if republish:
+            # Weights were recalculated in place and are not rolled back
+            self._publish_all()
+        for event in coalesce(events):
+            self.events.publish(event)
+
+    def _reset_batch(self) -> None:
+        """Clear the batch bookkeeping."""
+        self._batch_changed = set()
+        self._batch_removed = set()
+        self._batch_dirty = False
+        self._batch_undo = {}
+        self._batch_republish = False
+        self._batch_events = []
+
     def get_item(self, name: str) -> Optional[Item]:
         """Get an item by name.
         
@@ -92,15 +527,44 @@ class ItemService:
             
         Returns:
             bool: True if item was added, False if name already exists
+            
+        Raises:
+            ValueError: If the item fails validate_item_input
         """
         if item.name in self.items:
             return False
         
+        self._weigh(item)
+        self._touch(item.name)
         self.items[item.name] = item
-        item.calculate_total_weight(self.output_weights)
-        self.save_data()
+        self._publish([item.name])
+        self._emit(ItemAdded(frozenset([item.name])))
+        self.save_data(changed_items=[item.name])
         return True
 
+    def add_items(self, items: List[Item]) -> int:
+        """Add or replace several items with a single save.
+        
+        Used as the sink of CatalogImporter.
+        
+        Args:
+            items: Items to add; existing items with the same name are replaced
+            
+        Returns:
+            int: Number of items stored
+            
+        Raises:
+            ValueError: If an item fails validate_item_input; no item is stored
+        """
+        with self.batch():
+            for item in items:
+                self._weigh(item)
+                self._touch(item.name)
+                self.items[item.name] = item
+            if items:
+                self.save_data(changed_items=[item.name for item in items])
+        return len(items)
+
     def update_item(self, name: str, updated_item: Item) -> bool:
         """Update an existing item.
         
@@ -110,19 +574,33 @@ class ItemService:
             
         Returns:
             bool: True if update was successful
+            
+        Raises:
+            ValueError: If the new item data fails validate_item_input
         """
         if name not in self.items:
             return False
         
         # Handle name changes
+        removed = []
         if name != updated_item.name:
             if updated_item.name in self.items:
                 return False
-            del self.items[name]
         
+        self._weigh(updated_item)
+        if name != updated_item.name:
+            self._touch(name)
+            del self.items[name]
+            removed.append(name)
+        self._touch(updated_item.name)
         self.items[updated_item.name] = updated_item
-        updated_item.calculate_total_weight(self.output_weights)
-        self.save_data()
+        self._publish([updated_item.name], removed)
+        if removed:
+            self._emit(ItemRemoved(frozenset(removed)))
+            self._emit(ItemAdded(frozenset([updated_item.name])))
+        else:
+            self._emit(ItemChanged(frozenset([name])))
+        self.save_data(changed_items=[updated_item.name], removed_items=removed)
         return True
 
     def delete_item(self, name: str) -> bool:
@@ -135,11 +613,46 @@ class ItemService:
             bool: True if item was deleted
         """
         if name in self.items:
+            self._touch(name)
             del self.items[name]
-            self.save_data()
+            self._publish(removed=[name])
+            self._emit(ItemRemoved(frozenset([name])))
+            self.save_data(removed_items=[name])
             return True
         return False
 
+    @property
+    def search_index(self) -> QueryEngine:
+        """Index over item names, categories, effects and stats, built on first use."""
+        if self._search_index is None:
+            self._search_index = QueryEngine(self.items)
+        return self._search_index
+
+    @property
+    def item_order(self) -> ItemOrder:
+        """Per-category orders by efficiency and price, built on first use."""
+        if self._item_order is None:
+            self._item_order = ItemOrder(self.items)
+        return self._item_order
+
+    def _index_items(self, event: CatalogEvent) -> None:
+        """Add or re-index items named by an event."""
+        for index in (self._search_index, self._item_order):
+            if index is None:
+                continue
+            for name in event.names:
+                item = self.items.get(name)
+                if item is not None:
+                    index.put(name, item)
+
+    def _unindex_items(self, event: CatalogEvent) -> None:
+        """Drop items named by an event from the indexes."""
+        for index in (self._search_index, self._item_order):
+            if index is None:
+                continue
+            for name in event.names:
+                index.remove(name)
+
     def get_filtered_items(
         self,
         search_text: str = "",
@@ -147,6 +660,9 @@ class ItemService:
     ) -> Dict[str, Item]:
         """Get filtered items based on search text and categories.
         
+        Served from search_index; changes made inside a batch show up once
+        the batch exits.
+        
         Args:
             search_text: Text to search for in item names
             categories: List of categories to include, or None for all
@@ -154,21 +670,88 @@ class ItemService:
         Returns:
             Dictionary of filtered items
         """
-        filtered = {}
-        search_text = search_text.lower().strip()
+        # Let storage backends that index items run the filter themselves
+        query_item_names = getattr(self.file_service, "query_item_names", None)
+        if query_item_names is not None:
+            return {
+                name: self.items[name]
+                for name in query_item_names(search_text, categories)
+                if name in self.items
+            }
         
-        for name, item in self.items.items():
-            # Skip if doesn't match search text
-            if search_text and search_text not in name.lower():
-                continue
+        return {
+            name: self.items[name]
+            for name in self.search_index.search(search_text, categories)
+        }
+
+    def query_items(
+        self,
+        query: Union[str, ItemQuery],
+        categories: Optional[List[Category]] = None
+    ) -> Dict[str, Item]:
+        """Get items matching a structured query.
+        
+        Args:
+            query: Query such as "category:ability cdr>=10 price<5000
+                effects:shield", or a parsed ItemQuery
+            categories: Extra category restriction, or None
             
-            # Skip if category doesn't match
-            if categories is not None and item.category not in categories:
-                continue
+        Returns:
+            Dictionary of matching items
             
-            filtered[name] = item
+        Raises:
+            QueryError: If the query cannot be parsed
+        """
+        return {
+            name: self.items[name]
+            for name in self.search_index.query(query, categories)
+        }
+
+    def item_view(
+        self,
+        query: str = "",
+        categories: Optional[List[Category]] = None,
+        optimal: Iterable[str] = ()
+    ) -> ItemView:
+        """Get the items matching a query, split into sorted display sections.
+        
+        The query is tried as a structured query first (see query_items);
+        text that doesn't parse is matched against names. Sections are read
+        off the incrementally sorted item_order, and views are memoized by
+        query, categories, optimal set and snapshot version, so refreshing
+        with unchanged inputs returns the same view object.
         
-        return filtered
+        Args:
+            query: Query or name search text
+            categories: Categories to include, or None for all
+            optimal: Names of the optimal build, shown first
+            
+        Returns:
+            ItemView of frozen items from the published snapshot
+        """
+        key = (
+            query,
+            None if categories is None else frozenset(getattr(c, "value", c) for c in categories),
+            frozenset(optimal),
+            self.snapshot().version
+        )
+        view = self._views.get(key)
+        if view is not None:
+            self._views.move_to_end(key)
+            return view
+        
+        try:
+            names = self.search_index.query(query, categories)
+        except QueryError:
+            names = self.get_filtered_items(query, categories)
+        snapshot = self.snapshot()
+        items = {name: snapshot[name] for name in names if name in snapshot}
+        view = ItemView(items, self.item_order.sections(items, key[2]))
+        
+        self._views[key] = view
+        if len(self._views) > CacheConstant.VIEW_CACHE_SIZE:
+            self._views.popitem(last=False)
+        return view
 
     def update_weight(self, field: str, value: float, recalculate: bool = False) -> None:
         """Update a base weight value and recalculate all items.
@@ -179,6 +762,7 @@ class ItemService:
             recalculate: Whether to recalculate output weights (default False)
         """
         self.weights["Base Weights"][field] = value
+        self._emit(ProfilesChanged(profiles=frozenset(["Base Weights"])))
         if recalculate:
             self._calculate_output_weights()
             self.recalculate_weights()
@@ -201,6 +785,7 @@ class ItemService:
             weights["_enabled"] = True
         else:
             weights["_enabled"] = profile_name in self.enabled_profiles
+        self._emit(ProfilesChanged(profiles=frozenset([profile_name])))
             
         if recalculate:
             self._calculate_output_weights()
@@ -224,6 +809,7 @@ class ItemService:
             del self.weights[profile_name]
             if profile_name in self.enabled_profiles:
                 self.enabled_profiles.remove(profile_name)
+            self._emit(ProfilesChanged(profiles=frozenset([profile_name])))
             
             if recalculate:
                 self._calculate_output_weights()
@@ -247,6 +833,7 @@ class ItemService:
             if enabled and profile_name not in self.enabled_profiles:
                 self.enabled_profiles.add(profile_name)
                 self.weights[profile_name]["_enabled"] = True
+                self._emit(ProfileToggled(profile=profile_name, enabled=True))
                 if recalculate:
                     self._calculate_output_weights()
                     self.recalculate_weights()
@@ -254,6 +841,7 @@ class ItemService:
             elif not enabled and profile_name in self.enabled_profiles:
                 self.enabled_profiles.remove(profile_name)
                 self.weights[profile_name]["_enabled"] = False
+                self._emit(ProfileToggled(profile=profile_name, enabled=False))
                 if recalculate:
                     self._calculate_output_weights()
                     self.recalculate_weights()
@@ -275,58 +863,27 @@ class ItemService:
     def _calculate_output_weights(self) -> None:
         """Calculate output weights by combining all enabled weight profiles."""
         print("Starting output weights calculation...")
-        # Start with default values for all keys
-        all_keys = set()
-        for profile_name, weights in self.weights.items():
-            all_keys.update(k for k in weights.keys() if not k.startswith("_"))
-            
-        # Start with a weight of 1.0 for all fields
-        output = {key: 1.0 for key in all_keys}
-        print(f"Initial output weights: {output}")
-        
-        # Process Base Weights first (always enabled and not scaled)
-        if "Base Weights" in self.weights:
-            base_profile = self.weights["Base Weights"]
-            for key in all_keys:
-                if key in base_profile and not key.startswith("_"):
-                    output[key] *= base_profile[key]
-            print(f"After applying Base Weights: {output}")
-        
-        # Process other enabled profiles with scaling
-        for profile_name, profile in self.weights.items():
-            if profile_name == "Base Weights":
-                continue  # Already processed
-                
-            # Skip disabled profiles - check both the _enabled flag and enabled_profiles set
-            if not profile.get("_enabled", False) or profile_name not in self.enabled_profiles:
-                print(f"Skipping disabled profile {profile_name}")
-                continue
-                
-            print(f"Processing enabled profile {profile_name}")
-            
-            # Get min, max, and scale values with defaults if not present
-            min_val = profile.get("_min", 0.1)
-            max_val = profile.get("_max", 2.0)
-            scale_percent = profile.get("_scale", 0.5)
-            
-            # Calculate scale factor using linear interpolation
-            scale_factor = min_val + scale_percent * (max_val - min_val)
-            print(f"Processing profile {profile_name} with scale factor {scale_factor}")
-            
-            # Apply scaled weights (only if the weight is not 1.0)
-            for key in all_keys:
-                if key in profile and not key.startswith("_"):
-                    weight_value = profile[key]
-                    # Only scale if not 1.0
-                    if weight_value != 1.0:
-                        scaled_value = weight_value * scale_factor
-                        output[key] *= scaled_value
-            print(f"After applying {profile_name}: {output}")
-        
-        print(f"Final output weights: {output}")
+        output = combine_output_weights(self.weights, self.enabled_profiles, log=print)
+        old_output = self.output_weights
         self.output_weights = output
+        keys = frozenset(
+            key for key in old_output.keys() | output.keys()
+            if old_output.get(key) != output.get(key)
+        )
+        if keys:
+            self._emit(WeightsRecomputed(keys=keys))
 
     def recalculate_weights(self) -> None:
         """Recalculate weights for all items using the output weights."""
-        for item in self.items.values():
-            item.calculate_total_weight(self.output_weights) 
\ No newline at end of file
+        changed = []
+        for name, item in self.items.items():
+            before = (item.total_weight, item.weight_per_1k)
+            item.calculate_total_weight(self.output_weights)
+            if (item.total_weight, item.weight_per_1k) != before:
+                changed.append(name)
+        if self._batch_depth:
+            self._publish_all()  # Published when the batch commits
+        else:
+            self._publish(changed)
+        if changed:
+            self._emit(WeightsRecomputed(frozenset(changed))) 
\ No newline at end of file
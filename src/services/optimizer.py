@@ -1,8 +1,13 @@
 """Service for finding optimal item combinations."""
 
-from typing import Dict, List, Tuple
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
 from src.models.item import Item
-from src.utils.constants import GameConstant
+from src.models.build_result import BuildResult
+from src.utils.constants import CacheConstant, GameConstant
 
 # Try to import the C++ extension
 # This allows the module to still be imported if the C++ extension hasn't been built,
@@ -10,54 +15,350 @@ from src.utils.constants import GameConstant
 try:
     import knapsack_optimizer_cpp
     HAS_CPP_OPTIMIZER = True
+    # Older builds only expose the uninstrumented entry point
+    HAS_CPP_STATS = hasattr(knapsack_optimizer_cpp, "solve_knapsack_stats_cpp")
+    # ...and cannot poll a cancel event
+    HAS_CPP_CANCEL = hasattr(knapsack_optimizer_cpp, "SolveCancelled")
 except ImportError:
     HAS_CPP_OPTIMIZER = False
+    HAS_CPP_STATS = False
+    HAS_CPP_CANCEL = False
     # You could print a warning here or log this event
     print("WARNING: C++ knapsack_optimizer_cpp module not found. Optimizer will be slower.")
 
+# Search nodes between checks of a solve's cancel event
+CANCEL_CHECK_NODES = 4096
+
+
+class SolveCancelled(Exception):
+    """Raised by a search whose cancel event was set."""
+
+
 class OptimizerService:
     """Service for finding optimal item combinations within a budget."""
 
+    def __init__(self, cache_size: int = CacheConstant.SOLVE_CACHE_SIZE):
+        """Initialize the optimizer service.
+        
+        Args:
+            cache_size: Number of results kept by solve()
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple, BuildResult]" = OrderedDict()
+
+    def solve(
+        self,
+        budget: int,
+        items: Dict[str, Item],
+        cache_key: Optional[Hashable] = None
+    ) -> BuildResult:
+        """Find the optimal items, reusing a cached result when possible.
+        
+        Args:
+            budget: Maximum total price
+            items: Dictionary (or snapshot) of items to choose from
+            cache_key: Value identifying the exact items, e.g.
+                ItemService.fingerprint; without one, nothing is cached
+        
+        Returns:
+            BuildResult; cache_hit is True if it came from the cache
+        """
+        if cache_key is None:
+            return self.find_optimal_items(budget, items)
+        hit = self.cached(budget, cache_key)
+        if hit is not None:
+            return hit
+        result = self.find_optimal_items(budget, items)
+        self.remember(budget, cache_key, result)
+        return result
+
+    def cached(self, budget: int, cache_key: Hashable) -> Optional[BuildResult]:
+        """Look up a cached result.
+        
+        Args:
+            budget: Maximum total price
+            cache_key: Value identifying the exact items, see solve()
+        
+        Returns:
+            Copy of the cached BuildResult with cache_hit set, or None
+        """
+        key = (cache_key, budget, GameConstant.MAX_ITEMS)
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        self._cache.move_to_end(key)
+        hit = self._copy_result(cached)
+        hit.cache_hit = True
+        return hit
+
+    def remember(self, budget: int, cache_key: Hashable, result: BuildResult) -> None:
+        """Cache a result computed outside solve(), e.g. in a worker thread.
+        
+        Args:
+            budget: Maximum total price
+            cache_key: Value identifying the exact items, see solve()
+            result: Result of find_optimal_items for them
+        """
+        self._cache[(cache_key, budget, GameConstant.MAX_ITEMS)] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _copy_result(result: BuildResult) -> BuildResult:
+        """Copy a result without sharing its lists and dicts."""
+        copy = BuildResult(**result.to_dict())
+        copy.names = list(result.names)
+        copy.item_indices = list(result.item_indices)
+        copy.stat_totals = dict(result.stat_totals)
+        copy.reduction_stats = dict(result.reduction_stats)
+        return copy
+
+    @classmethod
+    def reuse_for_budget(cls, result: BuildResult, budget: int) -> BuildResult:
+        """Report a build as the answer for a smaller budget it fits in.
+        
+        Args:
+            result: Optimal build for a larger budget
+            budget: Budget at least result.price
+        
+        Returns:
+            Copy of result for budget, marked as a cache hit
+        """
+        reused = cls._copy_result(result)
+        reused.budget = budget
+        reused.wall_time = 0.0
+        reused.cache_hit = True
+        return reused
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+
+    def sweep(
+        self,
+        budgets: Iterable[int],
+        items: Dict[str, Item],
+        cache_key: Optional[Hashable] = None
+    ) -> List[BuildResult]:
+        """Solve the same items for several budgets.
+        
+        Budgets are solved from the largest down. The best build for a
+        budget is also optimal for every smaller budget it still fits in,
+        so those budgets reuse it instead of searching again.
+        
+        Args:
+            budgets: Budgets to solve
+            items: Dictionary (or snapshot) of items to choose from
+            cache_key: Passed to solve(), see there
+        
+        Returns:
+            One BuildResult per budget, in the order given
+        """
+        budgets = list(budgets)
+        results: Dict[int, BuildResult] = {}
+        best: Optional[BuildResult] = None
+        for budget in sorted(set(budgets), reverse=True):
+            if best is not None and best.price <= budget:
+                results[budget] = self.reuse_for_budget(best, budget)
+                continue
+            best = self.solve(budget, items, cache_key)
+            results[budget] = best
+        return [results[budget] for budget in budgets]
+
+    @staticmethod
+    def frontier(results: Iterable[BuildResult]) -> List[BuildResult]:
+        """Keep the builds on the price/weight Pareto frontier.
+        
+        Args:
+            results: Results of a sweep
+        
+        Returns:
+            Distinct builds, cheapest first, each strictly heavier than the last
+        """
+        points: List[BuildResult] = []
+        for result in sorted(results, key=lambda r: (r.price, -r.weight)):
+            if not points or result.weight > points[-1].weight:
+                points.append(result)
+        return points
+
     @staticmethod
     def find_optimal_items(
         budget: int,
-        items: Dict[str, Item]
-    ) -> Tuple[List[str], int, float]:
+        items: Dict[str, Item],
+        cancel: Optional[threading.Event] = None
+    ) -> BuildResult:
         """Interface for finding the optimal combination of items within the given budget.
         Delegates to the C++ implementation if available, otherwise falls back
         to the Python implementation (or raises an error).
+
+        The returned BuildResult unpacks like the legacy
+        ``(names, total_price, total_weight)`` tuple.
+
+        cancel, when set from another thread, stops the search with
+        SolveCancelled. The C++ search runs without holding the GIL and
+        polls it as often as the Python one; builds too old to poll it
+        use the Python search when a cancel event is given.
         """
-        if HAS_CPP_OPTIMIZER:
+        start = time.perf_counter()
+        if HAS_CPP_OPTIMIZER and (cancel is None or HAS_CPP_CANCEL):
             # Prepare data for C++ function: List[Tuple[str, int, double]]
             items_data_for_cpp = [
                 (name, item.price, item.total_weight)
                 for name, item in items.items()
             ]
             max_items = GameConstant.MAX_ITEMS
-            return knapsack_optimizer_cpp.solve_knapsack_cpp(budget, items_data_for_cpp, max_items)
+            if HAS_CPP_CANCEL:
+                try:
+                    indices, price, weight, expanded, pruned = knapsack_optimizer_cpp.solve_knapsack_stats_cpp(
+                        budget, items_data_for_cpp, max_items, cancel)
+                except knapsack_optimizer_cpp.SolveCancelled:
+                    raise SolveCancelled() from None
+                names = [items_data_for_cpp[i][0] for i in indices]
+            elif HAS_CPP_STATS:
+                indices, price, weight, expanded, pruned = knapsack_optimizer_cpp.solve_knapsack_stats_cpp(
+                    budget, items_data_for_cpp, max_items)
+                names = [items_data_for_cpp[i][0] for i in indices]
+            else:
+                names, price, weight = knapsack_optimizer_cpp.solve_knapsack_cpp(
+                    budget, items_data_for_cpp, max_items)
+                positions = {name: i for i, (name, _, _) in enumerate(items_data_for_cpp)}
+                indices = [positions[name] for name in names]
+                expanded = pruned = 0
+            reduction_stats = {
+                "items_in": len(items_data_for_cpp),
+                "items_over_budget": sum(1 for _, p, _ in items_data_for_cpp if p > budget),
+            }
+            reduction_stats["items_considered"] = (
+                reduction_stats["items_in"] - reduction_stats["items_over_budget"])
+            result = BuildResult(
+                names, price, weight,
+                item_indices=list(indices),
+                engine="cpp",
+                nodes_expanded=expanded,
+                nodes_pruned=pruned,
+                reduction_stats=reduction_stats,
+            )
         else:
             # Fallback to Python implementation or raise an error
             # For now, let's keep the fallback to the Python version
             print("Using pure Python optimizer as C++ version is not available.")
-            return OptimizerService._find_optimal_items_backtrack(budget, items)
+            result = OptimizerService._find_optimal_items_backtrack(budget, items, cancel)
+
+        result.budget = budget
+        result.stat_totals = OptimizerService._sum_stats(items, result.names)
+        result.wall_time = time.perf_counter() - start
+        return result
+
+    @staticmethod
+    def find_top_builds(
+        budget: int,
+        items: Dict[str, Item],
+        top_k: int
+    ) -> List[BuildResult]:
+        """Find the top_k best distinct builds within the budget.
+        
+        Uses the Python search, which visits every affordable combination
+        of up to MAX_ITEMS items, keeping the best top_k in a heap.
+        
+        Args:
+            budget: Maximum total price
+            items: Dictionary (or snapshot) of items to choose from
+            top_k: Number of builds to return
+        
+        Returns:
+            Up to top_k BuildResults, best (heaviest, then cheapest) first
+        """
+        start = time.perf_counter()
+        items_list: List[Tuple[str, int, float, int]] = [
+            (name, item.price, item.total_weight, index)
+            for index, (name, item) in enumerate(items.items())
+            if item.price <= budget
+        ]
+        # Min-heap of (weight, -price, positions): the root is the worst kept build
+        heap: List[Tuple[float, int, Tuple[int, ...]]] = []
+        stack: List[int] = []
+        nodes_expanded = 0
+
+        def backtrack(start_idx: int, current_price: int, current_weight: float) -> None:
+            nonlocal nodes_expanded
+            nodes_expanded += 1
+            if stack:
+                entry = (current_weight, -current_price, tuple(stack))
+                if len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+            if len(stack) >= GameConstant.MAX_ITEMS:
+                return
+            for i in range(start_idx, len(items_list)):
+                item_price = items_list[i][1]
+                if current_price + item_price > budget:
+                    continue
+                stack.append(i)
+                backtrack(i + 1, current_price + item_price, current_weight + items_list[i][2])
+                stack.pop()
+
+        if top_k > 0:
+            backtrack(0, 0, 0.0)
+        results = []
+        for weight, negative_price, positions in sorted(heap, reverse=True):
+            names = [items_list[i][0] for i in positions]
+            results.append(BuildResult(
+                names, -negative_price, weight,
+                item_indices=[items_list[i][3] for i in positions],
+                stat_totals=OptimizerService._sum_stats(items, names),
+                budget=budget,
+                engine="python",
+                wall_time=time.perf_counter() - start,
+                nodes_expanded=nodes_expanded,
+            ))
+        return results
+
+    @staticmethod
+    def _sum_stats(items: Dict[str, Item], names: List[str]) -> Dict[str, float]:
+        """Sum the stat values of the named items.
+
+        Args:
+            items: Dictionary of all items
+            names: Names of the selected items
+
+        Returns:
+            Dictionary of stat name to summed value
+        """
+        totals: Dict[str, float] = {}
+        for name in names:
+            item = items[name]
+            if item.adjustment:
+                totals['Adjustment'] = totals.get('Adjustment', 0) + item.adjustment
+            if item.effect_value:
+                totals['Effect Value'] = totals.get('Effect Value', 0) + item.effect_value
+            for stat, value in item.stats.items():
+                totals[stat] = totals.get(stat, 0) + value
+        return totals
 
     @staticmethod
     def _find_optimal_items_backtrack(
         budget: int,
-        items: Dict[str, Item]
-    ) -> Tuple[List[str], int, float]:
+        items: Dict[str, Item],
+        cancel: Optional[threading.Event] = None
+    ) -> BuildResult:
         """Original backtracking implementation for finding optimal items (Python version)."""
         # Convert items to list and sort by weight per 1000 price (efficiency)
-        items_list = [
-            (name, item.price, item.total_weight)
-            for name, item in items.items()
+        items_list: List[Tuple[str, int, float, int]] = [
+            (name, item.price, item.total_weight, index)
+            for index, (name, item) in enumerate(items.items())
         ]
+        items_in = len(items_list)
+        # Items priced above the whole budget can never be picked
+        items_list = [entry for entry in items_list if entry[1] <= budget]
         # Handle division by zero for items with price 0
         items_list.sort(key=lambda x: (x[2] / x[1]) if x[1] != 0 else float('inf') if x[2] > 0 else 0, reverse=True)
 
         best_combination = []
         best_weight = 0.0
         best_price = 0
+        nodes_expanded = 0
+        nodes_pruned = 0
 
         current_items_stack = [] # Using a list as a stack
 
@@ -67,6 +368,10 @@ class OptimizerService:
             current_weight: float
         ) -> None:
             nonlocal best_combination, best_weight, best_price, current_items_stack
+            nonlocal nodes_expanded, nodes_pruned
+            nodes_expanded += 1
+            if cancel is not None and nodes_expanded % CANCEL_CHECK_NODES == 0 and cancel.is_set():
+                raise SolveCancelled()
 
             if current_weight > best_weight and current_price <= budget:
                 best_combination = list(current_items_stack) # Make a copy
@@ -74,21 +379,37 @@ class OptimizerService:
                 best_price = current_price
 
             if start_idx >= len(items_list) or len(current_items_stack) >= GameConstant.MAX_ITEMS:
+                if start_idx < len(items_list):
+                    nodes_pruned += 1
                 return
 
             for i in range(start_idx, len(items_list)):
-                item_name, item_price, item_total_weight = items_list[i]
+                item_price = items_list[i][1]
 
                 if current_price + item_price > budget:
+                    nodes_pruned += 1
                     continue
 
-                current_items_stack.append(item_name)
+                current_items_stack.append(i)
                 backtrack(
                     i + 1, 
                     current_price + item_price,
-                    current_weight + item_total_weight
+                    current_weight + items_list[i][2]
                 )
                 current_items_stack.pop()
 
         backtrack(0, 0, 0.0)
-        return best_combination, best_price, best_weight 
\ No newline at end of file
+        return BuildResult(
+            [items_list[i][0] for i in best_combination],
+            best_price,
+            best_weight,
+            item_indices=[items_list[i][3] for i in best_combination],
+            engine="python",
+            nodes_expanded=nodes_expanded,
+            nodes_pruned=nodes_pruned,
+            reduction_stats={
+                "items_in": items_in,
+                "items_over_budget": items_in - len(items_list),
+                "items_considered": len(items_list),
+            },
+        )
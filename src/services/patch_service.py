@@ -0,0 +1,303 @@
+"""Game-patch diffs between item catalogs and a single-pass apply engine."""
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from src.models.build_result import BuildResult
+from src.models.item import Item
+from src.services.item_service import ItemService
+from src.services.optimizer import OptimizerService
+
+# Fields derived from weights; they are recalculated, never diffed
+DERIVED_FIELDS = frozenset({'Total Weight', 'weight_per_1k'})
+
+PATCH_FORMAT_VERSION = 1
+
+
+class PatchConflictError(Exception):
+    """Raised when a patch does not match the catalog it is applied to."""
+
+
+@dataclass
+class CatalogPatch:
+    """Structural difference between two item catalogs.
+    
+    Attributes:
+        label: Free-form name of the patch, e.g. the game patch version
+        added: New items as item dictionaries, keyed by name
+        removed: Removed items with their last item dictionary, keyed by name
+        changed: Per changed item, field name -> [old value, new value];
+            None stands for a field that is absent on that side
+    """
+    label: str = ""
+    added: Dict[str, Dict] = field(default_factory=dict)
+    removed: Dict[str, Dict] = field(default_factory=dict)
+    changed: Dict[str, Dict[str, List]] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the patch changes nothing."""
+        return not (self.added or self.removed or self.changed)
+
+    @property
+    def touched(self) -> set:
+        """Names of all items the patch adds, removes or changes."""
+        return set(self.added) | set(self.removed) | set(self.changed)
+
+    def apply_to(self, items: Dict[str, Dict]) -> None:
+        """Apply the patch to a dictionary of item dictionaries in place.
+        
+        Args:
+            items: Item dictionaries keyed by name
+            
+        Raises:
+            PatchConflictError: If the catalog does not match the patch's base
+        """
+        check_conflicts(self, items)
+        for name in self.removed:
+            del items[name]
+        for name, fields in self.changed.items():
+            items[name] = apply_fields(items[name], fields)
+        for name, data in self.added.items():
+            items[name] = dict(data)
+
+    def inverted(self) -> 'CatalogPatch':
+        """Get the patch that undoes this one."""
+        return CatalogPatch(
+            label=self.label,
+            added={name: dict(data) for name, data in self.removed.items()},
+            removed={name: dict(data) for name, data in self.added.items()},
+            changed={
+                name: {key: [new, old] for key, (old, new) in fields.items()}
+                for name, fields in self.changed.items()
+            }
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert the patch to its patch-file representation."""
+        return {
+            'format': PATCH_FORMAT_VERSION,
+            'label': self.label,
+            'added': self.added,
+            'removed': self.removed,
+            'changed': self.changed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CatalogPatch':
+        """Create a patch from its patch-file representation."""
+        if data.get('format', PATCH_FORMAT_VERSION) != PATCH_FORMAT_VERSION:
+            raise ValueError(f"Unsupported patch format: {data.get('format')}")
+        return cls(
+            label=data.get('label', ''),
+            added=data.get('added', {}),
+            removed=data.get('removed', {}),
+            changed=data.get('changed', {})
+        )
+
+    def save(self, path: str) -> None:
+        """Write the patch to a JSON patch file."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'CatalogPatch':
+        """Read a patch from a JSON patch file."""
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+@dataclass
+class PatchReport:
+    """Outcome of applying a patch.
+    
+    Attributes:
+        patch: The applied patch
+        resolved: (old, new) pairs for saved builds that had to be re-solved
+        changed_builds: (old, new) pairs whose item set or weight changed
+        skipped: Saved builds that provably kept their optimum
+    """
+    patch: CatalogPatch
+    resolved: List[Tuple[BuildResult, BuildResult]] = field(default_factory=list)
+    changed_builds: List[Tuple[BuildResult, BuildResult]] = field(default_factory=list)
+    skipped: List[BuildResult] = field(default_factory=list)
+
+
+def _strip(data: Dict) -> Dict:
+    """Drop derived fields from an item dictionary."""
+    return {key: value for key, value in data.items() if key not in DERIVED_FIELDS}
+
+
+def apply_fields(data: Dict, fields: Dict[str, List]) -> Dict:
+    """Return a copy of an item dictionary with field changes applied.
+    
+    Args:
+        data: Item dictionary
+        fields: Field name -> [old value, new value], as in CatalogPatch.changed
+        
+    Returns:
+        Updated copy of the item dictionary
+    """
+    result = dict(data)
+    for key, (_, new) in fields.items():
+        if new is None:
+            result.pop(key, None)
+        else:
+            result[key] = new
+    return result
+
+
+def diff_catalogs(old: Dict[str, Dict], new: Dict[str, Dict], label: str = "") -> CatalogPatch:
+    """Compute the structural difference between two catalogs.
+    
+    Args:
+        old: Item dictionaries of the old catalog, keyed by name
+        new: Item dictionaries of the new catalog, keyed by name
+        label: Name for the resulting patch
+        
+    Returns:
+        CatalogPatch turning old into new
+    """
+    patch = CatalogPatch(label=label)
+    for name, data in new.items():
+        if name not in old:
+            patch.added[name] = _strip(data)
+    for name, data in old.items():
+        if name not in new:
+            patch.removed[name] = _strip(data)
+            continue
+        before, after = _strip(data), _strip(new[name])
+        fields = {
+            key: [before.get(key), after.get(key)]
+            for key in before.keys() | after.keys()
+            if before.get(key) != after.get(key)
+        }
+        if fields:
+            patch.changed[name] = dict(sorted(fields.items()))
+    return patch
+
+
+def check_conflicts(patch: CatalogPatch, items: Dict[str, Dict]) -> None:
+    """Verify that a patch was made against the given catalog.
+    
+    Args:
+        patch: Patch to check
+        items: Item dictionaries keyed by name
+        
+    Raises:
+        PatchConflictError: On the first mismatch found
+    """
+    for name in patch.added:
+        if name in items:
+            raise PatchConflictError(f"Cannot add {name!r}: item already exists")
+    for name in patch.removed:
+        if name not in items:
+            raise PatchConflictError(f"Cannot remove {name!r}: item does not exist")
+    for name, fields in patch.changed.items():
+        if name not in items:
+            raise PatchConflictError(f"Cannot change {name!r}: item does not exist")
+        for key, (old, _) in fields.items():
+            if items[name].get(key) != old:
+                raise PatchConflictError(
+                    f"Cannot change {name!r}: {key} is {items[name].get(key)!r}, expected {old!r}")
+
+
+def build_may_change(build: BuildResult, patch: CatalogPatch,
+                     before: Dict[str, Tuple[int, float]],
+                     after: Dict[str, Tuple[int, float]]) -> bool:
+    """Decide whether a saved optimal build can be affected by a patch.
+    
+    A build keeps its optimum if none of its items were touched and every
+    other touched item only got worse (removed, pricier or lighter): any set
+    that is feasible afterwards was feasible before and weighs no more.
+    
+    Args:
+        build: Saved optimal build
+        patch: Applied patch
+        before: (price, total_weight) of touched items before the patch
+        after: (price, total_weight) of touched items after the patch
+        
+    Returns:
+        bool: True if the build has to be re-solved
+    """
+    if patch.touched & set(build.names):
+        return True
+    if patch.added:
+        return True
+    for name in patch.changed:
+        old_price, old_weight = before[name]
+        new_price, new_weight = after[name]
+        if new_price < old_price or new_weight > old_weight:
+            return True
+    return False
+
+
+class PatchService:
+    """Applies catalog patches to an ItemService in one recompute pass."""
+
+    def __init__(self, item_service: ItemService, optimizer_service: Optional[OptimizerService] = None):
+        """Initialize the patch service.
+        
+        Args:
+            item_service: Service holding the catalog to patch
+            optimizer_service: Service used to re-solve saved builds
+        """
+        self.item_service = item_service
+        self.optimizer_service = optimizer_service or OptimizerService()
+
+    def diff_against(self, new_items: Dict[str, Dict], label: str = "") -> CatalogPatch:
+        """Diff the current catalog against another one.
+        
+        Args:
+            new_items: Item dictionaries of the target catalog
+            label: Name for the resulting patch
+            
+        Returns:
+            CatalogPatch turning the current catalog into the target
+        """
+        current = {name: item.to_dict() for name, item in self.item_service.items.items()}
+        return diff_catalogs(current, new_items, label)
+
+    def apply(self, patch: CatalogPatch, saved_builds: Optional[List[BuildResult]] = None) -> PatchReport:
+        """Apply a patch atomically and re-solve only affected saved builds.
+        
+        Args:
+            patch: Patch to apply
+            saved_builds: Previously computed optimal builds to check
+            
+        Returns:
+            PatchReport listing re-solved and changed builds
+            
+        Raises:
+            PatchConflictError: If the patch does not match the catalog; nothing
+                is changed in that case
+        """
+        service = self.item_service
+        check_conflicts(patch, {name: item.to_dict() for name, item in service.items.items()})
+        before = {
+            name: (service.items[name].price, service.items[name].total_weight)
+            for name in patch.changed
+        }
+        
+        with service.batch():
+            for name in patch.removed:
+                service.delete_item(name)
+            for name, fields in patch.changed.items():
+                data = apply_fields(service.items[name].to_dict(), fields)
+                service.update_item(name, Item.from_dict(name, data))
+            for name, data in patch.added.items():
+                service.add_item(Item.from_dict(name, data))
+        
+        after = {
+            name: (service.items[name].price, service.items[name].total_weight)
+            for name in patch.changed
+        }
+        report = PatchReport(patch=patch)
+        for build in saved_builds or ():
+            if not build_may_change(build, patch, before, after):
+                report.skipped.append(build)
+                continue
+            new_build = self.optimizer_service.find_optimal_items(build.budget, service.items)
+            report.resolved.append((build, new_build))
+            if set(new_build.names) != set(build.names) or abs(new_build.weight - build.weight) > 1e-9:
+                report.changed_builds.append((build, new_build))
+        return report
@@ -0,0 +1,335 @@
+"""Structured item queries: effects text, stat ranges, categories and names."""
+import bisect
+import re
+import shlex
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+from src.models.category import Category
+from src.models.item import Item
+from src.services.search_index import SearchIndex, _mask
+from src.utils.constants import OptionalField
+
+# Short names accepted for numeric fields, besides the field names themselves
+FIELD_ALIASES = {
+    'price': 'Price',
+    'adj': 'Adjustment',
+    'ev': 'Effect Value',
+    'weight': 'Total Weight',
+    'wpk': 'weight_per_1k',
+    'w/kp': 'weight_per_1k',
+    'wp': OptionalField.WEAPON_POWER.value,
+    'wls': OptionalField.WEAPON_LIFESTEAL.value,
+    'as': OptionalField.ATTACK_SPEED.value,
+    'cdr': OptionalField.COOLDOWN_REDUCTION.value,
+    'ap': OptionalField.ABILITY_POWER.value,
+    'als': OptionalField.ABILITY_LIFESTEAL.value,
+    'hp': OptionalField.HEALTH.value,
+}
+
+# Fields every item has; other fields are stats that may be absent (= 0)
+BASE_FIELDS = ('Price', 'Adjustment', 'Effect Value', 'Total Weight', 'weight_per_1k')
+
+_COMPARISON = re.compile(r"^(?P<field>.+?)\s*(?P<op>>=|<=|≥|≤|=|<|>)\s*(?P<value>-?\d+(?:\.\d+)?)$")
+_TOKEN = re.compile(r"[a-z0-9]+")
+_OPERATORS = {'≥': '>=', '≤': '<='}
+
+# Sorted entries per prefix bitset of a numeric field
+RANGE_BLOCK = 256
+
+
+class QueryError(ValueError):
+    """Raised when a query string cannot be parsed."""
+
+
+def resolve_field(name: str) -> str:
+    """Map a field name or alias, in any case, to its canonical name.
+
+    Args:
+        name: Name as typed, e.g. "cdr" or "cooldown_reduction"
+
+    Returns:
+        Canonical field name, e.g. "Cooldown Reduction"
+
+    Raises:
+        QueryError: If the field is unknown
+    """
+    key = name.strip().lower().replace('_', ' ')
+    if key in FIELD_ALIASES:
+        return FIELD_ALIASES[key]
+    for candidate in BASE_FIELDS + tuple(f.value for f in OptionalField):
+        if candidate.lower().replace('_', ' ') == key:
+            return candidate
+    raise QueryError(f"Unknown field: {name}")
+
+
+def effect_tokens(text: str) -> List[str]:
+    """Lowercased words of an effects text."""
+    return _TOKEN.findall(text.lower())
+
+
+@dataclass
+class ItemQuery:
+    """A conjunction of predicates over items.
+
+    Attributes:
+        text: Substring the item name must contain
+        categories: Allowed category values, or None for all
+        effects: Words that must each prefix a word of the effects text
+        ranges: (field, operator, value) comparisons; absent stats count as 0
+        favorite: Required favorite flag, or None for either
+    """
+    text: str = ""
+    categories: Optional[List[str]] = None
+    effects: List[str] = field(default_factory=list)
+    ranges: List[Tuple[str, str, float]] = field(default_factory=list)
+    favorite: Optional[bool] = None
+
+    @classmethod
+    def parse(cls, query: str) -> 'ItemQuery':
+        """Parse a query string.
+
+        Terms are separated by spaces and quoted with double quotes:
+        ``category:ability "Cooldown Reduction">=10 price<5000 effects:shield``.
+        Supported terms are ``field<op>number`` (ops >=, >, <=, <, =),
+        ``category:`` or ``cat:`` with comma-separated values,
+        ``effects:`` or ``effect:``, ``name:``, ``is:favorite`` and
+        ``favorite:yes|no``. Other words are matched against the name.
+
+        Args:
+            query: Query string
+
+        Returns:
+            Parsed query
+
+        Raises:
+            QueryError: If a term is malformed or names an unknown field
+        """
+        # Only double quotes group words, so names with apostrophes still parse
+        lexer = shlex.shlex(query, posix=True)
+        lexer.whitespace_split = True
+        lexer.quotes = '"'
+        lexer.escape = ''
+        lexer.commenters = ''
+        try:
+            terms = list(lexer)
+        except ValueError as e:
+            raise QueryError(str(e))
+
+        parsed = cls()
+        words = []
+        for term in terms:
+            comparison = _COMPARISON.match(term)
+            key, sep, value = term.partition(':')
+            key = key.lower()
+            if comparison:
+                op = comparison.group('op')
+                parsed.ranges.append((
+                    resolve_field(comparison.group('field')),
+                    _OPERATORS.get(op, op),
+                    float(comparison.group('value'))
+                ))
+            elif sep and key in ('category', 'cat'):
+                parsed.categories = (parsed.categories or []) + [
+                    _parse_category(part) for part in value.split(',') if part
+                ]
+            elif sep and key in ('effects', 'effect'):
+                tokens = effect_tokens(value)
+                if not tokens:
+                    raise QueryError(f"Empty effects term: {term}")
+                parsed.effects.extend(tokens)
+            elif sep and key == 'name':
+                words.append(value)
+            elif sep and key == 'is' and value.lower() in ('favorite', 'fav'):
+                parsed.favorite = True
+            elif sep and key in ('favorite', 'fav'):
+                if value.lower() not in ('yes', 'no', 'true', 'false'):
+                    raise QueryError(f"Expected yes or no: {term}")
+                parsed.favorite = value.lower() in ('yes', 'true')
+            else:
+                words.append(term)
+        parsed.text = " ".join(words)
+        return parsed
+
+
+def _parse_category(value: str) -> str:
+    """Canonical category value for a case-insensitive category name."""
+    for category in Category:
+        if category.value.lower() == value.strip().lower():
+            return category.value
+    raise QueryError(f"Unknown category: {value}")
+
+
+class QueryEngine(SearchIndex):
+    """SearchIndex that also answers ItemQuery predicates.
+
+    On top of the name and category bitsets it keeps an inverted index from
+    effects words to bitsets, a sorted word list for prefix lookups, a
+    favorites bitset, and one sorted (value, slot) list per numeric field.
+    A range predicate bisects its list and combines two cumulative block
+    bitsets, so it only touches the entries at the range ends; all
+    predicates are then combined by bitset intersection.
+    """
+
+    def clear(self) -> None:
+        """Remove every item."""
+        super().clear()
+        self._sorted: Dict[str, List[Tuple[float, int]]] = {}
+        self._tokens: List[str] = []
+        # Per field, bitsets of the first k * RANGE_BLOCK sorted entries
+        self._prefixes: Dict[str, List[int]] = {}
+
+    def _record(self, item: Item) -> Tuple:
+        """Category, effects words, favorite flag and numeric field values."""
+        values = {
+            'Price': item.price,
+            'Adjustment': item.adjustment,
+            'Effect Value': item.effect_value,
+            'Total Weight': item.total_weight,
+            'weight_per_1k': item.weight_per_1k,
+        }
+        values.update(
+            (stat, value) for stat, value in item.stats.items()
+            if isinstance(value, (int, float))
+        )
+        return (
+            super()._record(item)[0],
+            tuple(sorted(set(effect_tokens(item.effects)))),
+            bool(item.favorite),
+            tuple(sorted(values.items())),
+        )
+
+    def _posting_keys(self, lower: str, record: Tuple) -> Iterable[Hashable]:
+        """Name grams and category, plus effects words, favorite and present stats."""
+        yield from super()._posting_keys(lower, record)
+        for token in record[1]:
+            yield ("effect", token)
+        if record[2]:
+            yield ("favorite",)
+        for stat, _ in record[3]:
+            yield ("has", stat)
+
+    def _after_bulk_load(self) -> None:
+        """Build the sorted value lists and the word list."""
+        lists: Dict[str, List[Tuple[float, int]]] = {}
+        for slot, record in enumerate(self._records):
+            for stat, value in record[3]:
+                lists.setdefault(stat, []).append((value, slot))
+        for entries in lists.values():
+            entries.sort()
+        self._sorted = lists
+        self._prefixes = {}
+        self._tokens = sorted(key[1] for key in self._postings if key[0:1] == ("effect",))
+
+    def _after_put(self, slot: int) -> None:
+        """Insert the new slot's values and words."""
+        for stat, value in self._records[slot][3]:
+            bisect.insort(self._sorted.setdefault(stat, []), (value, slot))
+            self._prefixes.pop(stat, None)
+        for token in self._records[slot][1]:
+            index = bisect.bisect_left(self._tokens, token)
+            if index == len(self._tokens) or self._tokens[index] != token:
+                self._tokens.insert(index, token)
+
+    def _after_remove(self, slot: int) -> None:
+        """Drop the removed slot's values; stale words are harmless."""
+        for stat, value in self._records[slot][3]:
+            entries = self._sorted[stat]
+            del entries[bisect.bisect_left(entries, (value, slot))]
+            self._prefixes.pop(stat, None)
+
+    def _effect_mask(self, word: str) -> int:
+        """Items with an effects word starting with word."""
+        mask = 0
+        index = bisect.bisect_left(self._tokens, word)
+        while index < len(self._tokens) and self._tokens[index].startswith(word):
+            mask |= self._postings.get(("effect", self._tokens[index]), 0)
+            index += 1
+        return mask
+
+    def _block_prefixes(self, stat: str) -> List[int]:
+        """Cumulative bitsets of a field's sorted entries, one per block."""
+        prefixes = self._prefixes.get(stat)
+        if prefixes is None:
+            entries = self._sorted.get(stat, [])
+            size = len(self._names)
+            prefixes = [0]
+            for start in range(0, len(entries), RANGE_BLOCK):
+                block = entries[start:start + RANGE_BLOCK]
+                prefixes.append(prefixes[-1] | _mask((slot for _, slot in block), size))
+            self._prefixes[stat] = prefixes
+        return prefixes
+
+    def _range_mask(self, stat: str, op: str, value: float) -> int:
+        """Items whose stat compares to value; items without the stat count as 0."""
+        entries = self._sorted.get(stat, [])
+        low, high = 0, len(entries)
+        if op in ('>=', '='):
+            low = bisect.bisect_left(entries, (value, -1))
+        elif op == '>':
+            low = bisect.bisect_right(entries, (value, float('inf')))
+        if op in ('<=', '='):
+            high = bisect.bisect_right(entries, (value, float('inf')))
+        elif op == '<':
+            high = bisect.bisect_left(entries, (value, -1))
+        size = len(self._names)
+        if high - low <= 2 * RANGE_BLOCK:
+            mask = _mask((slot for _, slot in entries[low:high]), size)
+        else:
+            # Whole blocks come from the prefixes, the ragged ends entry by entry
+            prefixes = self._block_prefixes(stat)
+            first, last = low // RANGE_BLOCK, high // RANGE_BLOCK
+            mask = prefixes[last] ^ prefixes[first]
+            mask ^= _mask((slot for _, slot in entries[first * RANGE_BLOCK:low]), size)
+            mask |= _mask((slot for _, slot in entries[last * RANGE_BLOCK:high]), size)
+        if _compare(0, op, value):
+            mask |= self._all & ~self._postings.get(("has", stat), 0)
+        return mask
+
+    def query(self, query: Union[str, ItemQuery], categories: Optional[Iterable] = None) -> List[str]:
+        """Find items matching every predicate of a query.
+
+        Args:
+            query: Query string (see ItemQuery.parse) or parsed query
+            categories: Extra category restriction, e.g. from UI checkboxes
+
+        Returns:
+            Matching names in insertion order
+
+        Raises:
+            QueryError: If a query string cannot be parsed
+        """
+        if isinstance(query, str):
+            query = ItemQuery.parse(query)
+        if query.categories is None and query.favorite is None and not query.effects and not query.ranges:
+            # Plain name text: search() narrows the previous result as the user types
+            return self.search(query.text, categories)
+        mask = self._all
+        for allowed in (query.categories, categories):
+            if allowed is not None:
+                mask &= self._category_mask(allowed)[1]
+        if query.favorite is not None:
+            favorites = self._postings.get(("favorite",), 0)
+            mask &= favorites if query.favorite else ~favorites
+        for word in query.effects:
+            if not mask:
+                break
+            mask &= self._effect_mask(word)
+        for stat, op, value in query.ranges:
+            if not mask:
+                break
+            mask &= self._range_mask(stat, op, value)
+        names = self._names
+        return [names[slot] for slot in self._match_text(query.text.lower().strip(), mask)]
+
+
+def _compare(left: float, op: str, right: float) -> bool:
+    """Evaluate left <op> right."""
+    if op == '>=':
+        return left >= right
+    if op == '>':
+        return left > right
+    if op == '<=':
+        return left <= right
+    if op == '<':
+        return left < right
+    return left == right
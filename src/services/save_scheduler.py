@@ -0,0 +1,179 @@
+"""Background scheduler that coalesces and debounces saves."""
+import atexit
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+from src.services.file_service import FileService
+from src.utils.constants import StorageConstant
+
+# Builds the positional arguments handed to FileService.save_data:
+# (items, weights, output_weights) plus an optional journal sequence number
+SavePayload = Callable[[], Tuple]
+
+# Positional arguments handed to FileService.save_changes:
+# (items, deleted, weights, output_weights)
+PendingChanges = Tuple[Dict[str, Dict], Set[str], Dict, Dict]
+
+
+class SaveScheduler:
+    """Writes save requests for a FileService on a background thread.
+    
+    Requests are coalesced: only the most recent full save is kept, incremental
+    changes are merged into one, and the file is written at most once per
+    interval. Pending state is flushed on exit.
+    """
+
+    def __init__(self, file_service: FileService,
+                 interval_ms: int = StorageConstant.SAVE_INTERVAL_MS):
+        """Initialize the scheduler and start its worker thread.
+        
+        Args:
+            file_service: Service used to perform the actual writes
+            interval_ms: Minimum time between two writes in milliseconds
+        """
+        self.file_service = file_service
+        self.interval = interval_ms / 1000.0
+        self.writes = 0
+        self.requests = 0
+        
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending: Optional[SavePayload] = None
+        self._changes: Optional[PendingChanges] = None
+        self._last_write = 0.0
+        self._closed = False
+        
+        self._thread = threading.Thread(target=self._run, name="SaveScheduler", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def has_pending(self) -> bool:
+        """True if a full save has been requested but not written yet."""
+        with self._cond:
+            return self._pending is not None
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """True if incremental changes have been requested but not written yet."""
+        with self._cond:
+            return self._changes is not None
+
+    def schedule(self, payload: SavePayload) -> None:
+        """Request a full save; returns immediately.
+        
+        Incremental changes not written yet are dropped, since the payload
+        captures state that already contains them.
+        
+        Args:
+            payload: Callable building the data to save. It runs on the worker
+                thread, so it must only read state captured at request time.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SaveScheduler is closed")
+            self.requests += 1
+            self._pending = payload
+            self._changes = None
+            self._cond.notify()
+
+    def schedule_changes(self, items: Dict[str, Dict], deleted: Iterable[str],
+                         weights: Dict, output_weights: Dict) -> None:
+        """Request an incremental save; returns immediately.
+        
+        Changes requested before the next write are merged into a single
+        FileService.save_changes call with the latest weights.
+        
+        Args:
+            items: Items added or changed, keyed by name
+            deleted: Names of deleted items
+            weights: Copy of the weight profiles
+            output_weights: Copy of the calculated output weights
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SaveScheduler is closed")
+            self.requests += 1
+            if self._changes is None:
+                changed, removed = {}, set()
+            else:
+                changed, removed, _, _ = self._changes
+            for name in deleted:
+                changed.pop(name, None)
+                removed.add(name)
+            for name, record in items.items():
+                removed.discard(name)
+                changed[name] = record
+            self._changes = (changed, removed, weights, output_weights)
+            self._cond.notify()
+
+    def flush(self) -> bool:
+        """Write any pending save on the calling thread.
+        
+        Returns:
+            bool: True if nothing was pending or the write succeeded
+        """
+        return self._write_pending()
+
+    def close(self) -> None:
+        """Flush pending state and stop the worker thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        """Worker loop: wait for requests and write them no faster than the interval."""
+        while True:
+            with self._cond:
+                while self._pending is None and self._changes is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                delay = self._last_write + self.interval - time.monotonic()
+                if delay > 0:
+                    # Let more requests coalesce before writing
+                    self._cond.wait(delay)
+                    continue
+            self._write_pending()
+
+    def _write_pending(self) -> bool:
+        """Write the pending full save, then the pending changes.
+        
+        Requests are taken and written under one lock, so writes reach the
+        file service in the order they were requested.
+        
+        Returns:
+            bool: True if nothing was pending or every write succeeded
+        """
+        with self._write_lock:
+            with self._cond:
+                payload, changes = self._pending, self._changes
+                self._pending = self._changes = None
+            success = True
+            if payload is not None:
+                success = self._write(lambda: self.file_service.save_data(*payload()))
+            if changes is not None:
+                success = self._write(lambda: self.file_service.save_changes(*changes)) and success
+            return success
+
+    def _write(self, write: Callable[[], bool]) -> bool:
+        """Run one write on the file service.
+        
+        Args:
+            write: Callable performing the write
+            
+        Returns:
+            bool: True if the write succeeded
+        """
+        try:
+            success = write()
+        except Exception as e:
+            print(f"Error in background save: {e}")
+            success = False
+        self._last_write = time.monotonic()
+        self.writes += 1
+        return success
@@ -0,0 +1,241 @@
+"""In-memory name and category index for fast item filtering."""
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+from src.models.item import Item
+
+# Longest n-gram indexed; longer queries intersect their trigrams
+GRAM_SIZE = 3
+
+
+def _grams(text: str) -> Iterator[str]:
+    """Yield every substring of text of length 1 to GRAM_SIZE."""
+    for size in range(1, GRAM_SIZE + 1):
+        for start in range(len(text) - size + 1):
+            yield text[start:start + size]
+
+
+def _query_grams(query: str) -> List[str]:
+    """Grams whose postings must all contain a match for query."""
+    if len(query) <= GRAM_SIZE:
+        return [query]
+    return [query[start:start + GRAM_SIZE] for start in range(len(query) - GRAM_SIZE + 1)]
+
+
+def _category_key(category) -> str:
+    """Category value, whether given as a Category or a plain string."""
+    return getattr(category, "value", category)
+
+
+class SearchIndex:
+    """Substring and category index over item names.
+
+    Every item gets a slot number; postings are stored as Python int bitsets
+    over the slots, so a query is a few bitwise ANDs followed by a substring
+    check of the remaining candidates only. When a query extends the
+    previous one, only the previous matches are considered.
+
+    Each item is reduced to a record tuple whose first field is its category;
+    subclasses index more fields through _record, _posting_keys and the
+    _after_* hooks.
+    """
+
+    def __init__(self, items: Optional[Dict[str, Item]] = None):
+        """Build the index.
+
+        Args:
+            items: Items to index, if any
+        """
+        self.clear()
+        if items:
+            self._bulk_load((name, self._record(item)) for name, item in items.items())
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self._names: List[Optional[str]] = []
+        self._lower: List[str] = []
+        self._records: List[Tuple] = []
+        self._slots: Dict[str, int] = {}
+        # Name grams are plain strings; other keys are tuples, see _posting_keys
+        self._postings: Dict[Hashable, int] = {}
+        self._all = 0
+        # Previous query, its category keys and its matching slots
+        self._last: Optional[Tuple[str, Optional[Tuple[str, ...]], List[int]]] = None
+
+    def _record(self, item: Item) -> Tuple:
+        """Indexed fields of an item; the first one is its category."""
+        return (_category_key(item.category),)
+
+    def _posting_keys(self, lower: str, record: Tuple) -> Iterable[Hashable]:
+        """Bitset keys an item with this lowercased name and record belongs to."""
+        yield from set(_grams(lower))
+        yield ("category", record[0])
+
+    def _bulk_load(self, entries: Iterable[Tuple[str, Tuple]]) -> None:
+        """Index many (name, record) pairs into an empty index at once.
+
+        Postings are collected as slot lists and converted to bitsets once,
+        instead of growing a large int per item.
+        """
+        postings: Dict[Hashable, List[int]] = {}
+        for slot, (name, record) in enumerate(entries):
+            lower = name.lower()
+            self._names.append(name)
+            self._lower.append(lower)
+            self._records.append(record)
+            self._slots[name] = slot
+            for key in self._posting_keys(lower, record):
+                postings.setdefault(key, []).append(slot)
+        size = len(self._names)
+        self._postings = {key: _mask(slots, size) for key, slots in postings.items()}
+        self._all = (1 << size) - 1
+        self._after_bulk_load()
+
+    def _after_bulk_load(self) -> None:
+        """Hook run after _bulk_load."""
+
+    def _after_put(self, slot: int) -> None:
+        """Hook run after an item was added at slot."""
+
+    def _after_remove(self, slot: int) -> None:
+        """Hook run after the item at slot was removed."""
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def put(self, name: str, item: Item) -> None:
+        """Add an item, or re-index it after a change.
+
+        Args:
+            name: Item name
+            item: Item to index
+        """
+        record = self._record(item)
+        slot = self._slots.get(name)
+        if slot is not None:
+            # Re-index in place, so the item keeps its position in results
+            old = self._records[slot]
+            if old == record:
+                return
+            bit = 1 << slot
+            lower = self._lower[slot]
+            old_keys = set(self._posting_keys(lower, old))
+            new_keys = set(self._posting_keys(lower, record))
+            self._after_remove(slot)
+            for key in old_keys - new_keys:
+                self._postings[key] &= ~bit
+            self._records[slot] = record
+            for key in new_keys - old_keys:
+                self._postings[key] = self._postings.get(key, 0) | bit
+            self._last = None
+            self._after_put(slot)
+            return
+
+        slot = len(self._names)
+        bit = 1 << slot
+        lower = name.lower()
+        self._names.append(name)
+        self._lower.append(lower)
+        self._records.append(record)
+        self._slots[name] = slot
+        for key in self._posting_keys(lower, record):
+            self._postings[key] = self._postings.get(key, 0) | bit
+        self._all |= bit
+        self._last = None
+        self._after_put(slot)
+
+    def remove(self, name: str) -> None:
+        """Remove an item if present.
+
+        Args:
+            name: Item name
+        """
+        slot = self._slots.pop(name, None)
+        if slot is None:
+            return
+        # Postings keep the stale bit; masking with _all hides it
+        self._names[slot] = None
+        self._all &= ~(1 << slot)
+        self._last = None
+        self._after_remove(slot)
+        if len(self._names) > 2 * len(self._slots) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild the postings without the slots of removed items."""
+        live = [
+            (name, self._records[slot])
+            for name, slot in sorted(self._slots.items(), key=lambda entry: entry[1])
+        ]
+        self.clear()
+        self._bulk_load(live)
+
+    def _category_mask(self, categories: Iterable) -> Tuple[Tuple[str, ...], int]:
+        """Normalized category keys and the bitset of items in any of them."""
+        keys = tuple(sorted({_category_key(category) for category in categories}))
+        mask = 0
+        for key in keys:
+            mask |= self._postings.get(("category", key), 0)
+        return keys, mask
+
+    def _match_text(self, query: str, mask: int) -> List[int]:
+        """Slots within mask whose lowercased name contains query."""
+        for gram in _query_grams(query) if query else ():
+            mask &= self._postings.get(gram, 0)
+            if not mask:
+                break
+        slots = _bits(mask)
+        if len(query) > GRAM_SIZE:
+            # Trigrams can match out of order, so check the candidates
+            lower = self._lower
+            slots = [slot for slot in slots if query in lower[slot]]
+        return slots
+
+    def search(self, text: str = "", categories: Optional[Iterable] = None) -> List[str]:
+        """Find items whose name contains text, case-insensitively.
+
+        Args:
+            text: Text to search for; empty matches everything
+            categories: Categories to include, or None for all
+
+        Returns:
+            Matching names in insertion order
+        """
+        query = text.lower().strip()
+        mask = self._all
+        keys = None
+        if categories is not None:
+            keys, category_mask = self._category_mask(categories)
+            mask &= category_mask
+
+        last = self._last
+        if query and last is not None and last[1] == keys and last[0] in query:
+            # Extending a query can only narrow its result
+            lower = self._lower
+            slots = [slot for slot in last[2] if query in lower[slot]]
+        else:
+            slots = self._match_text(query, mask)
+        self._last = (query, keys, slots)
+        names = self._names
+        return [names[slot] for slot in slots]
+
+
+# Set bit positions of every byte value
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def _mask(slots: Iterable[int], size: int) -> int:
+    """Build a bitset with the given bits set."""
+    data = bytearray((size + 7) // 8)
+    for slot in slots:
+        data[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(data, "little")
+
+
+def _bits(mask: int) -> List[int]:
+    """Positions of the set bits of mask in increasing order."""
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    positions = []
+    for index, value in enumerate(data):
+        if value:
+            base = index * 8
+            positions.extend(base + bit for bit in _BYTE_BITS[value])
+    return positions
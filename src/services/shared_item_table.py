@@ -0,0 +1,324 @@
+"""Publish the columnar item table in shared memory for worker processes.
+
+The owner writes each catalog version into a new data segment and points
+a small control segment at it. Workers attach to the control segment
+once, map the data segment without copying, and check the control
+segment's version before each task to pick up a newer catalog.
+
+Control segment: magic, layout version, catalog version, data segment name.
+The owner zeroes the version, writes the name, then writes the version
+last; readers accept a name only if the version read before and after it
+is the same nonzero value.
+Data segment: a header (magic, layout version, catalog version, item and
+stat counts), then the offset and length of each section, then the
+sections: string lists as offsets plus a UTF-8 blob, and numeric columns
+as typed arrays. Missing stats are NaN in the row-major stat matrix.
+"""
+import math
+import struct
+import time
+from array import array
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+from src.models.category import Category
+from src.models.item import Item
+from src.models.item_table import ItemTable
+
+LAYOUT_VERSION = 1
+
+_CONTROL = struct.Struct("<4sIQ64s")
+# The catalog version field of the control segment
+_CONTROL_VERSION = struct.Struct("<Q")
+_CONTROL_VERSION_OFFSET = 8
+_CONTROL_MAGIC = b"OWIC"
+# The data segment name field of the control segment
+_CONTROL_NAME = struct.Struct("<64s")
+_CONTROL_NAME_OFFSET = 16
+# Seconds a reader waits for a publish in progress, and between its checks
+PUBLISH_TIMEOUT = 5.0
+_RETRY_INTERVAL = 0.001
+_HEADER = struct.Struct("<4sIQII")
+_DATA_MAGIC = b"OWIT"
+_SECTION = struct.Struct("<QQ")
+# Section name and array typecode, in layout order
+_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("name_offsets", "q"), ("names", "B"),
+    ("category_offsets", "q"), ("categories", "B"),
+    ("stat_name_offsets", "q"), ("stat_names", "B"),
+    ("prices", "q"), ("adjustments", "q"), ("effect_values", "q"),
+    ("total_weights", "d"), ("stat_matrix", "d"),
+)
+# Offsets section of each string-list section
+_OFFSETS = {"names": "name_offsets", "categories": "category_offsets", "stat_names": "stat_name_offsets"}
+_CATEGORIES = {category.value: category for category in Category}
+
+
+def _encode_strings(strings: List[str]) -> Tuple[array, bytes]:
+    """Offsets and UTF-8 blob of a list of strings."""
+    offsets, blob = array("q", [0]), bytearray()
+    for string in strings:
+        blob += string.encode("utf-8")
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without registering it for cleanup.
+
+    The owner unlinks its segments; a worker's resource tracker must not.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no track argument
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedItemTable:
+    """Owner side: publishes catalog versions into shared memory."""
+
+    def __init__(self):
+        """Create the control segment; nothing is published yet."""
+        self._control = shared_memory.SharedMemory(create=True, size=_CONTROL.size)
+        _CONTROL.pack_into(self._control.buf, 0, _CONTROL_MAGIC, LAYOUT_VERSION, 0, b"")
+        self._data: Optional[shared_memory.SharedMemory] = None
+        self.version = 0
+
+    @property
+    def name(self) -> str:
+        """Name of the control segment, for SharedItemView."""
+        return self._control.name
+
+    def publish(self, table: ItemTable, version: int) -> int:
+        """Write a catalog version and point workers at it.
+
+        Args:
+            table: Items to publish
+            version: Catalog version, e.g. CatalogSnapshot.version; must be
+                positive and change whenever the items change
+
+        Returns:
+            Size of the data segment in bytes
+        """
+        if version <= 0:
+            raise ValueError("version must be positive")
+        stat_names = table.stat_names()
+        columns: Dict[str, object] = {}
+        columns["name_offsets"], columns["names"] = _encode_strings(table.names)
+        columns["category_offsets"], columns["categories"] = _encode_strings(table.categories)
+        columns["stat_name_offsets"], columns["stat_names"] = _encode_strings(stat_names)
+        columns["prices"] = table.prices
+        columns["adjustments"] = table.adjustments
+        columns["effect_values"] = table.effect_values
+        columns["total_weights"] = table.total_weights
+        columns["stat_matrix"] = table.stat_matrix(stat_names)
+
+        # Sections start 8-byte aligned after the header and section table
+        position = _HEADER.size + _SECTION.size * len(_SECTIONS)
+        placed = []
+        for name, _ in _SECTIONS:
+            column = columns[name]
+            data = column if isinstance(column, bytes) else column.tobytes()
+            position = (position + 7) & ~7
+            placed.append((position, data))
+            position += len(data)
+
+        segment = shared_memory.SharedMemory(create=True, size=max(position, 1))
+        _HEADER.pack_into(segment.buf, 0, _DATA_MAGIC, LAYOUT_VERSION, version,
+                          len(table), len(stat_names))
+        for index, (offset, data) in enumerate(placed):
+            _SECTION.pack_into(segment.buf, _HEADER.size + _SECTION.size * index, offset, len(data))
+            segment.buf[offset:offset + len(data)] = data
+
+        # Version 0 marks the update in progress; the version is written last
+        buf = self._control.buf
+        _CONTROL_VERSION.pack_into(buf, _CONTROL_VERSION_OFFSET, 0)
+        _CONTROL_NAME.pack_into(buf, _CONTROL_NAME_OFFSET, segment.name.encode("ascii"))
+        _CONTROL_VERSION.pack_into(buf, _CONTROL_VERSION_OFFSET, version)
+
+        # Workers that mapped the old segment keep their mapping
+        self._release_data()
+        self._data = segment
+        self.version = version
+        return position
+
+    def _release_data(self) -> None:
+        """Close and unlink the current data segment."""
+        if self._data is not None:
+            self._data.close()
+            self._data.unlink()
+            self._data = None
+
+    def close(self) -> None:
+        """Unlink all segments; attached workers keep their mappings."""
+        self._release_data()
+        if self._control is not None:
+            self._control.close()
+            self._control.unlink()
+            self._control = None
+
+
+class SharedItemView:
+    """Worker side: zero-copy access to the published item table.
+
+    Numeric columns are memoryviews over the shared segment. Strings are
+    decoded on access, and the names list once per version.
+    """
+
+    def __init__(self, name: str):
+        """Attach to the control segment and map the current version.
+
+        Args:
+            name: SharedItemTable.name of the owner
+        """
+        self._control = _attach(name)
+        magic, layout, _, _ = _CONTROL.unpack_from(self._control.buf, 0)
+        if magic != _CONTROL_MAGIC or layout != LAYOUT_VERSION:
+            self._control.close()
+            raise ValueError(f"Shared memory {name} is not an item table of layout {LAYOUT_VERSION}")
+        self._data: Optional[shared_memory.SharedMemory] = None
+        self._views: Dict[str, memoryview] = {}
+        # Section slices of the segment, the bases of the cast views
+        self._slices: List[memoryview] = []
+        self._names: Optional[List[str]] = None
+        self.version = 0
+        self.item_count = 0
+        self.stat_count = 0
+        if not self.refresh():
+            raise ValueError(f"Nothing published in shared memory {name}")
+
+    def _version(self) -> int:
+        """Catalog version field of the control segment."""
+        return _CONTROL_VERSION.unpack_from(self._control.buf, _CONTROL_VERSION_OFFSET)[0]
+
+    def _published(self, deadline: float) -> Tuple[int, str]:
+        """Consistent (version, data segment name) from the control segment.
+
+        Args:
+            deadline: time.monotonic() after which to give up on a publish
+                in progress
+
+        Returns:
+            (0, "") if nothing was published yet
+        """
+        while True:
+            version = self._version()
+            name = _CONTROL_NAME.unpack_from(self._control.buf, _CONTROL_NAME_OFFSET)[0].rstrip(b"\0")
+            if version == 0 and not name:
+                return 0, ""
+            if version != 0 and self._version() == version:
+                return version, name.decode("ascii")
+            self._wait(deadline)
+
+    @staticmethod
+    def _wait(deadline: float) -> None:
+        """Sleep before a retry, or raise once the deadline passed."""
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Shared item table not published within {PUBLISH_TIMEOUT}s")
+        time.sleep(_RETRY_INTERVAL)
+
+    def refresh(self) -> bool:
+        """Map the latest version if it changed; cheap when it did not.
+
+        Returns:
+            True if a new version was mapped
+        """
+        # Fast path: one read of the version field
+        if self._version() == self.version:
+            return False
+        deadline = time.monotonic() + PUBLISH_TIMEOUT
+        while True:
+            version, name = self._published(deadline)
+            if version in (0, self.version):
+                return False
+            try:
+                segment = _attach(name)
+                break
+            except FileNotFoundError:
+                self._wait(deadline)  # Replaced by a newer version while reading
+        magic, layout, data_version, items, stats = _HEADER.unpack_from(segment.buf, 0)
+        if magic != _DATA_MAGIC or layout != LAYOUT_VERSION or data_version != version:
+            segment.close()
+            raise ValueError(f"Shared memory {name} does not hold catalog version {version}")
+
+        self._release_data()
+        self._data = segment
+        for index, (section, typecode) in enumerate(_SECTIONS):
+            offset, length = _SECTION.unpack_from(segment.buf, _HEADER.size + _SECTION.size * index)
+            self._slices.append(segment.buf[offset:offset + length])
+            self._views[section] = self._slices[-1].cast(typecode)
+        self.version, self.item_count, self.stat_count = version, items, stats
+        self._names = None
+        return True
+
+    def _string(self, section: str, index: int) -> str:
+        """String at index of a string-list section."""
+        offsets = self._views[_OFFSETS[section]]
+        blob = self._views[section]
+        return bytes(blob[offsets[index]:offsets[index + 1]]).decode("utf-8")
+
+    @property
+    def names(self) -> List[str]:
+        """Item names, in table order."""
+        if self._names is None:
+            self._names = [self._string("names", i) for i in range(self.item_count)]
+        return self._names
+
+    @property
+    def stat_names(self) -> List[str]:
+        """Stat columns of the stat matrix."""
+        return [self._string("stat_names", i) for i in range(self.stat_count)]
+
+    def column(self, section: str) -> memoryview:
+        """Zero-copy numeric column, e.g. "prices" or "stat_matrix".
+
+        Args:
+            section: Section name
+
+        Returns:
+            memoryview of the shared data
+        """
+        return self._views[section]
+
+    def to_items(self) -> Dict[str, Item]:
+        """Build Item objects for the optimizer.
+
+        Returns:
+            Dictionary of item name to Item, in table order; effects text
+            and favorites are not published and stay empty
+        """
+        stat_names = self.stat_names
+        width = len(stat_names)
+        prices = self._views["prices"]
+        adjustments = self._views["adjustments"]
+        effect_values = self._views["effect_values"]
+        total_weights = self._views["total_weights"]
+        matrix = self._views["stat_matrix"]
+        items = {}
+        for row, name in enumerate(self.names):
+            stats = {}
+            for column, stat in enumerate(stat_names):
+                value = matrix[row * width + column]
+                if not math.isnan(value):
+                    stats[stat] = int(value) if value.is_integer() else value
+            category = _CATEGORIES[self._string("categories", row)]
+            items[name] = Item(name, prices[row], adjustments[row], effect_values[row],
+                               category=category, total_weight=total_weights[row], stats=stats)
+        return items
+
+    def _release_data(self) -> None:
+        """Drop the views and unmap the data segment."""
+        # Every export must be released before the segment can close
+        for view in list(self._views.values()) + self._slices:
+            view.release()
+        self._views, self._slices = {}, []
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+
+    def close(self) -> None:
+        """Detach from the shared table."""
+        self._release_data()
+        if self._control is not None:
+            self._control.close()
+            self._control = None
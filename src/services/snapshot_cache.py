@@ -0,0 +1,73 @@
+"""Binary cache of the fully loaded catalog for fast startup."""
+import marshal
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# (mtime_ns, size, content hash) of each source file
+SourceSignature = Tuple[Tuple[int, int, str], ...]
+
+
+class SnapshotCache:
+    """Stores the post-load catalog state in a marshal file.
+    
+    An entry is only used if the signature of the source files (mtime, size
+    and content hash) matches the one recorded when the entry was written.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_path: str):
+        """Initialize the cache.
+        
+        Args:
+            cache_path: Path of the cache file
+        """
+        self.cache_path = Path(cache_path)
+
+    def load(self, signature: Optional[SourceSignature]) -> Optional[Dict]:
+        """Load the cached state if it was built from the same sources.
+        
+        Args:
+            signature: Signature of the current source files
+            
+        Returns:
+            Cached state, or None on a miss
+        """
+        if signature is None or not os.path.exists(self.cache_path):
+            return None
+        try:
+            # One read plus loads is much faster than marshal.load on a file object
+            with open(self.cache_path, 'rb') as f:
+                entry = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            print(f"Ignoring unreadable snapshot cache: {e}")
+            return None
+        if not isinstance(entry, dict) or entry.get('version') != self.FORMAT_VERSION:
+            return None
+        if tuple(tuple(source) for source in entry.get('signature', ())) != signature:
+            return None
+        return entry.get('state')
+
+    def store(self, signature: Optional[SourceSignature], state: Dict) -> bool:
+        """Write state for the given source signature.
+        
+        Args:
+            signature: Signature of the source files the state was built from
+            state: Marshal-friendly state to cache
+            
+        Returns:
+            bool: True if the cache was written
+        """
+        if signature is None:
+            return False
+        entry = {'version': self.FORMAT_VERSION, 'signature': signature, 'state': state}
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(marshal.dumps(entry))
+            os.replace(tmp_path, self.cache_path)
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Error writing snapshot cache: {e}")
+            return False
@@ -0,0 +1,243 @@
+"""SQLite storage backend with the same contract as FileService."""
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.models.category import Category
+from src.services.file_service import FileService
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    name TEXT PRIMARY KEY,
+    name_lower TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_category ON items(category);
+CREATE INDEX IF NOT EXISTS idx_items_price ON items(price);
+-- Name search is a substring match, which no index serves; databases
+-- created with this index only paid for it on writes
+DROP INDEX IF EXISTS idx_items_name_lower;
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class SqliteFileService(FileService):
+    """Stores items, weight profiles and output weights in a SQLite database.
+    
+    Items are stored one row each, so single-item changes are upserts
+    instead of a full rewrite, and category/name filters can run in SQL.
+    """
+
+    def __init__(self, file_path: str = None):
+        """Initialize the service and create the schema if needed.
+        
+        Args:
+            file_path: Path of the database file; defaults to items.db in src/
+        """
+        if file_path is None:
+            repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            file_path = os.path.join(repo_root, "items.db")
+        super().__init__(file_path)
+        # Saves may run on the background scheduler thread
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.file_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def supports_incremental(self) -> bool:
+        """Item changes are always written as per-row upserts."""
+        return True
+
+    @property
+    def needs_compaction(self) -> bool:
+        """The database never needs a full rewrite."""
+        return False
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """Every change is committed immediately."""
+        return False
+
+    def source_signature(self) -> None:
+        """Database content is not cached; loading it is already cheap."""
+        return None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def load_data(self) -> Tuple[Dict, Dict, Dict]:
+        """Load items and weights from the database.
+        
+        Returns:
+            Tuple containing (items_dict, weights_dict, output_weights)
+        """
+        try:
+            with self._lock:
+                item_rows = self._conn.execute(
+                    "SELECT name, data FROM items ORDER BY rowid").fetchall()
+                profile_rows = self._conn.execute(
+                    "SELECT name, data FROM profiles ORDER BY position").fetchall()
+                meta_row = self._conn.execute(
+                    "SELECT value FROM meta WHERE key = 'output_weights'").fetchone()
+        except sqlite3.Error as e:
+            print(f"Error loading data: {e}")
+            item_rows, profile_rows, meta_row = [], [], None
+        
+        items = {name: json.loads(data) for name, data in item_rows}
+        weights = {name: json.loads(data) for name, data in profile_rows}
+        output_weights = json.loads(meta_row[0]) if meta_row else {}
+        
+        if 'Base Weights' not in weights:
+            weights = {"Base Weights": self._create_default_weights(), **weights}
+        if not output_weights:
+            output_weights = weights["Base Weights"].copy()
+        return items, weights, output_weights
+
+    def save_data(self, items: Dict, weights: Dict, output_weights: Dict,
+                  journal_seq: Optional[int] = None) -> bool:
+        """Replace all stored data.
+        
+        Args:
+            items: Dictionary of items
+            weights: Dictionary of weight profiles
+            output_weights: Dictionary of calculated output weights
+            journal_seq: Unused; accepted for FileService compatibility
+            
+        Returns:
+            bool: True if save was successful, False otherwise
+        """
+        try:
+            with self._lock, self._conn:
+                existing = {row[0] for row in self._conn.execute("SELECT name FROM items")}
+                self._conn.executemany(
+                    "DELETE FROM items WHERE name = ?",
+                    [(name,) for name in existing - items.keys()])
+                self._upsert_items(items)
+                self._replace_weights(weights, output_weights)
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving data: {e}")
+            return False
+
+    def save_changes(self, items: Dict, deleted: Iterable[str],
+                     weights: Dict, output_weights: Dict) -> bool:
+        """Upsert changed items and delete removed ones in one transaction.
+        
+        Args:
+            items: Items added or changed, keyed by name
+            deleted: Names of deleted items
+            weights: Dictionary of weight profiles
+            output_weights: Dictionary of calculated output weights
+            
+        Returns:
+            bool: True if the change was written, False otherwise
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "DELETE FROM items WHERE name = ?", [(name,) for name in deleted])
+                self._upsert_items(items)
+                self._replace_weights(weights, output_weights)
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving changes: {e}")
+            return False
+
+    def upsert_item(self, name: str, data: Dict) -> bool:
+        """Insert or replace a single item.
+        
+        Args:
+            name: Item name
+            data: Item dictionary as produced by Item.to_dict
+            
+        Returns:
+            bool: True if the item was written
+        """
+        try:
+            with self._lock, self._conn:
+                self._upsert_items({name: data})
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving item {name}: {e}")
+            return False
+
+    def query_item_names(
+        self,
+        search_text: str = "",
+        categories: Optional[List[Category]] = None
+    ) -> List[str]:
+        """Find item names matching a name substring and categories.
+        
+        Args:
+            search_text: Case-insensitive substring of the item name
+            categories: List of categories to include, or None for all
+            
+        Returns:
+            List of matching item names in insertion order
+        """
+        if categories is not None and not categories:
+            return []
+        clauses, params = [], []
+        search_text = search_text.lower().strip()
+        if search_text:
+            clauses.append("instr(name_lower, ?) > 0")
+            params.append(search_text)
+        if categories is not None:
+            clauses.append(f"category IN ({', '.join('?' for _ in categories)})")
+            params.extend(Category(c).value for c in categories)
+        sql = "SELECT name FROM items"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY rowid"
+        with self._lock:
+            return [row[0] for row in self._conn.execute(sql, params)]
+
+    def import_from(self, file_service: FileService) -> bool:
+        """Copy all data from another file service, e.g. an existing items.json.
+        
+        Args:
+            file_service: Service to load the data from
+            
+        Returns:
+            bool: True if the data was written
+        """
+        return self.save_data(*file_service.load_data())
+
+    def _upsert_items(self, items: Dict) -> None:
+        """Upsert item rows; the caller holds the lock and transaction."""
+        self._conn.executemany(
+            "INSERT INTO items (name, name_lower, price, category, data) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET name_lower = excluded.name_lower, "
+            "price = excluded.price, category = excluded.category, data = excluded.data",
+            [
+                (name, name.lower(), data.get('Price', 0),
+                 data.get('Category', Category.NONE.value), json.dumps(data))
+                for name, data in items.items()
+            ])
+
+    def _replace_weights(self, weights: Dict, output_weights: Dict) -> None:
+        """Replace weight profiles and output weights; the caller holds the lock and transaction."""
+        self._conn.execute("DELETE FROM profiles")
+        self._conn.executemany(
+            "INSERT INTO profiles (name, position, data) VALUES (?, ?, ?)",
+            [(name, position, json.dumps(profile))
+             for position, (name, profile) in enumerate(weights.items())])
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('output_weights', ?)",
+            (json.dumps(output_weights),))
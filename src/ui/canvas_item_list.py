@@ -0,0 +1,150 @@
+"""Item list that draws its cards directly on a canvas."""
+import tkinter as tk
+from typing import Callable, Dict, Optional
+from src.models.item import Item
+from src.ui.item_list import ItemList
+from src.utils.constants import UIConstant, Style
+
+CARD_FONT = ("Arial", 9)
+NAME_FONT = ("Arial", 10, "bold")
+EDIT_BUTTON_WIDTH = 54
+# Effects text is cut so it cannot run into the next row
+MAX_EFFECTS_CHARS = 90
+
+
+class CanvasCard:
+    """One card made of canvas rectangle and text items.
+
+    All items of a card share the tag ``card<N>``, so the card is moved,
+    shown or hidden with a single tag operation, and rebinding only
+    reconfigures the texts that changed.
+    """
+
+    def __init__(self, canvas: tk.Canvas, number: int):
+        """Draw the card's items once, hidden at the origin.
+
+        Args:
+            canvas: Canvas to draw on
+            number: Unique card number, used for the tag
+        """
+        self.canvas = canvas
+        self.tag = f"card{number}"
+        self.name: Optional[str] = None
+        self.x = 0
+        self.y = 0
+        self._texts: Dict[str, str] = {}
+
+        tags = (self.tag, "card")
+        width = UIConstant.CARD_WIDTH
+        text_width = width - 16
+        create_text = lambda x, y, **kw: canvas.create_text(
+            x, y, anchor="nw", fill=Style.FG_MAIN, font=CARD_FONT,
+            state=tk.HIDDEN, tags=tags, **kw)
+
+        self.background = canvas.create_rectangle(
+            0, 0, width, UIConstant.CARD_HEIGHT, fill=Style.BG_DARK,
+            outline=Style.BORDER, state=tk.HIDDEN, tags=tags)
+        self.items = {
+            'name': create_text(8, 6, font=NAME_FONT, width=width - EDIT_BUTTON_WIDTH - 16),
+            'stats': create_text(8, 30),
+            'efficiency': create_text(8, 48),
+            'status': create_text(8, 66),
+            'effects': create_text(8, 86, width=text_width),
+            'optional': create_text(8, 118, width=text_width),
+        }
+        edit_tags = tags + ("edit",)
+        self.edit_button = canvas.create_rectangle(
+            width - EDIT_BUTTON_WIDTH - 6, 4, width - 6, 26, fill=Style.BG_LIGHTER,
+            outline="", state=tk.HIDDEN, tags=edit_tags)
+        self.edit_label = canvas.create_text(
+            width - EDIT_BUTTON_WIDTH // 2 - 6, 15, text="Edit", fill=Style.FG_MAIN,
+            font=CARD_FONT, state=tk.HIDDEN, tags=edit_tags)
+
+    def bind_item(self, name: str, item: Item):
+        """Show an item on this card, updating only texts that changed.
+
+        Args:
+            name: Item name
+            item: Item to show
+        """
+        self.name = name
+        status_text = f"{item.category}"
+        if item.favorite:
+            status_text += " ★"
+        effects = item.effects.strip()
+        if len(effects) > MAX_EFFECTS_CHARS:
+            effects = effects[:MAX_EFFECTS_CHARS - 1] + "…"
+        optional_text = ", ".join(
+            f"{field}: {value}" for field, value in item.stats.items() if value > 0)
+
+        texts = {
+            'name': name,
+            'stats': f"P: {item.price}   A: {item.adjustment}   W: {item.total_weight:.1f}",
+            'efficiency': f"W/kP: {item.weight_per_1k:.1f}",
+            'status': status_text,
+            'effects': effects,
+            'optional': optional_text,
+        }
+        for key, text in texts.items():
+            if self._texts.get(key) != text:
+                self.canvas.itemconfigure(self.items[key], text=text)
+        self._texts = texts
+
+    def place(self, x: int, y: int):
+        """Move the card's top left corner to (x, y) and show it."""
+        if (x, y) != (self.x, self.y):
+            self.canvas.move(self.tag, x - self.x, y - self.y)
+            self.x, self.y = x, y
+        self.canvas.itemconfigure(self.tag, state=tk.NORMAL)
+
+    def hide(self):
+        """Hide the card."""
+        self.canvas.itemconfigure(self.tag, state=tk.HIDDEN)
+
+
+class CanvasItemList(ItemList):
+    """ItemList whose cards are drawn as canvas items instead of widgets.
+
+    Layout, virtualization, sorting and the update API are inherited from
+    ItemList; a card costs a handful of canvas items instead of a tree of
+    frames and labels, and the Edit action is found by hit-testing.
+    """
+
+    def __init__(self, parent: tk.Widget, on_edit: Callable[[str], None]):
+        """Initialize the item list.
+
+        Args:
+            parent: Parent widget
+            on_edit: Callback for when an item is selected for editing
+        """
+        self._cards_by_tag: Dict[str, CanvasCard] = {}
+        super().__init__(parent, on_edit)
+
+    def _setup_ui(self):
+        """Set up the canvas and the Edit hit-testing."""
+        super()._setup_ui()
+        self.canvas.tag_bind("edit", "<Button-1>", self._on_edit_click)
+        self.canvas.tag_bind("edit", "<Enter>", lambda event: self.canvas.config(cursor="hand2"))
+        self.canvas.tag_bind("edit", "<Leave>", lambda event: self.canvas.config(cursor=""))
+
+    def _create_card(self) -> CanvasCard:
+        """Draw a new, hidden card."""
+        card = CanvasCard(self.canvas, len(self._cards_by_tag))
+        self._cards_by_tag[card.tag] = card
+        return card
+
+    def _show_card(self, card: CanvasCard, x: int, y: int):
+        """Place a card with its top left corner at (x, y) and show it."""
+        card.place(x, y)
+
+    def _hide_card(self, card: CanvasCard):
+        """Hide a card that scrolled out of view."""
+        card.hide()
+
+    def _on_edit_click(self, event):
+        """Open the editor for the card whose Edit button was clicked."""
+        for tag in self.canvas.gettags(tk.CURRENT):
+            card = self._cards_by_tag.get(tag)
+            if card is not None and card.name:
+                self.on_edit(card.name)
+                return
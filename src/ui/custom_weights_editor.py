@@ -1,7 +1,7 @@
 """Custom weights editor component for creating and editing weight profiles."""
 import tkinter as tk
 from typing import Dict, Callable, Optional
-from ui.weight_sidebar import WeightSidebar
+from src.ui.weight_sidebar import WeightSidebar
 
 class CustomWeightsEditor(tk.Frame):
     """Dialog for creating and editing custom weight profiles."""
@@ -10,7 +10,8 @@ class CustomWeightsEditor(tk.Frame):
                  profile_name: str, 
                  weights: Dict[str, float],
                  on_save: Callable[[str, Dict[str, float]], None],
-                 on_delete: Optional[Callable[[str], None]] = None):
+                 on_delete: Optional[Callable[[str], None]] = None,
+                 on_close: Optional[Callable[[], None]] = None):
         """Initialize the custom weights editor.
         
         Args:
@@ -19,16 +20,16 @@ class CustomWeightsEditor(tk.Frame):
             weights: Initial weights dictionary
             on_save: Callback for saving weights (receives name and weights dict)
             on_delete: Optional callback for deleting a profile
+            on_close: Callback that closes the dialog; destroys the parent
+                by default
         """
         super().__init__(parent)
         self.parent = parent
-        self.profile_name = profile_name
-        self.initial_weights = weights
         self.on_save = on_save
-        self.on_delete = on_delete
-        self.is_new = not profile_name
+        self.on_close = on_close or parent.destroy
         
         self._setup_ui()
+        self.load(profile_name, weights, on_delete)
         
     def _setup_ui(self):
         """Set up the UI components."""
@@ -39,8 +40,6 @@ class CustomWeightsEditor(tk.Frame):
         tk.Label(top_frame, text="Profile Name:").pack(side=tk.LEFT, padx=(0, 5))
         self.name_entry = tk.Entry(top_frame, width=30)
         self.name_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        if self.profile_name:
-            self.name_entry.insert(0, self.profile_name)
         
         # Scale factor section - Min and Max entries
         scale_frame = tk.Frame(self)
@@ -52,7 +51,6 @@ class CustomWeightsEditor(tk.Frame):
         tk.Label(min_frame, text="Min:").pack(side=tk.LEFT, padx=(0, 5))
         self.min_entry = tk.Entry(min_frame, width=8)
         self.min_entry.pack(side=tk.LEFT)
-        self.min_entry.insert(0, "0.1")  # Default min value
         
         # Max Entry
         max_frame = tk.Frame(scale_frame)
@@ -60,43 +58,63 @@ class CustomWeightsEditor(tk.Frame):
         tk.Label(max_frame, text="Max:").pack(side=tk.LEFT, padx=(10, 5))
         self.max_entry = tk.Entry(max_frame, width=8)
         self.max_entry.pack(side=tk.LEFT)
-        self.max_entry.insert(0, "2.0")  # Default max value
-        
-        # If this is an existing profile, set min/max from existing values
-        if self.profile_name and "_min" in self.initial_weights and "_max" in self.initial_weights:
-            self.min_entry.delete(0, tk.END)
-            self.min_entry.insert(0, str(self.initial_weights["_min"]))
-            self.max_entry.delete(0, tk.END)
-            self.max_entry.insert(0, str(self.initial_weights["_max"]))
         
         # Middle section - weights sidebar
         self.weights_sidebar = WeightSidebar(self, on_weight_change=self._on_temp_weight_change)
         self.weights_sidebar.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Set initial weights
-        for field, value in self.initial_weights.items():
-            if field not in ["_enabled", "_min", "_max", "_scale"]:
-                self.weights_sidebar.set_weight(field, value)
-        
         # Bottom section - buttons
         bottom_frame = tk.Frame(self)
         bottom_frame.pack(fill=tk.X, pady=10, padx=10)
         
-        # Delete button (only for existing profiles)
-        if not self.is_new and self.on_delete:
-            delete_btn = tk.Button(bottom_frame, text="Delete", fg="red",
-                               command=self._delete_profile)
-            delete_btn.pack(side=tk.LEFT, padx=5)
+        # Delete button (only shown for existing profiles, see load)
+        self.delete_btn = tk.Button(bottom_frame, text="Delete", fg="red",
+                                    command=self._delete_profile)
         
         # Cancel and Confirm buttons
         cancel_btn = tk.Button(bottom_frame, text="Cancel",
-                           command=self.parent.destroy)
+                           command=lambda: self.on_close())
         cancel_btn.pack(side=tk.RIGHT, padx=5)
         
         confirm_btn = tk.Button(bottom_frame, text="Confirm",
                             command=self._confirm_edit)
         confirm_btn.pack(side=tk.RIGHT, padx=5)
     
+    def load(self, profile_name: str, weights: Dict[str, float],
+             on_delete: Optional[Callable[[str], None]] = None):
+        """Fill the editor with a profile, so one editor can be reused.
+        
+        Args:
+            profile_name: Name of the weight profile (empty for new profiles)
+            weights: Initial weights dictionary
+            on_delete: Optional callback for deleting a profile
+        """
+        self.profile_name = profile_name
+        self.initial_weights = weights
+        self.on_delete = on_delete
+        self.is_new = not profile_name
+        
+        self.name_entry.delete(0, tk.END)
+        self.name_entry.insert(0, profile_name)
+        
+        # Default min/max, or the existing profile's values
+        min_val, max_val = "0.1", "2.0"
+        if profile_name and "_min" in weights and "_max" in weights:
+            min_val, max_val = str(weights["_min"]), str(weights["_max"])
+        self.min_entry.delete(0, tk.END)
+        self.min_entry.insert(0, min_val)
+        self.max_entry.delete(0, tk.END)
+        self.max_entry.insert(0, max_val)
+        
+        # Set initial weights; fields the profile lacks start at 1.00
+        for field in self.weights_sidebar.weight_vars:
+            self.weights_sidebar.set_weight(field, weights.get(field, 1.0))
+        
+        if not self.is_new and self.on_delete:
+            self.delete_btn.pack(side=tk.LEFT, padx=5)
+        else:
+            self.delete_btn.pack_forget()
+    
     def _on_temp_weight_change(self, field: str, value: float):
         """Temporary weight change handler (doesn't save until confirmed)."""
         # Just update the UI, don't save to file
@@ -133,7 +151,7 @@ class CustomWeightsEditor(tk.Frame):
         self.on_save(name, weights)
         
         # Close dialog
-        self.parent.destroy()
+        self.on_close()
     
     def _delete_profile(self):
         """Handle delete button press."""
@@ -141,4 +159,4 @@ class CustomWeightsEditor(tk.Frame):
                                 f"Are you sure you want to delete the '{self.profile_name}' weight profile?"):
             if self.on_delete:
                 self.on_delete(self.profile_name)
-            self.parent.destroy() 
\ No newline at end of file
+            self.on_close() 
\ No newline at end of file
@@ -2,10 +2,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Dict, Callable, Optional
-from models.item import Item
-from models.category import Category
-from utils.constants import OptionalField
-from utils.validators import validate_item_input
+from src.models.item import Item
+from src.models.category import Category
+from src.utils.constants import OptionalField
+from src.utils.validators import validate_item_input
 
 class ItemEditor(tk.Frame):
     """Component for editing item details."""
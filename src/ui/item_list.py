@@ -1,205 +1,419 @@
 """Item list component for displaying items in grid or list view."""
+import bisect
 import tkinter as tk
-from typing import Dict, Callable, List, Optional
-from models.item import Item
-from utils.constants import UIConstant, Style
+from typing import Dict, Callable, Iterable, List, Optional, Sequence, Set, Tuple
+from src.models.item import Item
+from src.services.item_order import ItemView
+from src.utils.constants import UIConstant, Style
+
+
+def optimal_sort_key(item: Item):
+    """Order of items in the optimal section: best weight per 1000 price first."""
+    return -item.weight_per_1k
+
+
+def regular_sort_key(item: Item):
+    """Order of regular items: None category first, then favorites, then rest."""
+    return (
+        item.category != 'None',  # None category first
+        not item.favorite,        # Then favorites
+        -item.weight_per_1k      # Then by weight per price
+    )
+
+
+class ItemCard(tk.Frame):
+    """Reusable card widget that can be rebound to any item."""
+
+    def __init__(self, parent: tk.Widget, on_edit: Callable[[str], None]):
+        """Create the card's widgets once; bind_item() fills them in.
+
+        Args:
+            parent: Parent widget
+            on_edit: Callback for when the card's Edit button is pressed
+        """
+        super().__init__(parent, bd=1, relief=tk.GROOVE,
+                         width=UIConstant.CARD_WIDTH,
+                         height=UIConstant.CARD_HEIGHT,
+                         bg=Style.BG_DARKER)
+        self.pack_propagate(False)
+        self.on_edit = on_edit
+        self.name: Optional[str] = None
+
+        # Inner frame for content
+        content_frame = tk.Frame(self, **Style.FRAME_NORMAL)
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=6, pady=3)
+
+        # Name Label (left) and Edit button (right)
+        name_row = tk.Frame(content_frame, **Style.FRAME_NORMAL)
+        name_row.pack(fill=tk.X)
+
+        # Create a modified style without font
+        label_style = {k: v for k, v in Style.LABEL_NORMAL.items() if k != 'font'}
+        self.name_label = tk.Label(name_row, font=("Arial", 10, "bold"),
+                                   anchor="w", wraplength=UIConstant.CARD_WIDTH-48,
+                                   **label_style)
+        self.name_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        # Create a modified style without font
+        btn_style = {k: v for k, v in Style.BTN_NORMAL.items() if k != 'font'}
+        edit_button = tk.Button(name_row, text="Edit", width=7, height=1,
+                                command=lambda: self.name and self.on_edit(self.name),
+                                font=("Arial", 9),
+                                **btn_style)
+        edit_button.pack(side=tk.RIGHT, padx=(6, 0))
+
+        # Stats frame
+        stats_frame = tk.Frame(content_frame, **Style.FRAME_NORMAL)
+        stats_frame.pack(fill=tk.X)
+        self.price_label = tk.Label(stats_frame, anchor="w", **label_style)
+        self.price_label.pack(side=tk.LEFT)
+        self.adjustment_label = tk.Label(stats_frame, anchor="w", **label_style)
+        self.adjustment_label.pack(side=tk.LEFT, padx=(6, 0))
+        self.weight_label = tk.Label(stats_frame, anchor="w", **label_style)
+        self.weight_label.pack(side=tk.LEFT, padx=(6, 0))
+
+        # Weight per 1000 Price
+        self.efficiency_label = tk.Label(content_frame, anchor="w", **label_style)
+        self.efficiency_label.pack(fill=tk.X)
+
+        # Category and Favorite status
+        self.status_label = tk.Label(content_frame, anchor="w", **label_style)
+        self.status_label.pack(fill=tk.X)
+
+        # Effects
+        self.effects_label = tk.Label(content_frame, anchor="w",
+                                      wraplength=UIConstant.CARD_WIDTH-12,
+                                      **label_style)
+        self.effects_label.pack(fill=tk.X, pady=(1, 2))
+
+        # Optional fields
+        self.optional_label = tk.Label(content_frame, anchor="w",
+                                       wraplength=UIConstant.CARD_WIDTH-12,
+                                       **label_style)
+        self.optional_label.pack(fill=tk.X, pady=(0, 2))
+
+    def bind_item(self, name: str, item: Item):
+        """Show an item on this card, reusing the existing widgets.
+
+        Args:
+            name: Item name
+            item: Item to show
+        """
+        self.name = name
+        self.name_label.config(text=name)
+        self.price_label.config(text=f"P: {item.price}")
+        self.adjustment_label.config(text=f"A: {item.adjustment}")
+        self.weight_label.config(text=f"W: {item.total_weight:.1f}")
+        self.efficiency_label.config(text=f"W/kP: {item.weight_per_1k:.1f}")
+
+        status_text = f"{item.category}"
+        if item.favorite:
+            status_text += " ★"
+        self.status_label.config(text=status_text)
+        self.effects_label.config(text=item.effects.strip())
+
+        optional_text = []
+        for field, value in item.stats.items():
+            if value > 0:
+                optional_text.append(f"{field}: {value}")
+        self.optional_label.config(text=", ".join(optional_text))
+
 
 class ItemList(tk.Frame):
-    """Component for displaying items in grid or list view."""
+    """Component for displaying items in grid or list view.
+
+    The grid is virtualized: only the rows inside the viewport are backed by
+    widgets, taken from a pool of ItemCards that are rebound to new items as
+    the view scrolls or the data changes. Refresh cost depends on the
+    viewport size, not on the number of items.
+    """
 
     def __init__(self, parent: tk.Widget, on_edit: Callable[[str], None]):
         """Initialize the item list.
-        
+
         Args:
             parent: Parent widget
             on_edit: Callback for when an item is selected for editing
         """
         super().__init__(parent, **Style.FRAME_NORMAL)
         self.on_edit = on_edit
-        
+
         # Find parent window
         self.parent_window = parent
         while self.parent_window and not hasattr(self.parent_window, '_refresh_display'):
             self.parent_window = self.parent_window.master
-        
+
         # Display state
         self.current_columns = UIConstant.DEFAULT_COLUMNS
         self.optimal_items: List[str] = []
-        
+
+        # Displayed items, and each section's names in display order
+        self.items: Dict[str, Item] = {}
+        self.sections: List[List[str]] = []
+        # View shown by display_view, until the items are patched
+        self._view: Optional[ItemView] = None
+        # True if the caller passed the sections and owns their order
+        self._presorted = False
+
+        # Layout: one entry per row, either a list of names or None for a
+        # separator, and the y coordinate of each row's top edge
+        self._rows: List[Optional[List[str]]] = []
+        self._row_tops: List[int] = []
+        self._height = 0
+
+        # Cards currently on screen by item name, and idle cards for reuse
+        self.cards: Dict[str, ItemCard] = {}
+        self._card_windows: Dict[ItemCard, int] = {}
+        self._pool: List[ItemCard] = []
+
         self._setup_ui()
 
     def _setup_ui(self):
         """Set up the UI components."""
-        # Frame to hold items
-        self.items_frame = tk.Frame(self, **Style.FRAME_NORMAL)
-        self.items_frame.pack(fill=tk.BOTH, expand=True)
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas = tk.Canvas(self, highlightthickness=0, bg=Style.BG_DARK,
+                                yscrollcommand=self.scrollbar.set,
+                                yscrollincrement=UIConstant.CARD_HEIGHT // 3)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.bind('<Configure>', lambda event: self._render())
+
+        # Scroll with the wheel while the pointer is over the list
+        self.bind('<Enter>', self._bind_wheel)
+        self.bind('<Leave>', self._unbind_wheel)
 
     def set_optimal_items(self, items: Optional[List[str]]):
         """Set the list of optimal items.
-        
+
         Args:
             items: List of optimal item names, or None to clear
         """
         self.optimal_items = items or []
         self.refresh()
 
-    def display_items(self, items: Dict[str, Item]):
+    def display_items(self, items: Dict[str, Item],
+                      sections: Optional[Sequence[Sequence[str]]] = None):
         """Display the given items.
-        
+
         Args:
             items: Dictionary of items to display
+            sections: Names per section in display order; by default the
+                items are split into optimal and regular items and sorted
         """
         print(f"ItemList display_items called with {len(items)} items")
-        # Clear existing items
-        for widget in self.items_frame.winfo_children():
-            widget.destroy()
-        print("Cleared existing items")
-        
-        if not items:
-            print("No items to display")
+        self._view = None
+        self._presorted = sections is not None
+        self.items = dict(items)
+
+        if sections is None:
+            # Split items into optimal and regular
+            optimal = set(self.optimal_items)
+            optimal_names = [name for name in items if name in optimal]
+            regular_names = [name for name in items if name not in optimal]
+            print(f"Split into {len(optimal_names)} optimal and {len(regular_names)} regular items")
+            sections = (
+                sorted(optimal_names, key=lambda name: optimal_sort_key(items[name])),
+                sorted(regular_names, key=lambda name: regular_sort_key(items[name])),
+            )
+        self._show_sections(sections)
+
+    def display_view(self, view: ItemView):
+        """Display a presorted view, e.g. from ItemService.item_view.
+
+        Views are memoized by the service, so showing the view that is
+        already displayed returns at once.
+
+        Args:
+            view: Items and their display sections
+        """
+        if view is self._view:
             return
-            
-        # Split items into optimal and regular
-        optimal_items = {}
-        regular_items = {}
-        
+        self.items = dict(view.items)
+        self._presorted = False
+        self._show_sections(view.sections)
+        self._view = view
+
+    def _show_sections(self, sections: Iterable[Sequence[str]]):
+        """Lay out non-empty sections from the top and render them."""
+        self.sections = [list(section) for section in sections if section]
+        self._layout()
+        self.canvas.yview_moveto(0)
+        self._render(rebind=True)
+
+    def _layout(self):
+        """Split the sections into rows and compute the scrollable height."""
+        row_height = UIConstant.CARD_HEIGHT + 2 * UIConstant.CARD_PADDING
+        self._rows = []
+        self._row_tops = []
+        y = 0
+        for i, names in enumerate(self.sections):
+            if i:
+                self._rows.append(None)
+                self._row_tops.append(y)
+                y += UIConstant.SEPARATOR_HEIGHT
+            for start in range(0, len(names), self.current_columns):
+                self._rows.append(names[start:start + self.current_columns])
+                self._row_tops.append(y)
+                y += row_height
+        self._height = y
+
+        # Separators are plain canvas lines; there are at most a few
+        self.canvas.delete("separator")
+        width = self.current_columns * (UIConstant.CARD_WIDTH + 2 * UIConstant.CARD_PADDING)
+        for row, top in zip(self._rows, self._row_tops):
+            if row is None:
+                middle = top + UIConstant.SEPARATOR_HEIGHT // 2
+                self.canvas.create_line(5, middle, width - 5, middle,
+                                        fill=Style.BORDER, width=2, tags="separator")
+        self.canvas.configure(scrollregion=(0, 0, width, self._height))
+
+    def _render(self, rebind: bool = False):
+        """Show cards for the rows in the viewport and recycle the rest.
+
+        Args:
+            rebind: Also refresh cards that stay on screen, after their
+                items changed
+        """
+        top = self.canvas.canvasy(0)
+        bottom = top + max(self.canvas.winfo_height(), 1)
+        first = max(bisect.bisect_right(self._row_tops, top) - 1, 0)
+        last = bisect.bisect_left(self._row_tops, bottom)
+
+        # Positions of the visible cards
+        visible: Dict[str, Tuple[int, int]] = {}
+        for row, row_top in zip(self._rows[first:last], self._row_tops[first:last]):
+            for col, name in enumerate(row or ()):
+                x = UIConstant.CARD_PADDING + col * (UIConstant.CARD_WIDTH + 2 * UIConstant.CARD_PADDING)
+                visible[name] = (x, row_top + UIConstant.CARD_PADDING)
+
+        for name in [name for name in self.cards if name not in visible]:
+            card = self.cards.pop(name)
+            self._hide_card(card)
+            self._pool.append(card)
+
+        for name, (x, y) in visible.items():
+            card = self.cards.get(name)
+            if card is None:
+                card = self._acquire_card()
+                card.bind_item(name, self.items[name])
+                self.cards[name] = card
+            elif rebind:
+                card.bind_item(name, self.items[name])
+            self._show_card(card, x, y)
+
+    def _acquire_card(self):
+        """Take an idle card from the pool, or create one."""
+        if self._pool:
+            return self._pool.pop()
+        return self._create_card()
+
+    def _create_card(self) -> ItemCard:
+        """Create a new, hidden card; subclasses may draw cards differently."""
+        card = ItemCard(self.canvas, self.on_edit)
+        self._card_windows[card] = self.canvas.create_window(
+            0, 0, window=card, anchor="nw", state=tk.HIDDEN)
+        return card
+
+    def _show_card(self, card: ItemCard, x: int, y: int):
+        """Place a card with its top left corner at (x, y) and show it."""
+        window = self._card_windows[card]
+        self.canvas.coords(window, x, y)
+        self.canvas.itemconfigure(window, state=tk.NORMAL)
+
+    def _hide_card(self, card: ItemCard):
+        """Hide a card that scrolled out of view."""
+        self.canvas.itemconfigure(self._card_windows[card], state=tk.HIDDEN)
+
+    def update_items(self, items: Dict[str, Item]) -> Set[str]:
+        """Show new data for displayed items without rebuilding the list.
+
+        Cards on screen are rebound in place; the grid is only re-laid out if
+        the sort order changed.
+
+        Args:
+            items: Changed items by name
+
+        Returns:
+            Names that are not displayed and were ignored
+        """
+        ignored = set()
+        self._view = None
         for name, item in items.items():
-            if name in self.optimal_items:
-                optimal_items[name] = item
-            else:
-                regular_items[name] = item
-        
-        print(f"Split into {len(optimal_items)} optimal and {len(regular_items)} regular items")
-        
-        # Sort optimal items by weight per 1000 price
-        sorted_optimal = sorted(
-            optimal_items.items(),
-            key=lambda x: -x[1].weight_per_1k
-        )
-        
-        # Sort regular items: None category first, then favorites, then rest
-        sorted_regular = sorted(
-            regular_items.items(),
-            key=lambda x: (
-                x[1].category != 'None',  # None category first
-                not x[1].favorite,        # Then favorites
-                -x[1].weight_per_1k      # Then by weight per price
-            )
-        )
-        
-        # Display optimal items in view mode
-        if sorted_optimal:
-            print("Displaying optimal items")
-            self._display_view_mode(sorted_optimal)
-            if sorted_regular:
-                self._add_separator()
-        # Display regular items in view mode
-        if sorted_regular:
-            print("Displaying regular items")
-            self._display_view_mode(sorted_regular)
-        
-        print(f"Final items frame children: {self.items_frame.winfo_children()}")
-
-    def _display_view_mode(self, items):
-        """Display items in view mode - responsive grid layout.
-        
+            if name not in self.items:
+                ignored.add(name)
+                continue
+            self.items[name] = item
+            card = self.cards.get(name)
+            if card is not None:
+                card.bind_item(name, item)
+        if len(ignored) < len(items):
+            self._resort_sections()
+        return ignored
+
+    def remove_items(self, names: Iterable[str]):
+        """Remove deleted items and close the gaps.
+
         Args:
-            items: List of (name, item) tuples to display
+            names: Names of the items to remove
         """
-        print(f"_display_view_mode called with {len(items)} items")
-        # Create a frame to hold rows
-        rows_frame = tk.Frame(self.items_frame, **Style.FRAME_NORMAL)
-        rows_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Configure grid columns
-        for i in range(self.current_columns):
-            rows_frame.grid_columnconfigure(i, weight=1, uniform="col", 
-                                         pad=UIConstant.CARD_PADDING)
-        
-        # Display items in a grid
-        for i, (name, item) in enumerate(items):
-            print(f"Creating card for item {name}")
-            # Calculate grid position
-            row = i // self.current_columns
-            col = i % self.current_columns
-            
-            # Create item frame
-            item_frame = tk.Frame(rows_frame, bd=1, relief=tk.GROOVE, 
-                                width=UIConstant.CARD_WIDTH,
-                                bg=Style.BG_DARKER)
-            item_frame.grid(row=row, column=col, padx=UIConstant.CARD_PADDING, 
-                          pady=UIConstant.CARD_PADDING, sticky="nsew")
-            item_frame.grid_propagate(False)
-            
-            # Inner frame for content
-            content_frame = tk.Frame(item_frame, **Style.FRAME_NORMAL)
-            content_frame.pack(fill=tk.BOTH, expand=True, padx=6, pady=3)
-            
-            # Name Label (left) and Edit button (right)
-            name_row = tk.Frame(content_frame, **Style.FRAME_NORMAL)
-            name_row.pack(fill=tk.X)
-            
-            # Create a modified style without font
-            label_style = {k: v for k, v in Style.LABEL_NORMAL.items() if k != 'font'}
-            name_label = tk.Label(name_row, text=name, 
-                                font=("Arial", 10, "bold"),
-                                anchor="w", wraplength=UIConstant.CARD_WIDTH-48,
-                                **label_style)
-            name_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            
-            # Create a modified style without font
-            btn_style = {k: v for k, v in Style.BTN_NORMAL.items() if k != 'font'}
-            edit_button = tk.Button(name_row, text="Edit", width=7, height=1,
-                                  command=lambda n=name: self.on_edit(n),
-                                  font=("Arial", 9),
-                                  **btn_style)
-            edit_button.pack(side=tk.RIGHT, padx=(6, 0))
-            
-            # Stats frame
-            stats_frame = tk.Frame(content_frame, **Style.FRAME_NORMAL)
-            stats_frame.pack(fill=tk.X)
-            tk.Label(stats_frame, text=f"P: {item.price}", 
-                    anchor="w", **label_style).pack(side=tk.LEFT)
-            tk.Label(stats_frame, text=f"A: {item.adjustment}", 
-                    anchor="w", **label_style).pack(side=tk.LEFT, padx=(6, 0))
-            tk.Label(stats_frame, text=f"W: {item.total_weight:.1f}", 
-                    anchor="w", **label_style).pack(side=tk.LEFT, padx=(6, 0))
-            
-            # Weight per 1000 Price
-            efficiency_frame = tk.Frame(content_frame, **Style.FRAME_NORMAL)
-            efficiency_frame.pack(fill=tk.X)
-            tk.Label(efficiency_frame, text=f"W/kP: {item.weight_per_1k:.1f}", 
-                    anchor="w", **label_style).pack(side=tk.LEFT)
-            
-            # Category and Favorite status
-            status_text = f"{item.category}"
-            if item.favorite:
-                status_text += " ★"
-            tk.Label(content_frame, text=status_text, 
-                    anchor="w", **label_style).pack(fill=tk.X)
-            
-            # Effects
-            if item.effects.strip():
-                tk.Label(content_frame, text=item.effects, anchor="w",
-                        wraplength=UIConstant.CARD_WIDTH-12,
-                        **label_style).pack(fill=tk.X, pady=(1, 2))
-            
-            # Optional fields
-            optional_text = []
-            for field, value in item.stats.items():
-                if value > 0:
-                    optional_text.append(f"{field}: {value}")
-            if optional_text:
-                tk.Label(content_frame, text=", ".join(optional_text),
-                        anchor="w", wraplength=UIConstant.CARD_WIDTH-12,
-                        **label_style).pack(fill=tk.X, pady=(0, 2))
-        print(f"Finished creating {len(items)} cards")
-
-    def _add_separator(self):
-        """Add a separator line between sections."""
-        separator = tk.Frame(self.items_frame, height=2, bd=1, relief=tk.SUNKEN,
-                           bg=Style.BORDER)
-        separator.pack(fill=tk.X, padx=5, pady=10)
+        removed = {name for name in names if self.items.pop(name, None) is not None}
+        if removed:
+            self._view = None
+            self.sections = [
+                [name for name in section if name not in removed]
+                for section in self.sections
+            ]
+            self.sections = [section for section in self.sections if section]
+            self._layout()
+            self._render()
+
+    def _resort_sections(self) -> bool:
+        """Re-sort each section and re-lay out the grid if the order changed.
+
+        Returns:
+            bool: True if the grid was re-laid out
+        """
+        if self._presorted:
+            return False  # Sections passed to display_items keep their order
+        optimal = set(self.optimal_items)
+        sections = []
+        for names in self.sections:
+            key = optimal_sort_key if names[0] in optimal else regular_sort_key
+            sections.append(sorted(names, key=lambda name: key(self.items[name])))
+        if sections == self.sections:
+            return False
+        self.sections = sections
+        self._layout()
+        self._render(rebind=True)
+        return True
+
+    def _on_scrollbar(self, *args):
+        """Scroll the canvas from the scrollbar and render the new rows."""
+        self.canvas.yview(*args)
+        self._render()
+
+    def _on_mousewheel(self, event):
+        """Scroll the canvas with the mouse wheel."""
+        if event.num == 4:
+            steps = -1
+        elif event.num == 5:
+            steps = 1
+        else:
+            steps = -1 if event.delta > 0 else 1
+        self.canvas.yview_scroll(steps, "units")
+        self._render()
+
+    def _bind_wheel(self, event):
+        """Route wheel events to this list while the pointer is over it."""
+        self.canvas.bind_all('<MouseWheel>', self._on_mousewheel)
+        self.canvas.bind_all('<Button-4>', self._on_mousewheel)
+        self.canvas.bind_all('<Button-5>', self._on_mousewheel)
+
+    def _unbind_wheel(self, event):
+        """Stop routing wheel events to this list."""
+        self.canvas.unbind_all('<MouseWheel>')
+        self.canvas.unbind_all('<Button-4>')
+        self.canvas.unbind_all('<Button-5>')
 
     def refresh(self):
         """Refresh the current display."""
@@ -209,14 +423,16 @@ class ItemList(tk.Frame):
 
     def update_columns(self, width: int):
         """Update the number of columns based on available width.
-        
+
         Args:
             width: Available width in pixels
         """
         # Calculate how many columns can fit
         available_width = width - 20  # Reduced padding allowance
         columns = max(1, min(8, available_width // (UIConstant.CARD_WIDTH + 2 * UIConstant.CARD_PADDING)))
-        
+
         if columns != self.current_columns:
             self.current_columns = columns
-            self.refresh() 
\ No newline at end of file
+            # Only the layout depends on the column count
+            self._layout()
+            self._render()
@@ -1,22 +1,39 @@
 import tkinter as tk
+from contextlib import nullcontext
 from tkinter import ttk
 from tkinter import messagebox
-from ui.weight_sidebar import WeightSidebar
-from ui.main_window import SearchWindow
-from ui.item_list import ItemList
-from ui.custom_weights_editor import CustomWeightsEditor
-from services.item_service import ItemService
-from services.optimizer import OptimizerService
-from utils.constants import UIConstant, Style
+from typing import Optional
+from src.ui.weight_sidebar import WeightSidebar
+from src.ui.main_window import SearchWindow
+from src.ui.item_list import ItemList
+from src.ui.custom_weights_editor import CustomWeightsEditor
+from src.ui.item_editor import ItemEditor
+from src.ui.window_manager import WindowManager
+from src.ui.perf_monitor import PerfMonitor
+from src.ui.table_diff import TreeviewDiffer
+from src.services.item_service import ItemService
+from src.services.event_bus import (
+    ItemChanged, ItemRemoved, ProfilesChanged, ProfileToggled, WeightsRecomputed
+)
+from src.services.item_order import CATEGORY_ORDER
+from src.services.optimizer import OptimizerService
+from src.utils.constants import UIConstant, Style
 
 class MainMenu:
-    def __init__(self, item_service: ItemService, optimizer_service: OptimizerService):
+    def __init__(self, item_service: ItemService, optimizer_service: OptimizerService,
+                 perf_monitor: Optional[PerfMonitor] = None):
         self.root = tk.Tk()
         self.root.title("Main Menu")
         self.root.geometry("1100x700")
         self.root.configure(bg=Style.BG_DARK)
         self.item_service = item_service
         self.optimizer_service = optimizer_service
+
+        # Optional instrumentation: times every Tk callback; F12 shows the HUD
+        self.perf_monitor = perf_monitor
+        if perf_monitor is not None:
+            perf_monitor.install(self.root)
+            self.root.bind("<F12>", lambda event: perf_monitor.show_hud())
         self.optimal_items = None
 
         # Configure ttk styles
@@ -226,6 +243,11 @@ class MainMenu:
                                command=self.output_weights_tree.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.output_weights_tree.configure(yscrollcommand=scrollbar.set)
+        # Rows are keyed by weight name and only changed rows are touched
+        self.output_weights_rows = TreeviewDiffer(
+            self.output_weights_tree,
+            format_row=lambda weight_name, value: (weight_name, f"{value:.2f}")
+        )
 
         # Track custom weight profiles vars
         self.weight_profile_vars = {}
@@ -241,73 +263,82 @@ class MainMenu:
         self.budget_entry.bind('<Key>', self.clear_budget_error)
         self.root.bind('<FocusIn>', self._on_window_focus_in)
         self.budget_entry.bind('<Return>', lambda event: self.find_items())
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.reset_btn = None
         self.item_list = None
+        
+        # Search, weights and editor windows are built once and reused
+        self.windows = WindowManager(self.root)
+        
+        # Patch the display from change notifications instead of rebuilding it
+        events = self.item_service.events
+        events.subscribe(ItemChanged, self._on_items_changed)
+        events.subscribe(ItemRemoved, self._on_items_removed)
+        events.subscribe(WeightsRecomputed, self._on_weights_recomputed)
+        events.subscribe(ProfileToggled, self._on_profile_toggled)
+        events.subscribe(ProfilesChanged, self._on_profiles_changed)
 
     def open_search(self):
-        win = tk.Toplevel(self.root)
-        win.title("Search")
-        win.geometry("1024x800")
-        SearchWindow(win, self.item_service, self.optimizer_service)
+        # The search window stays subscribed to changes while hidden, so
+        # showing it again is instant
+        search = self.windows.show(
+            "search",
+            lambda win: SearchWindow(win, self.item_service, self.optimizer_service),
+            title="Search", geometry="1024x800")
+        search.search_bar.focus_search()
 
     def open_base_weights(self):
-        win = tk.Toplevel(self.root)
-        win.title("Base Weights")
-        win.geometry("300x600")
-        
-        # Use a callback that doesn't automatically recalculate
+        # Use a callback that doesn't automatically recalculate; values that
+        # didn't change, e.g. while the sidebar is refilled, are not saved
         def on_weight_change(field, value):
-            self.item_service.update_weight(field, value, recalculate=False)
-            
-        sidebar = WeightSidebar(win, on_weight_change=on_weight_change)
-        sidebar.pack(fill=tk.BOTH, expand=True)
+            if self.item_service.weights["Base Weights"].get(field) != value:
+                self.item_service.update_weight(field, value, recalculate=False)
+        
+        def build(win):
+            sidebar = WeightSidebar(win, on_weight_change=on_weight_change)
+            sidebar.pack(fill=tk.BOTH, expand=True)
+            return sidebar
+        
+        sidebar = self.windows.show("base_weights", build, title="Base Weights", geometry="300x600")
         for field, value in self.item_service.weights["Base Weights"].items():
             if field != "_enabled":
                 sidebar.set_weight(field, value)
+    
+    def _show_weights_editor(self, title, profile_name, weights, on_delete=None):
+        """Show the shared weight profile editor, loaded with a profile."""
+        def build(win):
+            editor = CustomWeightsEditor(
+                win, profile_name, weights, self._on_save_weight_profile, on_delete,
+                on_close=self.windows.closer("weights_editor"))
+            editor.pack(fill=tk.BOTH, expand=True)
+            return editor
+        
+        editor = self.windows.show("weights_editor", build, title=title,
+                                   geometry="400x700", modal=True)
+        editor.load(profile_name, weights, on_delete)
             
     def add_custom_weights(self):
         """Open dialog to create a new custom weight profile"""
-        # Create popup window
-        win = tk.Toplevel(self.root)
-        win.title("New Weight Profile")
-        win.geometry("400x700")
-        win.transient(self.root)
-        win.grab_set()
-        
         # Use the base weights as a template for the new profile
         base_weights = {k: v for k, v in self.item_service.weights["Base Weights"].items() 
                         if k != "_enabled"}
-        
-        # Create editor
-        editor = CustomWeightsEditor(win, "", base_weights, self._on_save_weight_profile)
-        editor.pack(fill=tk.BOTH, expand=True)
+        self._show_weights_editor("New Weight Profile", "", base_weights)
     
     def edit_custom_weights(self, profile_name):
         """Open dialog to edit an existing custom weight profile"""
         if profile_name not in self.item_service.weights:
             return
-            
-        # Create popup window
-        win = tk.Toplevel(self.root)
-        win.title(f"Edit Weight Profile: {profile_name}")
-        win.geometry("400x700")
-        win.transient(self.root)
-        win.grab_set()
         
         # Get current weights and remove internal flags
         weights = {k: v for k, v in self.item_service.weights[profile_name].items() 
                   if k != "_enabled"}
-        
-        # Create editor
-        editor = CustomWeightsEditor(
-            win, 
-            profile_name, 
-            weights, 
-            self._on_save_weight_profile,
+        self._show_weights_editor(
+            f"Edit Weight Profile: {profile_name}",
+            profile_name,
+            weights,
             self._on_delete_weight_profile
         )
-        editor.pack(fill=tk.BOTH, expand=True)
     
     def _on_save_weight_profile(self, profile_name, weights):
         """Handle saving a weight profile"""
@@ -315,15 +346,14 @@ class MainMenu:
         if profile_name != "Base Weights" and profile_name in self.item_service.weights:
             # It's an update
             old_enabled = profile_name in self.item_service.enabled_profiles
-            self.item_service.add_or_update_weight_profile(profile_name, weights)
-            # Preserve enabled state
-            self.item_service.toggle_weight_profile(profile_name, old_enabled)
+            with self.item_service.batch():
+                self.item_service.add_or_update_weight_profile(profile_name, weights)
+                # Preserve enabled state
+                self.item_service.toggle_weight_profile(profile_name, old_enabled)
         else:
             # It's a new profile
             self.item_service.add_or_update_weight_profile(profile_name, weights)
-            
-        # Refresh sidebar
-        self.refresh_weight_profiles()
+        # The sidebar is refreshed by _on_profiles_changed
     
     def _on_delete_weight_profile(self, profile_name):
         """Handle deleting a weight profile"""
@@ -331,9 +361,8 @@ class MainMenu:
             messagebox.showerror("Error", "Cannot delete Base Weights profile")
             return
             
-        if self.item_service.delete_weight_profile(profile_name):
-            # Refresh sidebar
-            self.refresh_weight_profiles()
+        # The sidebar is refreshed by _on_profiles_changed
+        self.item_service.delete_weight_profile(profile_name)
     
     def refresh_weight_profiles(self):
         """Refresh the display of weight profiles."""
@@ -415,21 +444,9 @@ class MainMenu:
         """Toggle a weight profile on/off."""
         is_enabled = self.weight_profile_vars[profile_name].get()
         
-        # Update both the _enabled flag and the enabled_profiles set
-        self.item_service.weights[profile_name]["_enabled"] = is_enabled
-        if is_enabled:
-            self.item_service.enabled_profiles.add(profile_name)
-        else:
-            self.item_service.enabled_profiles.discard(profile_name)
-        
-        # Enable/disable the slider based on checkbox state
-        if is_enabled:
-            self.weight_profile_sliders[profile_name].config(state=tk.NORMAL)
-        else:
-            self.weight_profile_sliders[profile_name].config(state=tk.DISABLED)
-        
-        # Save changes but don't recalculate - that only happens on Calculate button press
-        self.item_service.save_data()
+        # Saves but doesn't recalculate - that only happens on Calculate button press.
+        # The slider state is updated by _on_profile_toggled.
+        self.item_service.toggle_weight_profile(profile_name, is_enabled)
 
     def adjust_profile_scale(self, profile_name: str, *args):
         """Adjust the scale factor for a weight profile."""
@@ -459,9 +476,16 @@ class MainMenu:
         self.clear_budget_error()
         # Ensure all items are recalculated with the latest output weights
         self.item_service.recalculate_weights()
-        optimal_items, total_price, total_weight = self.optimizer_service.find_optimal_items(budget, self.item_service.items)
+        result = self.optimizer_service.solve(
+            budget, self.item_service.snapshot(), self.item_service.fingerprint)
+        optimal_items, total_price, total_weight = result
         print(f"Found optimal items: {optimal_items}")
         print(f"Total price: {total_price}, Total weight: {total_weight}")
+        print(f"Solve stats: engine={result.engine}, time={result.wall_time * 1000:.1f}ms, "
+              f"expanded={result.nodes_expanded}, pruned={result.nodes_pruned}, "
+              f"cache_hit={result.cache_hit}")
+        if self.perf_monitor is not None:
+            self.perf_monitor.record_solve(result)
         self.optimal_items = optimal_items
         self.show_optimal_items()
 
@@ -474,8 +498,17 @@ class MainMenu:
         self.budget_entry.config(bg=Style.BG_DARKER)
         self.budget_error.config(text="")
 
+    def _measure(self, name):
+        """Time a block with the performance monitor, if there is one."""
+        return self.perf_monitor.measure(name) if self.perf_monitor is not None else nullcontext()
+
     def show_optimal_items(self):
         """Display the optimal items in the UI."""
+        with self._measure("render"):
+            self._build_optimal_items()
+
+    def _build_optimal_items(self):
+        """Replace the optimal item cards and the Reset button."""
         print("Showing optimal items...")
         for widget in self.cards_container.winfo_children():
             widget.destroy()
@@ -489,26 +522,17 @@ class MainMenu:
                                      command=self.reset_optimal,
                                      **Style.BTN_NORMAL)
             self.reset_btn.pack(anchor="ne", pady=(0, 5), padx=10)
-            # Sort items: Weapon, then Ability, then Survival; most expensive first within each
-            items = [self.item_service.get_item(name) for name in self.optimal_items]
-            print(f"Retrieved items: {[item.name for item in items if item]}")
-            def cat_order(item):
-                if item.category == 'Weapon': return 0
-                if item.category == 'Ability': return 1
-                if item.category == 'Survival': return 2
-                return 3
-            items_sorted = sorted(
-                [item for item in items if item],
-                key=lambda x: (cat_order(x), -x.price)
-            )
-            print(f"Sorted items: {[item.name for item in items_sorted]}")
-            items_dict = {item.name: item for item in items_sorted}
+            # Weapon, then Ability, then Survival; most expensive first within each,
+            # read off the service's presorted per-category price order
+            names = self.item_service.item_order.ordered(self.optimal_items, 'price', CATEGORY_ORDER)
+            print(f"Sorted items: {names}")
+            items_dict = {name: self.item_service.get_item(name) for name in names}
             print("Creating ItemList...")
             # Create ItemList without triggering recalculation
             self.item_list = ItemList(self.cards_container, on_edit=self._on_edit_item)
             self.item_list.pack(fill=tk.BOTH, expand=True)
             print("Displaying items...")
-            self.item_list.display_items(items_dict)
+            self.item_list.display_items(items_dict, sections=[names])
             print(f"Cards container after displaying: {self.cards_container.winfo_children()}")
         else:
             print("No optimal items to show")
@@ -521,19 +545,18 @@ class MainMenu:
             self._open_item_editor_popup(name, item)
 
     def _open_item_editor_popup(self, name, item):
-        editor_popup = tk.Toplevel(self.root)
-        editor_popup.title(f"Edit Item: {name}")
-        editor_popup.transient(self.root)
-        editor_popup.grab_set()
-        editor_popup.geometry("600x400")
-        from ui.item_editor import ItemEditor
-        popup_item_editor = ItemEditor(
-            editor_popup,
-            on_save=self._on_save_item,
-            on_delete=self._on_delete_item,
-            on_cancel=editor_popup.destroy
-        )
-        popup_item_editor.pack(fill=tk.BOTH, expand=True)
+        def build(win):
+            editor = ItemEditor(
+                win,
+                on_save=self._on_save_item,
+                on_delete=self._on_delete_item,
+                on_cancel=self.windows.closer("item_editor")
+            )
+            editor.pack(fill=tk.BOTH, expand=True)
+            return editor
+        
+        popup_item_editor = self.windows.show("item_editor", build, title=f"Edit Item: {name}",
+                                              geometry="600x400", modal=True)
         popup_item_editor.edit_item(name, item)
 
     def _on_save_item(self, name, item):
@@ -541,15 +564,67 @@ class MainMenu:
             success = self.item_service.update_item(name, item)
         else:
             success = self.item_service.add_item(item)
-        if success:
-            self.show_optimal_items()
+        # The cards are patched by the change notifications
         return success
 
     def _on_delete_item(self, name):
-        success = self.item_service.delete_item(name)
-        if success:
+        return self.item_service.delete_item(name)
+
+    def _on_items_changed(self, event):
+        """Redraw the cards of shown items that changed."""
+        if self.item_list is None:
+            return
+        changed = {
+            name: self.item_service.get_item(name)
+            for name in event.names
+            if name in self.item_list.items
+        }
+        if not changed:
+            return
+        self.item_list.update_items(changed)
+        # A price change can move a card within its category
+        names = self.item_service.item_order.ordered(self.item_list.items, 'price', CATEGORY_ORDER)
+        if [names] != self.item_list.sections:
+            self.item_list.display_items(self.item_list.items, sections=[names])
+
+    def _on_items_removed(self, event):
+        """Drop deleted items from the optimal build."""
+        if not self.optimal_items or not event.names & set(self.optimal_items):
+            return
+        self.optimal_items = [name for name in self.optimal_items if name not in event.names]
+        if self.optimal_items and self.item_list is not None:
+            self.item_list.remove_items(event.names)
+        else:
             self.show_optimal_items()
-        return success
+
+    def _on_weights_recomputed(self, event):
+        """Patch the output weights rows and the cards whose weight changed."""
+        if event.keys:
+            self._patch_output_weights(event.keys)
+        if event.names:
+            self._on_items_changed(event)
+
+    def _on_profile_toggled(self, event):
+        """Sync a profile's checkbox and slider with its enabled state."""
+        var = self.weight_profile_vars.get(event.profile)
+        if var is None:
+            return
+        if var.get() != event.enabled:
+            var.set(event.enabled)
+        self.weight_profile_sliders[event.profile].config(
+            state=tk.NORMAL if event.enabled else tk.DISABLED)
+
+    def _on_profiles_changed(self, event):
+        """Rebuild the profile list if profiles were added or removed, else patch them."""
+        custom_profiles = {name for name in self.item_service.weights if name != "Base Weights"}
+        if custom_profiles != set(self.weight_profile_vars):
+            self.refresh_weight_profiles()
+            return
+        for profile_name in event.profiles & custom_profiles:
+            weights = self.item_service.weights[profile_name]
+            self.weight_profile_scale_vars[profile_name].set(weights.get("_scale", 0.5))
+            self._on_profile_toggled(ProfileToggled(
+                profile=profile_name, enabled=weights.get("_enabled", False)))
 
     def reset_optimal(self):
         self.optimal_items = None
@@ -562,19 +637,13 @@ class MainMenu:
 
     def update_output_weights_table(self):
         """Update the output weights table with current values"""
-        print("Updating output weights table...")
-        # Clear existing items
-        for item in self.output_weights_tree.get_children():
-            self.output_weights_tree.delete(item)
-            
-        # Add current output weights
-        sorted_weights = sorted(self.item_service.output_weights.items())
-        print(f"Current output weights: {dict(sorted_weights)}")
-        for weight_name, value in sorted_weights:
-            # Format the value to 2 decimal places
-            formatted_value = f"{value:.2f}"
-            self.output_weights_tree.insert("", tk.END, values=(weight_name, formatted_value))
-        print("Finished updating output weights table")
+        inserted, updated, removed = self.output_weights_rows.sync(self.item_service.output_weights)
+        if inserted or updated or removed:
+            print(f"Output weights table: {inserted} added, {updated} updated, {removed} removed")
+
+    def _patch_output_weights(self, keys):
+        """Update only the output weights rows of the given fields."""
+        self.output_weights_rows.patch(self.item_service.output_weights, keys)
 
     def calculate_weights(self):
         """Manually trigger weight calculation and update the output weights"""
@@ -585,15 +654,9 @@ class MainMenu:
         self.root.update_idletasks()  # Force UI update
         
         try:
-            # Do the calculation
+            # Do the calculation; the table and cards are patched by the
+            # change notifications
             self.item_service.calculate_and_apply_output_weights()
-            
-            # Update the output weights table first
-            self.update_output_weights_table()
-            
-            # Then update display if items are shown
-            if self.optimal_items:
-                self.show_optimal_items()
                 
             # Save the changes
             self.item_service.save_data()
@@ -603,6 +666,11 @@ class MainMenu:
             self.root.after(500, lambda: self.calc_weights_btn.config(
                 bg=original_bg, text=original_text))
 
+    def _on_close(self):
+        """Write any pending save before closing the window."""
+        self.item_service.flush()
+        self.root.destroy()
+
     def run(self):
         self.root.mainloop()
 
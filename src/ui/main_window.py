@@ -1,14 +1,17 @@
 """Main window component for the application."""
 import tkinter as tk
 from typing import List
-from models.category import Category
-from services.item_service import ItemService
-from services.optimizer import OptimizerService
-from ui.search_bar import SearchBar
-from ui.item_list import ItemList
-from ui.item_editor import ItemEditor
-from ui.weight_sidebar import WeightSidebar
-from utils.constants import UIConstant
+from src.models.category import Category
+from src.services.item_service import ItemService
+from src.services.optimizer import OptimizerService
+from src.services.event_bus import ItemAdded, ItemChanged, ItemRemoved, WeightsRecomputed
+from src.ui.search_bar import SearchBar
+from src.ui.item_list import ItemList
+from src.ui.canvas_item_list import CanvasItemList
+from src.ui.item_editor import ItemEditor
+from src.ui.weight_sidebar import WeightSidebar
+from src.ui.window_manager import WindowManager
+from src.utils.constants import UIConstant
 
 class MainWindow:
     """Main window of the application."""
@@ -123,8 +126,8 @@ class MainWindow:
     def _on_optimize(self, budget: int):
         """Handle optimization request."""
         # Find optimal items
-        optimal_items, _, _ = self.optimizer_service.find_optimal_items(
-            budget, self.item_service.items)
+        optimal_items, _, _ = self.optimizer_service.solve(
+            budget, self.item_service.snapshot(), self.item_service.fingerprint)
         
         # Update item list
         self.item_list.set_optimal_items(optimal_items)
@@ -239,8 +242,21 @@ class SearchWindow:
         self.root.bind("<FocusOut>", self._on_window_focus_out)
         self.root.bind('<Configure>', self._on_window_resize)
 
+        # The item editor popup is built once and reused
+        self.windows = WindowManager(self.root)
+
         self._setup_ui()
         self._refresh_display()
+        
+        # Patch the display from change notifications; unsubscribe when closed
+        events = self.item_service.events
+        self._unsubscribers = [
+            events.subscribe(ItemAdded, self._on_items_changed),
+            events.subscribe(ItemChanged, self._on_items_changed),
+            events.subscribe(ItemRemoved, self._on_items_removed),
+            events.subscribe(WeightsRecomputed, self._on_weights_recomputed),
+        ]
+        self.root.bind('<Destroy>', self._on_destroy, add="+")
 
     def _setup_ui(self):
         self.container = tk.Frame(self.root)
@@ -262,7 +278,8 @@ class SearchWindow:
         )
         self.search_bar.pack(fill=tk.X)
 
-        self.item_list = ItemList(
+        # The full catalog is shown here, so draw cards on a canvas
+        self.item_list = CanvasItemList(
             self.main_frame,
             on_edit=self._on_edit_item
         )
@@ -275,8 +292,8 @@ class SearchWindow:
             on_cancel=self._on_cancel_edit
         )
 
-    def _refresh_display(self):
-        """Refresh the item display."""
+    def _get_view(self):
+        """Get the sorted view matching the current search criteria."""
         # Get current search text and categories
         search_text = self.search_bar.search_var.get().strip()
         
@@ -288,11 +305,14 @@ class SearchWindow:
         if self.search_bar.show_survival.get():
             categories.append(Category.SURVIVAL)
         
-        # Get filtered items
-        items = self.item_service.get_filtered_items(search_text, categories)
-        
-        # Update display
-        self.item_list.display_items(items)
+        # The search box accepts queries like "cdr>=10 price<5000 effects:shield";
+        # text that doesn't parse is searched as a plain name. Views are
+        # memoized, so unchanged criteria cost a dictionary lookup
+        return self.item_service.item_view(search_text, categories, self.item_list.optimal_items)
+
+    def _refresh_display(self):
+        """Refresh the item display."""
+        self.item_list.display_view(self._get_view())
 
     def _on_search_change(self, search_text: str, categories: List[Category]):
         """Handle changes to search criteria."""
@@ -301,8 +321,8 @@ class SearchWindow:
     def _on_optimize(self, budget: int):
         """Handle optimization request."""
         # Find optimal items
-        optimal_items, _, _ = self.optimizer_service.find_optimal_items(
-            budget, self.item_service.items)
+        optimal_items, _, _ = self.optimizer_service.solve(
+            budget, self.item_service.snapshot(), self.item_service.fingerprint)
         
         # Update item list
         self.item_list.set_optimal_items(optimal_items)
@@ -326,24 +346,44 @@ class SearchWindow:
             success = self.item_service.update_item(name, item)
         else:
             success = self.item_service.add_item(item)
-            
-        if success:
-            self._refresh_display()
+        # The display is patched by the change notifications
         return success
 
     def _on_delete_item(self, name: str) -> bool:
         """Handle delete item request."""
-        success = self.item_service.delete_item(name)
-        if success:
-            self._refresh_display()
-        return success
+        return self.item_service.delete_item(name)
 
     def _on_cancel_edit(self):
         """Handle cancel edit request."""
-        if hasattr(self, 'editor_popup') and self.editor_popup:
-            self.editor_popup.destroy()
-            self.editor_popup = None
-        self._refresh_display()
+        self.windows.hide("item_editor")
+
+    def _on_items_changed(self, event):
+        """Redraw changed cards, or refresh if the matching items or their order changed."""
+        view = self._get_view()
+        sections = [list(section) for section in view.sections if section]
+        if set(view.items) != set(self.item_list.items) or sections != self.item_list.sections:
+            self._refresh_display()
+            return
+        self.item_list.update_items({
+            name: self.item_service.get_item(name)
+            for name in event.names & set(self.item_list.items)
+        })
+
+    def _on_items_removed(self, event):
+        """Remove the cards of deleted items."""
+        self.item_list.remove_items(event.names)
+
+    def _on_weights_recomputed(self, event):
+        """Redraw the cards whose weight changed, re-sorting if needed."""
+        if event.names & set(self.item_list.items):
+            self._on_items_changed(event)
+
+    def _on_destroy(self, event):
+        """Stop listening for changes once the window is closed."""
+        if event.widget == self.root:
+            for unsubscribe in self._unsubscribers:
+                unsubscribe()
+            self._unsubscribers = []
 
     def _on_window_resize(self, event):
         """Handle window resize events."""
@@ -363,17 +403,17 @@ class SearchWindow:
 
     # Add a new method for popup editing
     def _open_item_editor_popup(self, name, item):
-        self.editor_popup = tk.Toplevel(self.root)
-        self.editor_popup.title(f"Edit Item: {name}")
-        self.editor_popup.transient(self.root)
-        self.editor_popup.grab_set()
-        self.editor_popup.geometry("600x400")
-        # Place the item editor in the popup
-        self.popup_item_editor = ItemEditor(
-            self.editor_popup,
-            on_save=self._on_save_item,
-            on_delete=self._on_delete_item,
-            on_cancel=self._on_cancel_edit
-        )
-        self.popup_item_editor.pack(fill=tk.BOTH, expand=True)
+        def build(win):
+            # Place the item editor in the popup
+            editor = ItemEditor(
+                win,
+                on_save=self._on_save_item,
+                on_delete=self._on_delete_item,
+                on_cancel=self._on_cancel_edit
+            )
+            editor.pack(fill=tk.BOTH, expand=True)
+            return editor
+
+        self.popup_item_editor = self.windows.show("item_editor", build, title=f"Edit Item: {name}",
+                                                   geometry="600x400", modal=True)
         self.popup_item_editor.edit_item(name, item) 
\ No newline at end of file
@@ -0,0 +1,267 @@
+"""Optional Tk event-loop instrumentation with a small performance HUD."""
+import json
+import math
+import time
+import tkinter as tk
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional
+
+# Heartbeat period and HUD refresh period, in milliseconds
+HEARTBEAT_MS = 100
+HUD_REFRESH_MS = 500
+# Durations kept per statistic for percentiles
+SAMPLE_WINDOW = 2000
+
+
+class LatencyStats:
+    """Count, total and recent samples of a duration, in seconds."""
+
+    def __init__(self, window: int = SAMPLE_WINDOW):
+        """Initialize empty statistics.
+
+        Args:
+            window: Number of most recent samples kept for percentiles
+        """
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        """Record one duration."""
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Duration below which the given fraction of recent samples fall.
+
+        Args:
+            fraction: Between 0 and 1, e.g. 0.95
+
+        Returns:
+            Nearest-rank percentile, or 0 without samples
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered), max(1, math.ceil(fraction * len(ordered)))) - 1
+        return ordered[index]
+
+    def to_dict(self) -> Dict:
+        """Summary in milliseconds, for dumps."""
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(0.5) * 1000,
+            "p95_ms": self.percentile(0.95) * 1000,
+            "max_ms": self.max * 1000,
+            "last_ms": self.last * 1000,
+        }
+
+
+class PerfMonitor:
+    """Times Tk callbacks, probes event-loop lag and shows a HUD.
+
+    install() wraps tkinter.CallWrapper, through which Tk invokes every
+    Python callback: button commands, event bindings, variable traces and
+    after() jobs. A heartbeat after() job measures how late it runs, which
+    is the lag a user feels. Solve and render times are reported by the
+    application through record_solve() and measure().
+    """
+
+    def __init__(self, heartbeat_ms: int = HEARTBEAT_MS):
+        """Initialize the monitor; nothing is instrumented until install().
+
+        Args:
+            heartbeat_ms: Period of the lag probe in milliseconds
+        """
+        self.heartbeat_ms = heartbeat_ms
+        self.callbacks = LatencyStats()
+        self.lag = LatencyStats()
+        self.timings: Dict[str, LatencyStats] = {}
+        # Per callback name, to find the slow ones
+        self.by_callback: Dict[str, LatencyStats] = {}
+        self.solves = 0
+        self.cache_hits = 0
+        self.last_solve: Optional[Dict] = None
+        self.root: Optional[tk.Misc] = None
+        self._original_call = None
+        self._hud: Optional[tk.Toplevel] = None
+        self._hud_labels: Dict[str, tk.Label] = {}
+        self._expected: Optional[float] = None
+
+    def install(self, root: tk.Misc) -> None:
+        """Start timing callbacks and probing the event loop of root.
+
+        Args:
+            root: Application root window
+        """
+        if self._original_call is not None:
+            return
+        self.root = root
+        original = tk.CallWrapper.__call__
+        monitor = self
+
+        def timed_call(wrapper, *args):
+            start = time.perf_counter()
+            try:
+                return original(wrapper, *args)
+            finally:
+                monitor._record_callback(wrapper.func, time.perf_counter() - start)
+
+        self._original_call = original
+        tk.CallWrapper.__call__ = timed_call
+        self._expected = time.perf_counter() + self.heartbeat_ms / 1000
+        root.after(self.heartbeat_ms, self._heartbeat)
+
+    def uninstall(self) -> None:
+        """Stop timing callbacks."""
+        if self._original_call is not None:
+            tk.CallWrapper.__call__ = self._original_call
+            self._original_call = None
+
+    def _record_callback(self, func, seconds: float) -> None:
+        """Add a callback duration to the totals and to its name's stats."""
+        func = _unwrap_after(func)
+        if func == self._heartbeat:
+            return  # The probe's own runtime is not user work
+        self.callbacks.add(seconds)
+        name = getattr(func, "__qualname__", None) or type(func).__name__
+        stats = self.by_callback.get(name)
+        if stats is None:
+            stats = self.by_callback[name] = LatencyStats(window=200)
+        stats.add(seconds)
+
+    def _heartbeat(self) -> None:
+        """Measure how late this job ran, then schedule the next one."""
+        now = time.perf_counter()
+        if self._expected is not None:
+            self.lag.add(max(0.0, now - self._expected))
+        self._expected = now + self.heartbeat_ms / 1000
+        if self.root is not None and self._original_call is not None:
+            self.root.after(self.heartbeat_ms, self._heartbeat)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time a block under a name, e.g. "render".
+
+        Args:
+            name: Statistic to add the duration to
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.setdefault(name, LatencyStats()).add(time.perf_counter() - start)
+
+    def record_solve(self, result) -> None:
+        """Record an optimizer result.
+
+        Args:
+            result: BuildResult of the solve
+        """
+        self.solves += 1
+        self.cache_hits += bool(result.cache_hit)
+        self.last_solve = {
+            "engine": result.engine,
+            "wall_time_ms": result.wall_time * 1000,
+            "cache_hit": result.cache_hit,
+            "budget": result.budget,
+        }
+
+    def widget_count(self) -> int:
+        """Number of widgets under the root, including the root."""
+        if self.root is None:
+            return 0
+        count, stack = 0, [self.root]
+        try:
+            while stack:
+                widget = stack.pop()
+                count += 1
+                stack.extend(widget.winfo_children())
+        except tk.TclError:
+            return 0  # The window was destroyed, e.g. when dumping on exit
+        return count
+
+    def metrics(self) -> Dict:
+        """Current metrics as a JSON-serializable dictionary."""
+        slowest = sorted(self.by_callback.items(), key=lambda entry: entry[1].max, reverse=True)[:10]
+        return {
+            "timestamp": time.time(),
+            "callbacks": self.callbacks.to_dict(),
+            "event_loop_lag": self.lag.to_dict(),
+            "timings": {name: stats.to_dict() for name, stats in self.timings.items()},
+            "slowest_callbacks": {name: stats.to_dict() for name, stats in slowest},
+            "solves": self.solves,
+            "cache_hit_rate": self.cache_hits / self.solves if self.solves else None,
+            "last_solve": self.last_solve,
+            "widget_count": self.widget_count(),
+        }
+
+    def dump(self, path: str) -> None:
+        """Write the current metrics to a JSON file.
+
+        Args:
+            path: File to write
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.metrics(), f, indent=2)
+        print(f"Performance metrics written to {path}")
+
+    def show_hud(self) -> None:
+        """Open the HUD panel, or raise it if it is open."""
+        if self._hud is not None and self._hud.winfo_exists():
+            self._hud.deiconify()
+            self._hud.lift()
+            return
+        self._hud = tk.Toplevel(self.root)
+        self._hud.title("Performance")
+        self._hud.attributes("-topmost", True)
+        self._hud.resizable(False, False)
+        self._hud_labels = {}
+        for row, key in enumerate(("solve", "cache", "render", "widgets", "callbacks", "lag")):
+            label = tk.Label(self._hud, anchor="w", font=("Consolas", 9), width=44)
+            label.grid(row=row, column=0, sticky="w", padx=6)
+            self._hud_labels[key] = label
+        tk.Button(self._hud, text="Dump metrics",
+                  command=lambda: self.dump(time.strftime("perf_metrics_%Y%m%d_%H%M%S.json"))
+                  ).grid(row=6, column=0, sticky="e", padx=6, pady=4)
+        self._refresh_hud()
+
+    def _refresh_hud(self) -> None:
+        """Update the HUD labels and schedule the next refresh."""
+        if self._hud is None or not self._hud.winfo_exists():
+            return
+        solve = self.last_solve
+        render = self.timings.get("render")
+        texts = {
+            "solve": (f"Last solve: {solve['wall_time_ms']:.1f} ms ({solve['engine']})"
+                      if solve else "Last solve: -"),
+            "cache": (f"Cache hit rate: {self.cache_hits / self.solves:.0%} of {self.solves}"
+                      if self.solves else "Cache hit rate: -"),
+            "render": (f"Render: {render.last * 1000:.1f} ms, p95 {render.percentile(0.95) * 1000:.1f} ms"
+                       if render else "Render: -"),
+            "widgets": f"Widgets: {self.widget_count()}",
+            "callbacks": (f"Callbacks: {self.callbacks.count}, "
+                          f"p95 {self.callbacks.percentile(0.95) * 1000:.1f} ms, "
+                          f"max {self.callbacks.max * 1000:.1f} ms"),
+            "lag": (f"Loop lag: p95 {self.lag.percentile(0.95) * 1000:.1f} ms, "
+                    f"max {self.lag.max * 1000:.1f} ms"),
+        }
+        for key, text in texts.items():
+            self._hud_labels[key].config(text=text)
+        self._hud.after(HUD_REFRESH_MS, self._refresh_hud)
+
+
+def _unwrap_after(func):
+    """The job passed to after(), if func is the wrapper Tk registered for it."""
+    if getattr(func, "__qualname__", "").endswith("after.<locals>.callit") and func.__closure__:
+        cells = dict(zip(func.__code__.co_freevars, func.__closure__))
+        if "func" in cells:
+            return cells["func"].cell_contents
+    return func
@@ -1,8 +1,8 @@
 """Search bar component for filtering items."""
 import tkinter as tk
 from typing import Callable
-from models.category import Category
-from utils.constants import GameConstant
+from src.models.category import Category
+from src.utils.constants import GameConstant, UIConstant
 
 class SearchBar(tk.Frame):
     """Search bar component with category filters and optimization controls."""
@@ -29,9 +29,10 @@ class SearchBar(tk.Frame):
         self.show_ability = tk.BooleanVar(value=True)
         self.show_survival = tk.BooleanVar(value=True)
         
-        # Search variable
+        # Search variable; typing is debounced, see _on_search_typed
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', self._on_search_change)
+        self.search_var.trace('w', self._on_search_typed)
+        self._search_after_id = None
         
         self._setup_ui()
 
@@ -63,8 +64,17 @@ class SearchBar(tk.Frame):
         tk.Checkbutton(filter_frame, text="Survival", variable=self.show_survival,
                       command=self._on_search_change).pack(side=tk.LEFT, padx=5)
 
+    def _on_search_typed(self, *args):
+        """Run the search once typing pauses instead of on every keystroke."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(UIConstant.SEARCH_DEBOUNCE_MS, self._on_search_change)
+
     def _on_search_change(self, *args):
         """Handle changes to search text or category filters."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         search_text = self.search_var.get().strip()
         # Only filter by keywords, no optimization or buttons
         categories = []
@@ -0,0 +1,109 @@
+"""Keep a ttk.Treeview in sync with a mapping by applying only row differences."""
+import bisect
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+
+class TreeviewDiffer:
+    """Mirror a mapping of row ID to value as the rows of a Treeview.
+
+    The differ remembers the values and sort position of every row it
+    inserted, so syncing touches only rows whose formatted values changed,
+    rows that appeared and rows that went away. Rows stay ordered by
+    sort_key; a row whose sort key changed is moved, not re-inserted.
+    Untouched rows keep their selection and the view keeps its scroll
+    position.
+
+    The tree only needs Treeview's insert, item, move and delete methods.
+    """
+
+    def __init__(
+        self,
+        tree,
+        format_row: Callable[[str, Any], Tuple],
+        sort_key: Optional[Callable[[str, Any], Any]] = None
+    ):
+        """Initialize the differ for an empty tree.
+
+        Args:
+            tree: Treeview to update; rows are top-level items
+            format_row: Returns the displayed column values of a row
+            sort_key: Returns the sort key of a row; by default rows are
+                sorted by ID
+        """
+        self.tree = tree
+        self.format_row = format_row
+        self.sort_key = sort_key or (lambda row_id, value: row_id)
+        self._values: Dict[str, Tuple] = {}
+        self._keys: Dict[str, Any] = {}
+        # (sort key, row ID) of every row, in display order
+        self._order: List[Tuple[Any, str]] = []
+
+    def __contains__(self, row_id: str) -> bool:
+        return row_id in self._values
+
+    def sync(self, data: Mapping[str, Any]) -> Tuple[int, int, int]:
+        """Make the rows match data exactly.
+
+        Args:
+            data: Row ID to value
+
+        Returns:
+            Numbers of inserted, updated and removed rows
+        """
+        removed = [row_id for row_id in self._values if row_id not in data]
+        if removed:
+            self.tree.delete(*removed)
+            for row_id in removed:
+                self._forget(row_id)
+        inserted, updated, _ = self.patch(data, data)
+        return inserted, updated, len(removed)
+
+    def patch(self, data: Mapping[str, Any], row_ids: Iterable[Hashable]) -> Tuple[int, int, int]:
+        """Sync only the given rows, e.g. the keys named by a change event.
+
+        Args:
+            data: Row ID to value; IDs missing from it are removed
+            row_ids: IDs of the rows that may have changed
+
+        Returns:
+            Numbers of inserted, updated and removed rows
+        """
+        inserted = updated = removed = 0
+        for row_id in row_ids:
+            if row_id not in data:
+                if row_id in self._values:
+                    self.tree.delete(row_id)
+                    self._forget(row_id)
+                    removed += 1
+                continue
+
+            value = data[row_id]
+            values = self.format_row(row_id, value)
+            key = self.sort_key(row_id, value)
+            if row_id not in self._values:
+                index = bisect.bisect_left(self._order, (key, row_id))
+                self._order.insert(index, (key, row_id))
+                self.tree.insert("", index, iid=row_id, values=values)
+                inserted += 1
+            else:
+                if key != self._keys[row_id]:
+                    self._unorder(row_id)
+                    index = bisect.bisect_left(self._order, (key, row_id))
+                    self._order.insert(index, (key, row_id))
+                    self.tree.move(row_id, "", index)
+                if values != self._values[row_id]:
+                    self.tree.item(row_id, values=values)
+                    updated += 1
+            self._values[row_id] = values
+            self._keys[row_id] = key
+        return inserted, updated, removed
+
+    def _unorder(self, row_id: str) -> None:
+        """Drop a row's entry from the display order."""
+        del self._order[bisect.bisect_left(self._order, (self._keys[row_id], row_id))]
+
+    def _forget(self, row_id: str) -> None:
+        """Drop a row from the bookkeeping; the caller updates the tree."""
+        self._unorder(row_id)
+        del self._keys[row_id]
+        del self._values[row_id]
@@ -1,8 +1,8 @@
 """Weight sidebar component for adjusting item weights."""
 import tkinter as tk
 from typing import Dict, Callable
-from utils.constants import OptionalField
-from utils.validators import validate_weight_input, round_to_nearest_fraction
+from src.utils.constants import OptionalField
+from src.utils.validators import validate_weight_input, round_to_nearest_fraction
 
 class WeightSidebar(tk.Frame):
     """Sidebar component for adjusting item weights."""
@@ -0,0 +1,88 @@
+"""Build each kind of Toplevel window once and reuse it."""
+import tkinter as tk
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class WindowManager:
+    """Keeps one Toplevel per window kind, built lazily on first show.
+
+    Closing a managed window only withdraws it, so the widget tree, and
+    anything it built such as item cards, survives for the next show. The
+    caller rebinds the returned content to new data after each show.
+    """
+
+    def __init__(self, root: tk.Misc):
+        """Initialize the window manager.
+
+        Args:
+            root: Parent of the managed windows
+        """
+        self.root = root
+        self._windows: Dict[str, Tuple[tk.Toplevel, Any, bool]] = {}
+
+    def show(
+        self,
+        kind: str,
+        build: Callable[[tk.Toplevel], Any],
+        title: str,
+        geometry: Optional[str] = None,
+        modal: bool = False
+    ) -> Any:
+        """Show the window of a kind, building it on first use.
+
+        Args:
+            kind: Key of the window, e.g. "search"
+            build: Creates the window's content inside the given Toplevel
+                and returns it; only called the first time
+            title: Window title, set on every show
+            geometry: Initial geometry, e.g. "1024x800"
+            modal: Keep the window above the root and grab input while shown
+
+        Returns:
+            The content returned by build
+        """
+        entry = self._windows.get(kind)
+        if entry is None or not entry[0].winfo_exists():
+            win = tk.Toplevel(self.root)
+            win.withdraw()
+            if geometry:
+                win.geometry(geometry)
+            if modal:
+                win.transient(self.root)
+            win.protocol("WM_DELETE_WINDOW", lambda: self.hide(kind))
+            entry = (win, build(win), modal)
+            self._windows[kind] = entry
+
+        win, content, modal = entry
+        win.title(title)
+        win.deiconify()
+        win.lift()
+        if modal:
+            win.grab_set()
+        win.focus_set()
+        return content
+
+    def hide(self, kind: str) -> None:
+        """Withdraw the window of a kind, keeping it for reuse.
+
+        Args:
+            kind: Key of the window
+        """
+        entry = self._windows.get(kind)
+        if entry is None or not entry[0].winfo_exists():
+            return
+        win, _, modal = entry
+        if modal:
+            win.grab_release()
+        win.withdraw()
+
+    def closer(self, kind: str) -> Callable[[], None]:
+        """Callback that hides the window of a kind, e.g. for Cancel buttons.
+
+        Args:
+            kind: Key of the window
+
+        Returns:
+            Function taking no arguments
+        """
+        return lambda: self.hide(kind)
@@ -32,6 +32,9 @@ class RequiredField(StrEnum):
 class UIConstant(IntEnum):
     CARD_WIDTH = 280
     CARD_PADDING = 4
+    CARD_HEIGHT = 150
+    SEPARATOR_HEIGHT = 22
+    SEARCH_DEBOUNCE_MS = 150
     DEFAULT_COLUMNS = 3
     MIN_WINDOW_WIDTH = 350
     MIN_WINDOW_HEIGHT = 600
@@ -43,6 +46,31 @@ class GameConstant(IntEnum):
     MAX_ITEMS = 6
 
 
+class StorageConstant(IntEnum):
+    SAVE_INTERVAL_MS = 500
+    JOURNAL_COMPACT_BYTES = 256 * 1024
+
+
+class CacheConstant(IntEnum):
+    SOLVE_CACHE_SIZE = 128
+    VIEW_CACHE_SIZE = 32
+
+
+class BatchConstant(IntEnum):
+    CHUNK_SIZE = 64
+    WEIGHTINGS_PER_WORKER = 16
+    QUERY_CACHE_SIZE = 64
+
+
+class ServerConstant(IntEnum):
+    DEFAULT_PORT = 8765
+    DEADLINE_MS = 10_000
+    MAX_DEADLINE_MS = 60_000
+    MAX_BODY_BYTES = 64 * 1024
+    MAX_SWEEP_POINTS = 200
+    RESULT_CACHE_SIZE = 1024
+
+
 # Optional fields that can be added to items
 # OPTIONAL_FIELDS = [
 #     'Weapon Power',
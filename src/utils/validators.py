@@ -1,5 +1,6 @@
 """Validation utilities for the application."""
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
+from src.models.item import NON_STAT_FIELDS
 
 
 def validate_item_input(
@@ -52,6 +53,42 @@ def validate_item_input(
     return True, None
 
 
+def validate_item_record(name: str, record: Dict) -> Tuple[bool, Optional[str]]:
+    """Validate an item dictionary read from an external catalog.
+    
+    Args:
+        name: Item name
+        record: Item fields keyed like items.json (Price, Adjustment, ...)
+        
+    Returns:
+        Tuple containing:
+        - bool: True if validation passed
+        - str or None: Error message if validation failed, None if passed
+    """
+    if 'Price' not in record:
+        return False, "Price is required"
+    valid, error = validate_item_input(
+        str(name),
+        str(record['Price']),
+        str(record.get('Adjustment', 0)),
+        str(record.get('Effect Value', 0))
+    )
+    if not valid:
+        return valid, error
+    
+    # Validate stats
+    for key, value in record.items():
+        if key in NON_STAT_FIELDS:
+            continue
+        try:
+            if int(str(value)) < 0:
+                return False, f"{key} must be a non-negative integer"
+        except (TypeError, ValueError):
+            return False, f"{key} must be a valid integer"
+    
+    return True, None
+
+
 def validate_weight_input(value: str) -> Tuple[bool, Optional[float]]:
     """Validate a weight input value.
     
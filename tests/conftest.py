@@ -0,0 +1,22 @@
+import sys
+import os
+import io
+import shutil
+import contextlib
+import pytest
+
+# Adjust path for local imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+
+REPO_ITEMS = os.path.join(os.path.dirname(__file__), "..", "src", "items.json")
+
+@pytest.fixture
+def item_service(tmp_path):
+    """ItemService over a copy of the repo catalog in tmp_path."""
+    items_path = tmp_path / "items.json"
+    shutil.copy(REPO_ITEMS, items_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ItemService(FileService(str(items_path)))
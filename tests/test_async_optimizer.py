@@ -0,0 +1,85 @@
+import sys
+import os
+import io
+import time
+import asyncio
+import threading
+import contextlib
+import pytest
+
+# Adjust path for local imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.item import Item
+from src.services.async_optimizer import AsyncOptimizerService
+from src.services.optimizer import OptimizerService, SolveCancelled
+
+def _items(count=24):
+    return {f"I{i}": Item(f"I{i}", 500 + 137 * (i % 13), total_weight=5 + (i * 7) % 23)
+            for i in range(count)}
+
+def test_async_results_match_sync():
+    items = _items()
+    budgets = [5000, 2500, 4000, 2500]
+
+    async def scenario():
+        async with AsyncOptimizerService(max_workers=2) as service:
+            many = await service.solve_many(budgets, items, cache_key="catalog")
+            swept = await service.sweep(budgets, items, cache_key="other")
+            again = await service.solve(4000, items, cache_key="catalog")
+            return many, swept, again
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        many, swept, again = asyncio.run(scenario())
+        expected = [OptimizerService.find_optimal_items(budget, items) for budget in budgets]
+    assert [result.as_tuple()[1:] for result in many] == [result.as_tuple()[1:] for result in expected]
+    assert [abs(a.weight - b.weight) < 1e-6 for a, b in zip(swept, expected)] == [True] * 4
+    assert again.cache_hit
+
+def test_concurrency_limit_and_cancellation():
+    optimizer = OptimizerService()
+    active, peak = [0], [0]
+    lock = threading.Lock()
+    stopped = threading.Event()
+
+    def slow_search(budget, items, cancel=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        try:
+            while not cancel.is_set():
+                if budget < 100:
+                    return OptimizerService.find_optimal_items(0, {})
+                time.sleep(0.005)
+            stopped.set()
+            raise SolveCancelled()
+        finally:
+            with lock:
+                active[0] -= 1
+
+    optimizer.find_optimal_items = slow_search
+
+    async def scenario():
+        service = AsyncOptimizerService(optimizer, max_workers=4, max_concurrency=2)
+        quick = await service.solve_many([1, 2, 3, 4, 5], {})
+        task = asyncio.ensure_future(service.solve(1000, {}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        service.close()
+        return quick
+
+    assert len(asyncio.run(scenario())) == 5
+    assert peak[0] <= 2
+    assert stopped.wait(1.0)
+
+def test_search_stops_when_cancelled():
+    cancel = threading.Event()
+    cancel.set()
+    items = _items(60)
+    with contextlib.redirect_stdout(io.StringIO()):
+        with pytest.raises(SolveCancelled):
+            OptimizerService.find_optimal_items(20000, items, cancel)
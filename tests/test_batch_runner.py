@@ -0,0 +1,57 @@
+import io
+import json
+import contextlib
+
+from src.cli import apply_profiles
+from src.services.batch_runner import BatchQuery, BatchRunner
+from src.services.optimizer import OptimizerService
+from src.services.item_service import combine_output_weights
+
+def _run(runner, lines):
+    records = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats = runner.run(lines, records.append)
+    return records, stats
+
+def test_batch_matches_service_weights_and_keeps_order(item_service):
+    profile = "1 Weapon Power"
+    lines = [json.dumps({"id": f"q{i}", "budget": budget, "profiles": profiles})
+             for i, (budget, profiles) in enumerate([(5000, [profile]), (4000, []), (5000, [profile])])]
+    lines.insert(1, "not json")
+    lines.append(json.dumps({"budget": 4000, "profiles": ["No Such Profile"]}))
+    lines.append("")
+
+    records, stats = _run(BatchRunner(item_service, processes=0, chunk_size=2), lines)
+    assert [record["id"] for record in records] == ["q0", 2, "q1", "q2", 5]
+    assert "error" in records[1] and "error" in records[4]
+    assert stats.queries == 5 and stats.errors == 2
+
+    # The same query through the service's own weighting
+    with contextlib.redirect_stdout(io.StringIO()):
+        apply_profiles(item_service, [profile])
+        result = OptimizerService.find_optimal_items(5000, item_service.snapshot())
+    assert abs(records[0]["weight"] - result.weight) < 1e-6
+    assert records[3]["weight"] == records[0]["weight"] and records[3]["cache_hit"]
+
+def test_batch_pool_matches_inline_and_scales(item_service):
+    runner = BatchRunner(item_service, processes=0, chunk_size=3)
+    query = runner.parse(json.dumps(
+        {"budget": 4500, "profiles": ["1 Weapon Power"], "scales": {"1 Weapon Power": 1.0},
+         "query": "category:weapon"}), 1)
+    assert isinstance(query, BatchQuery) and query.positions
+    assert query.scales == (("1 Weapon Power", 1.0),)
+
+    weights = {name: dict(profile, _enabled=True) for name, profile in item_service.weights.items()}
+    low = combine_output_weights(weights, ["1 Weapon Power"], {"1 Weapon Power": 0.0})
+    high = combine_output_weights(weights, ["1 Weapon Power"], {"1 Weapon Power": 1.0})
+    assert low != high
+
+    lines = [json.dumps({"id": i, "budget": 3500 + 250 * (i % 6),
+                         "profiles": ["1 Weapon Power"] if i % 2 else [],
+                         "scales": {"1 Weapon Power": (i % 3) / 2}})
+             for i in range(20)]
+    inline, _ = _run(runner, lines)
+    pooled, stats = _run(BatchRunner(item_service, processes=2, chunk_size=3), lines)
+    assert [r["id"] for r in pooled] == list(range(20))
+    assert [(r["price"], r["weight"]) for r in pooled] == [(r["price"], r["weight"]) for r in inline]
+    assert stats.queries_per_second > 0
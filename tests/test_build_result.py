@@ -0,0 +1,58 @@
+import sys
+import os
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.optimizer import OptimizerService
+from src.models.build_result import BuildResult
+from src.models.item import Item
+
+def test_result_is_tuple_compatible():
+    items = {"A": Item("A", 500, total_weight=10), "B": Item("B", 400, total_weight=20)}
+    result = OptimizerService.find_optimal_items(1000, items)
+    names, price, weight = result
+    assert set(names) == {"A", "B"}
+    assert (price, weight) == (result[1], result[2])
+    assert result == (result.names, result.price, result.weight)
+    assert len(result) == 3
+
+def test_result_carries_instrumentation():
+    items = {
+        "A": Item("A", 500, adjustment=3, total_weight=10, stats={"Armor": 5}),
+        "B": Item("B", 400, total_weight=20, stats={"Armor": 2, "Health": 25}),
+        "C": Item("C", 5000, total_weight=99),
+    }
+    result = OptimizerService.find_optimal_items(1000, items)
+    assert sorted(result.item_indices) == [0, 1]
+    assert result.stat_totals == {"Adjustment": 3, "Armor": 7, "Health": 25}
+    assert result.budget == 1000
+    assert result.engine in ("cpp", "python")
+    assert result.wall_time >= 0
+    assert result.cache_hit is False
+    assert result.reduction_stats["items_in"] == 3
+    assert result.reduction_stats["items_over_budget"] == 1
+    if result.engine == "python":
+        assert result.nodes_expanded > 0
+
+def test_python_engine_counts_nodes():
+    items = {chr(65+i): Item(chr(65+i), 100, total_weight=10+i) for i in range(8)}
+    result = OptimizerService._find_optimal_items_backtrack(1000, items)
+    assert result.engine == "python"
+    assert result.nodes_expanded > 1
+    assert result.nodes_pruned > 0
+    assert [list(items)[i] for i in result.item_indices] == result.names
+
+def test_result_equality():
+    assert BuildResult(["A"], 1, 2.0) == BuildResult(["A"], 1, 2.0, engine="cpp")
+    assert BuildResult([], 0, 0) == ([], 0, 0)
+
+def test_solve_cache_hits_on_same_key():
+    items = {f"Item {i}": Item(f"Item {i}", 1000 + i, total_weight=i) for i in range(10)}
+    optimizer = OptimizerService(cache_size=2)
+    first = optimizer.solve(3000, items, cache_key="v1")
+    second = optimizer.solve(3000, items, cache_key="v1")
+    assert not first.cache_hit and second.cache_hit
+    assert second == first and second.names is not first.names
+    assert not optimizer.solve(4000, items, cache_key="v1").cache_hit
+    assert not optimizer.solve(3000, items).cache_hit
@@ -0,0 +1,57 @@
+import sys
+import os
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.catalog_history import CatalogHistory
+from src.services.optimizer import OptimizerService
+from src.models.item import Item
+
+def _versions():
+    base = {f"Item {i}": {"Price": 1000 + 250 * (i % 4), "Adjustment": i % 7, "Armor": i % 3}
+            for i in range(12)}
+    versions = [base]
+    for v in range(1, 6):
+        items = {name: dict(data) for name, data in versions[-1].items()}
+        items[f"Item {v}"]["Price"] += 250  # only gets worse
+        if v == 3:
+            items["Patch 3 Item"] = {"Price": 1000, "Adjustment": 9}
+        if v == 4:
+            del items["Item 11"]
+        versions.append(items)
+    return versions
+
+def test_time_travel_and_reload(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    history = CatalogHistory(path)
+    versions = _versions()
+    for v, items in enumerate(versions):
+        assert history.commit(items, label=f"S{v}") == v
+    for v, items in enumerate(versions):
+        assert history.get(v) == items
+    assert history.get(-1) == versions[-1]
+    
+    reloaded = CatalogHistory(path)
+    assert len(reloaded) == len(versions)
+    assert reloaded.labels == [f"S{v}" for v in range(len(versions))]
+    assert reloaded.get(3) == versions[3]
+    assert set(reloaded.patch(3).added) == {"Patch 3 Item"}
+
+def test_replay_matches_cold_solves_and_reuses_results(tmp_path):
+    history = CatalogHistory(str(tmp_path / "history.jsonl"))
+    versions = _versions()
+    for v, items in enumerate(versions):
+        history.commit(items, label=f"S{v}")
+    weight_sets = {"base": {"Adjustment": 1.0, "Armor": 2.0}, "armor": {"Adjustment": 0.5, "Armor": 5.0}}
+    
+    rows = list(history.replay([3500, 6000], weight_sets))
+    assert len(rows) == len(versions) * 2 * 2
+    assert any(row.reused for row in rows)
+    for row in rows:
+        items = {}
+        for name, data in versions[row.version].items():
+            items[name] = Item.from_dict(name, data)
+            items[name].calculate_total_weight(weight_sets[row.weights_name])
+        cold = OptimizerService.find_optimal_items(row.budget, items)
+        assert abs(cold.weight - row.result.weight) < 1e-9
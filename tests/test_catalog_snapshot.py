@@ -0,0 +1,84 @@
+import sys
+import os
+import random
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.catalog_snapshot import CatalogSnapshot
+from src.models.item import Item
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+
+def test_snapshot_matches_dict_under_random_edits():
+    rng = random.Random(3)
+    reference = {}
+    snapshot = CatalogSnapshot()
+    history = []
+    for step in range(3000):
+        name = f"Item {rng.randrange(400)}"
+        if rng.random() < 0.3:
+            reference.pop(name, None)
+            snapshot = snapshot.remove(name)
+        else:
+            item = Item(name, rng.randrange(1, 10000))
+            reference[name] = item
+            snapshot = snapshot.set(name, item)
+        if step % 500 == 0:
+            history.append((snapshot, dict(reference)))
+    assert dict(snapshot.items()) == reference
+    assert len(snapshot) == len(reference)
+    for old_snapshot, old_reference in history:  # old versions are untouched
+        assert dict(old_snapshot.items()) == old_reference
+
+def test_snapshot_equality_and_hash_follow_content():
+    items = {f"Item {i}": Item(f"Item {i}", 1000 + i) for i in range(50)}
+    a = CatalogSnapshot.from_items(items)
+    b = CatalogSnapshot.from_items(dict(reversed(list(items.items()))))
+    assert a == b and hash(a) == hash(b)
+    c = a.set("Item 3", Item("Item 3", 1))
+    assert c != a and "Item 3" in c and c["Item 3"].price == 1
+    assert a.set("Item 3", Item("Item 3", 1003)) == a
+
+def test_item_service_publishes_new_versions(tmp_path):
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    item_service.output_weights = {"Adjustment": 2.0}
+    item_service.add_item(Item("Shield", 1000, adjustment=1))
+    pinned = item_service.snapshot()
+    item_service.update_item("Shield", Item("Shield", 2000, adjustment=3))
+    item_service.get_item("Shield").adjustment = 99  # in-place edits don't leak
+    assert pinned["Shield"].price == 1000 and pinned["Shield"].total_weight == 2
+    assert item_service.snapshot()["Shield"].adjustment == 3
+    assert item_service.snapshot().version > pinned.version
+    with item_service.batch():
+        item_service.add_item(Item("Armor", 500, adjustment=1))
+        item_service.delete_item("Shield")
+        assert "Armor" not in item_service.snapshot()
+    assert set(item_service.snapshot()) == {"Armor"}
+    assert item_service.snapshot()["Armor"].total_weight == 2
+
+def test_fingerprint_tracks_content_not_history(tmp_path):
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    item_service.output_weights = {"Adjustment": 2.0}
+    item_service.add_item(Item("Shield", 1000, adjustment=1))
+    before = item_service.fingerprint
+    item_service.update_item("Shield", Item("Shield", 1500, adjustment=1))
+    assert item_service.fingerprint != before
+    item_service.update_item("Shield", Item("Shield", 1000, adjustment=1))
+    assert item_service.fingerprint == before
+    item_service.enabled_profiles.add("Tank")
+    assert item_service.fingerprint != before
+
+def test_recalculation_republishes_only_reweighed_items(tmp_path):
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    item_service.output_weights = {"Adjustment": 2.0, "Effect Value": 1.0}
+    item_service.add_item(Item("Shield", 1000, adjustment=1))
+    item_service.add_item(Item("Armor", 500, effect_value=1))
+    before = item_service.snapshot()
+    item_service.recalculate_weights()
+    assert item_service.snapshot() is before
+    item_service.output_weights = {"Adjustment": 3.0, "Effect Value": 1.0}
+    item_service.recalculate_weights()
+    after = item_service.snapshot()
+    assert after.version == before.version + 1
+    assert after["Armor"] is before["Armor"] and after["Shield"].total_weight == 3
@@ -0,0 +1,63 @@
+import sys
+import os
+import io
+import json
+import shutil
+import subprocess
+import contextlib
+
+# Adjust path for local imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import cli
+from src.models.item import Item
+from src.services.optimizer import OptimizerService
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+REPO_ITEMS = os.path.join(REPO_ROOT, "src", "items.json")
+
+def test_top_builds_and_sweep_match_single_solves():
+    items = {name: Item(name, price, total_weight=weight) for name, price, weight in [
+        ("A", 1000, 10), ("B", 1500, 18), ("C", 2000, 21), ("D", 2500, 30),
+        ("E", 3000, 28), ("F", 500, 4), ("G", 4000, 45),
+    ]}
+    optimizer = OptimizerService()
+    for budget in (1500, 4000, 7500, 20000):
+        names, price, weight = OptimizerService.find_optimal_items(budget, items)
+        top = OptimizerService.find_top_builds(budget, items, 3)
+        assert abs(top[0].weight - weight) < 1e-6
+        assert all(build.price <= budget for build in top)
+        assert [b.weight for b in top] == sorted((b.weight for b in top), reverse=True)
+        assert len({tuple(sorted(b.names)) for b in top}) == len(top)
+
+    budgets = [20000, 1500, 7500, 4000]
+    swept = optimizer.sweep(budgets, items)
+    assert [result.budget for result in swept] == budgets
+    for result in swept:
+        _, _, weight = OptimizerService.find_optimal_items(result.budget, items)
+        assert abs(result.weight - weight) < 1e-6
+
+def test_cli_json_output_and_read_only(tmp_path):
+    items_path = tmp_path / "items.json"
+    shutil.copy(REPO_ITEMS, items_path)
+    before = items_path.read_bytes()
+
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        code = cli.main(["frontier", "--items", str(items_path), "--max", "8000",
+                         "--step", "1500", "--profile", "1 Weapon Power", "--json", "--no-cache"])
+    assert code == 0
+    points = json.loads(out.getvalue())
+    assert points and all(point["price"] <= point["budget"] for point in points)
+    assert [p["weight"] for p in points] == sorted(p["weight"] for p in points)
+    assert items_path.read_bytes() == before
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert cli.main(["optimize", "--items", str(items_path), "--budget", "5000",
+                         "--profile", "No Such Profile"]) == 2
+
+def test_cli_does_not_import_tk():
+    check = subprocess.run(
+        [sys.executable, "-c", "import sys, src.cli; print('tkinter' in sys.modules)"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert check.stdout.strip() == "False"
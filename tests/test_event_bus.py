@@ -0,0 +1,86 @@
+import sys
+import os
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.event_bus import (
+    CatalogEvent, EventBus, ItemAdded, ItemChanged, ItemRemoved,
+    ProfileToggled, WeightsRecomputed
+)
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.models.item import Item
+
+def _service(tmp_path):
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    item_service.output_weights = {"Adjustment": 2.0}
+    events = []
+    item_service.events.subscribe(CatalogEvent, events.append)
+    return item_service, events
+
+def test_mutations_publish_typed_events(tmp_path):
+    item_service, events = _service(tmp_path)
+    item_service.add_item(Item("Shield", 1000, adjustment=1))
+    item_service.update_item("Shield", Item("Shield", 1200, adjustment=1))
+    item_service.update_item("Shield", Item("Barrier", 1200, adjustment=1))
+    item_service.delete_item("Barrier")
+    assert events == [
+        ItemAdded(frozenset({"Shield"})),
+        ItemChanged(frozenset({"Shield"})),
+        ItemRemoved(frozenset({"Shield"})),
+        ItemAdded(frozenset({"Barrier"})),
+        ItemRemoved(frozenset({"Barrier"})),
+    ]
+
+def test_batch_publishes_net_changes_once(tmp_path):
+    item_service, events = _service(tmp_path)
+    item_service.add_item(Item("Kept", 1000))
+    item_service.add_item(Item("Gone", 1000))
+    events.clear()
+    with item_service.batch():
+        item_service.add_item(Item("New", 1000))
+        item_service.add_item(Item("Temp", 1000))
+        item_service.delete_item("Temp")
+        item_service.update_item("Kept", Item("Kept", 900))
+        item_service.delete_item("Gone")
+        assert events == []
+    assert events == [
+        ItemAdded(frozenset({"New"})),
+        ItemChanged(frozenset({"Kept"})),
+        ItemRemoved(frozenset({"Gone"})),
+    ]
+
+def test_weight_events_name_only_affected_items(tmp_path):
+    item_service, events = _service(tmp_path)
+    item_service.add_item(Item("Armor", 1000, stats={"Armor": 10}))
+    item_service.add_item(Item("Plain", 1000, adjustment=1))
+    item_service.weights = {"Base Weights": {"Adjustment": 2.0, "Armor": 3.0}}
+    events.clear()
+    item_service.calculate_and_apply_output_weights()
+    item_service.recalculate_weights()
+    assert events == [
+        WeightsRecomputed(keys=frozenset({"Armor"})),
+        WeightsRecomputed(frozenset({"Armor"})),
+    ]
+
+def test_failing_handler_does_not_block_others():
+    bus = EventBus()
+    received = []
+    bus.subscribe(ProfileToggled, lambda event: 1 / 0)
+    unsubscribe = bus.subscribe(ProfileToggled, received.append)
+    bus.publish(ProfileToggled(profile="Tank", enabled=True))
+    unsubscribe()
+    bus.publish(ProfileToggled(profile="Tank", enabled=False))
+    assert received == [ProfileToggled(profile="Tank", enabled=True)]
+
+def test_dispatch_is_by_class_not_name():
+    bus = EventBus()
+    received = []
+    bus.subscribe(ItemAdded, received.append)
+    # A distinct class of the same name, as a second import of the module would create
+    duplicate = type("ItemAdded", (CatalogEvent,), {})
+    bus.publish(duplicate(frozenset({"Other"})))
+    assert received == []
+    bus.publish(ItemAdded(frozenset({"Shield"})))
+    assert received == [ItemAdded(frozenset({"Shield"}))]
@@ -0,0 +1,72 @@
+import sys
+import os
+import pytest
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.models.item import Item
+
+class CountingFileService(FileService):
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.saves = 0
+
+    def save_data(self, *args, **kwargs):
+        self.saves += 1
+        return super().save_data(*args, **kwargs)
+
+def _service(tmp_path):
+    item_service = ItemService(CountingFileService(str(tmp_path / "items.json")))
+    item_service.output_weights = {"Adjustment": 2.0, "Armor": 1.0}
+    return item_service
+
+def test_batch_issues_one_save_and_weighs_touched_items(tmp_path):
+    item_service = _service(tmp_path)
+    with item_service.batch():
+        for i in range(200):
+            item_service.add_item(Item(f"Item {i}", 1000, adjustment=i))
+        item_service.update_item("Item 0", Item("Renamed", 1000, adjustment=5, stats={"Armor": 3}))
+        item_service.delete_item("Item 1")
+        assert item_service.items["Item 2"].total_weight == 0  # deferred
+    assert item_service.file_service.saves == 1
+    assert item_service.items["Item 2"].total_weight == 4
+    assert item_service.items["Renamed"].total_weight == 13
+    assert "Item 0" not in item_service.items and "Item 1" not in item_service.items
+    reloaded = ItemService(FileService(str(tmp_path / "items.json")))
+    assert len(reloaded.items) == 199
+
+def test_batch_rolls_back_on_error(tmp_path):
+    item_service = _service(tmp_path)
+    item_service.add_item(Item("Keep", 1000, adjustment=1))
+    saves = item_service.file_service.saves
+    with pytest.raises(ValueError):
+        with item_service.batch():
+            item_service.delete_item("Keep")
+            item_service.add_item(Item("New", 1000))
+            item_service.add_item(Item("Invalid", -5))
+    assert set(item_service.items) == {"Keep"}
+    assert item_service.file_service.saves == saves
+
+def test_invalid_items_are_rejected_outside_batches(tmp_path):
+    item_service = _service(tmp_path)
+    item_service.add_item(Item("Keep", 1000, adjustment=1))
+    saves = item_service.file_service.saves
+    with pytest.raises(ValueError):
+        item_service.add_item(Item("Invalid", -5))
+    with pytest.raises(ValueError):
+        item_service.update_item("Keep", Item("Keep", 1000, adjustment=-1))
+    assert set(item_service.items) == {"Keep"}
+    assert item_service.items["Keep"].adjustment == 1
+    assert item_service.file_service.saves == saves
+
+def test_nested_batches_commit_once(tmp_path):
+    item_service = _service(tmp_path)
+    with item_service.batch():
+        with item_service.batch():
+            item_service.add_item(Item("A", 1000))
+        assert item_service.file_service.saves == 0
+        item_service.add_item(Item("B", 1000))
+    assert item_service.file_service.saves == 1
@@ -0,0 +1,53 @@
+import sys
+import os
+import json
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.item_importer import CatalogImporter
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.models.category import Category
+from src.models.item_table import ItemTable
+
+def test_jsonl_import_validates_in_batches(tmp_path):
+    path = tmp_path / "catalog.jsonl"
+    lines = [json.dumps({"name": f"Item {i}", "Price": 1000 + i, "Category": "Weapon", "Armor": i})
+             for i in range(10)]
+    lines += ['{"name": "Broken"', json.dumps({"name": "Free", "Price": 0}),
+              json.dumps({"Price": 100}), json.dumps({"name": "Odd", "Price": 5, "Category": "Hat"})]
+    path.write_text("\n".join(lines) + "\n")
+    
+    progress = []
+    table = ItemTable()
+    report = CatalogImporter(batch_size=4, on_progress=progress.append).run(str(path), table.extend)
+    
+    assert report.records_read == 14
+    assert report.imported == 10
+    assert report.rejected == 4
+    assert len(report.errors) == 4
+    assert len(table) == 10
+    assert table.stats[3] == {"Armor": 3}
+    assert len(progress) == 4
+    assert progress[-1].fraction == 1.0
+
+def test_csv_import_into_item_service(tmp_path):
+    path = tmp_path / "catalog.csv"
+    path.write_text(
+        "name,Price,Category,Favorite,Effects,Armor,Health\n"
+        "Plate,1500,Survival,yes,\"Blocks, a lot\",10,\n"
+        "Boots,1000,Survival,no,,,25\n"
+        "Bad,abc,Survival,no,,,\n"
+    )
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    report = CatalogImporter().run(str(path), item_service.add_items)
+    
+    assert (report.imported, report.rejected) == (2, 1)
+    plate = item_service.items["Plate"]
+    assert plate.category == Category.SURVIVAL
+    assert plate.favorite is True
+    assert plate.effects == "Blocks, a lot"
+    assert plate.stats == {"Armor": 10}
+    assert item_service.items["Boots"].stats == {"Health": 25}
+    assert item_service.items["Boots"].total_weight > 0
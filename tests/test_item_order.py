@@ -0,0 +1,59 @@
+import sys
+import os
+import random
+
+# Adjust path for local imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.item_order import CATEGORY_ORDER, ItemOrder
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.models.category import Category
+from src.models.item import Item
+
+def _random_item(rng, name):
+    return Item(name, rng.randrange(1, 8) * 500, category=rng.choice(list(Category)),
+                favorite=rng.random() < 0.2, weight_per_1k=float(rng.randrange(5)))
+
+def _expected_sections(items, optimal):
+    optimal_names = sorted((n for n in items if n in optimal), key=lambda n: -items[n].weight_per_1k)
+    regular = sorted((n for n in items if n not in optimal), key=lambda n: (
+        items[n].category != 'None', not items[n].favorite, -items[n].weight_per_1k))
+    return tuple(tuple(section) for section in (optimal_names, regular) if section)
+
+def test_orders_match_sorting_under_edits():
+    rng = random.Random(3)
+    order = ItemOrder()
+    items = {}
+    for step in range(600):
+        name = f"Item {rng.randrange(80)}"
+        if name in items and rng.random() < 0.3:
+            del items[name]
+            order.remove(name)
+        else:
+            items[name] = _random_item(rng, name)
+            order.put(name, items[name])
+        if step % 50 == 0:
+            subset = {n: items[n] for n in items if rng.random() < 0.5}
+            optimal = set(rng.sample(sorted(subset), min(3, len(subset))))
+            # Ties keep first-seen order, so compare against a dict in that order
+            ordered = {n: subset[n] for n in sorted(subset, key=order._sequence.get)}
+            assert order.sections(subset, optimal) == _expected_sections(ordered, optimal)
+            assert order.ordered(subset, 'price', CATEGORY_ORDER) == sorted(
+                ordered, key=lambda n: (CATEGORY_ORDER.index(items[n].category), -items[n].price))
+
+def test_item_view_is_memoized_until_catalog_changes(tmp_path):
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    item_service.output_weights = {"Adjustment": 1.0}
+    item_service.add_item(Item("Cheap", 1000, adjustment=1, category=Category.WEAPON))
+    item_service.add_item(Item("Pricey", 5000, adjustment=50, category=Category.WEAPON))
+    view = item_service.item_view("", [Category.WEAPON])
+    assert view.sections == (("Pricey", "Cheap"),)
+    assert item_service.item_view("", [Category.WEAPON]) is view
+    assert item_service.item_view("", [Category.WEAPON], ["Cheap"]).sections == (("Cheap",), ("Pricey",))
+    assert item_service.item_view("speed>=3").sections == ()  # unparsed text is a name search
+
+    item_service.update_item("Cheap", Item("Cheap", 1000, adjustment=99, category=Category.WEAPON))
+    view = item_service.item_view("", [Category.WEAPON])
+    assert view.sections == (("Cheap", "Pricey"),)
+    assert view.items["Cheap"].adjustment == 99
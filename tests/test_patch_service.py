@@ -0,0 +1,71 @@
+import sys
+import os
+import pytest
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.services.optimizer import OptimizerService
+from src.services.patch_service import (
+    CatalogPatch, PatchConflictError, PatchService, diff_catalogs
+)
+from src.models.item import Item
+
+def _service(tmp_path):
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    item_service.output_weights = {"Adjustment": 1.0}
+    with item_service.batch():
+        item_service.add_item(Item("A", 1000, adjustment=10))
+        item_service.add_item(Item("B", 1000, adjustment=8))
+        item_service.add_item(Item("C", 3000, adjustment=5))
+    return item_service
+
+def test_diff_and_round_trip(tmp_path):
+    old = {"A": {"Price": 1000, "Armor": 5, "Total Weight": 3}, "B": {"Price": 500}}
+    new = {"A": {"Price": 900, "Health": 10, "Total Weight": 9}, "C": {"Price": 100}}
+    patch = diff_catalogs(old, new, label="S2")
+    assert patch.added == {"C": {"Price": 100}}
+    assert patch.removed == {"B": {"Price": 500}}
+    assert patch.changed == {"A": {"Armor": [5, None], "Health": [None, 10], "Price": [1000, 900]}}
+    
+    path = tmp_path / "patch.json"
+    patch.save(str(path))
+    loaded = CatalogPatch.load(str(path))
+    items = {name: dict(data) for name, data in old.items()}
+    loaded.apply_to(items)
+    assert items == {"A": {"Price": 900, "Health": 10, "Total Weight": 3}, "C": {"Price": 100}}
+    loaded.inverted().apply_to(items)
+    assert set(items) == {"A", "B"} and items["A"]["Armor"] == 5
+
+def test_apply_resolves_only_affected_builds(tmp_path):
+    item_service = _service(tmp_path)
+    optimizer = OptimizerService()
+    build_small = optimizer.find_optimal_items(1000, item_service.items)
+    build_large = optimizer.find_optimal_items(2000, item_service.items)
+    assert build_small.names == ["A"]
+    
+    # C gets more expensive: cannot help any build, and is in none of them
+    patch = diff_catalogs(
+        {name: item.to_dict() for name, item in item_service.items.items()},
+        {**{name: item.to_dict() for name, item in item_service.items.items()},
+         "C": {**item_service.items["C"].to_dict(), "Price": 3500}})
+    report = PatchService(item_service, optimizer).apply(patch, [build_small, build_large])
+    assert report.resolved == []
+    assert len(report.skipped) == 2
+    
+    # B gets much better: every build must be re-checked, the small one changes
+    patch = CatalogPatch(changed={"B": {"Adjustment": [8, 20]}})
+    report = PatchService(item_service, optimizer).apply(patch, [build_small, build_large])
+    assert len(report.resolved) == 2
+    assert [set(new.names) for _, new in report.changed_builds] == [{"B"}, {"A", "B"}]
+    assert report.changed_builds[1][1].weight == 30
+    assert item_service.items["B"].total_weight == 20
+
+def test_conflicting_patch_changes_nothing(tmp_path):
+    item_service = _service(tmp_path)
+    patch = CatalogPatch(removed={"A": {}}, changed={"B": {"Adjustment": [99, 1]}})
+    with pytest.raises(PatchConflictError):
+        PatchService(item_service).apply(patch)
+    assert set(item_service.items) == {"A", "B", "C"}
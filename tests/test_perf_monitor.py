@@ -0,0 +1,53 @@
+import sys
+import os
+import json
+import tkinter as tk
+
+# Adjust path for local imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.ui.perf_monitor import LatencyStats, PerfMonitor
+from src.models.build_result import BuildResult
+
+class FakeRoot:
+    """Stands in for a Tk root; there is no display in the test environment."""
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, ms, func):
+        self.jobs.append(func)
+
+    def winfo_children(self):
+        return []
+
+def test_latency_percentiles():
+    stats = LatencyStats()
+    for ms in range(1, 101):
+        stats.add(ms / 1000)
+    assert stats.percentile(0.95) == 0.095
+    assert stats.percentile(0.5) == 0.05
+    assert stats.to_dict()["max_ms"] == 100
+
+def test_monitor_times_callbacks_and_dumps(tmp_path):
+    root = FakeRoot()
+    monitor = PerfMonitor()
+    original = tk.CallWrapper.__call__
+    monitor.install(root)
+    try:
+        def on_click():
+            return "done"
+        assert tk.CallWrapper(on_click, None, None)() == "done"
+        root.jobs.pop()()  # heartbeat is not counted as a callback
+    finally:
+        monitor.uninstall()
+    assert tk.CallWrapper.__call__ is original
+    assert monitor.callbacks.count == 1 and monitor.lag.count == 1
+    assert "test_monitor_times_callbacks_and_dumps.<locals>.on_click" in monitor.by_callback
+
+    monitor.record_solve(BuildResult([], 0, 0.0, engine="python", wall_time=0.01, cache_hit=True))
+    with monitor.measure("render"):
+        pass
+    monitor.dump(str(tmp_path / "metrics.json"))
+    metrics = json.loads((tmp_path / "metrics.json").read_text())
+    assert metrics["cache_hit_rate"] == 1.0 and metrics["widget_count"] == 1
+    assert metrics["timings"]["render"]["count"] == 1
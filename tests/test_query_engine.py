@@ -0,0 +1,76 @@
+import sys
+import os
+import random
+import pytest
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.query_engine import ItemQuery, QueryEngine, QueryError
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.models.category import Category
+from src.models.item import Item
+
+def _catalog():
+    return {
+        "Shield Amp": Item("Shield Amp", 4000, category=Category.ABILITY,
+                           effects="Gain 50 Shields on ability use", stats={"Cooldown Reduction": 10}),
+        "Fast Core": Item("Fast Core", 6000, category=Category.ABILITY,
+                          effects="Shielding lasts longer", stats={"Cooldown Reduction": 15}),
+        "Slow Core": Item("Slow Core", 3000, category=Category.ABILITY, stats={"Cooldown Reduction": 5}),
+        "Rifle Grip": Item("Rifle Grip", 1000, category=Category.WEAPON, favorite=True,
+                           effects="Shield break", stats={"Attack Speed": 5}),
+    }
+
+def test_parse_query_terms():
+    query = ItemQuery.parse('category:ability "Cooldown Reduction">=10 price<5000 effects:shield amp')
+    assert query.categories == ["Ability"]
+    assert query.ranges == [("Cooldown Reduction", ">=", 10.0), ("Price", "<", 5000.0)]
+    assert query.effects == ["shield"] and query.text == "amp"
+    assert ItemQuery.parse("cdr≥10 is:favorite").ranges == [("Cooldown Reduction", ">=", 10.0)]
+    assert ItemQuery.parse("Dragon's Breath").text == "Dragon's Breath"
+    with pytest.raises(QueryError):
+        ItemQuery.parse("speed>=3")
+    with pytest.raises(QueryError):
+        ItemQuery.parse("category:tank")
+
+def test_query_combines_predicates():
+    engine = QueryEngine(_catalog())
+    assert engine.query("category:ability cdr>=10 price<5000 effects:shield") == ["Shield Amp"]
+    assert engine.query("effects:shield") == ["Shield Amp", "Fast Core", "Rifle Grip"]
+    assert engine.query("cdr<10") == ["Slow Core", "Rifle Grip"]  # absent stat counts as 0
+    assert engine.query("cdr=15") == ["Fast Core"]
+    assert engine.query("is:favorite") == ["Rifle Grip"]
+    assert engine.query("core price>3000") == ["Fast Core"]
+    assert engine.query("", [Category.WEAPON]) == ["Rifle Grip"]
+
+def test_query_matches_scan_under_edits():
+    rng = random.Random(7)
+    engine = QueryEngine()
+    items = {}
+    for step in range(800):
+        name = f"Item {rng.randrange(120)}"
+        if name in items and rng.random() < 0.3:
+            del items[name]
+            engine.remove(name)
+            continue
+        items[name] = Item(name, rng.randrange(1, 10) * 500, category=rng.choice(list(Category)),
+                           stats={"Armor": rng.randrange(0, 30)} if rng.random() < 0.5 else {})
+        engine.put(name, items[name])
+    checks = {
+        "armor>=10 price<=2500": lambda i: i.stats.get("Armor", 0) >= 10 and i.price <= 2500,
+        "armor<10 price>2500": lambda i: i.stats.get("Armor", 0) < 10 and i.price > 2500,
+        "armor=0": lambda i: i.stats.get("Armor", 0) == 0,
+    }
+    for query, test in checks.items():
+        assert sorted(engine.query(query)) == sorted(n for n, i in items.items() if test(i))
+
+def test_item_service_query_tracks_weight_changes(tmp_path):
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    item_service.output_weights = {"Armor": 1.0}
+    item_service.add_item(Item("Plate", 1000, stats={"Armor": 20}))
+    assert list(item_service.query_items("weight>=20")) == ["Plate"]
+    item_service.output_weights = {"Armor": 0.5}
+    item_service.recalculate_weights()
+    assert list(item_service.query_items("weight>=20")) == []
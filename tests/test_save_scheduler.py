@@ -0,0 +1,50 @@
+import sys
+import os
+import json
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.services.save_scheduler import SaveScheduler
+from src.models.item import Item
+
+def test_save_is_atomic_and_leaves_no_temp_files(tmp_path):
+    file_service = FileService(str(tmp_path / "items.json"))
+    assert file_service.save_data({"A": {"Price": 1}}, {"Base Weights": {}}, {})
+    assert os.listdir(tmp_path) == ["items.json"]
+    assert json.loads((tmp_path / "items.json").read_text())["items"] == {"A": {"Price": 1}}
+
+def test_requests_are_coalesced(tmp_path):
+    file_service = FileService(str(tmp_path / "items.json"))
+    scheduler = SaveScheduler(file_service, interval_ms=10_000)
+    for i in range(50):
+        scheduler.schedule(lambda i=i: ({"A": {"Price": i}}, {"Base Weights": {}}, {}))
+    assert scheduler.flush()
+    scheduler.close()
+    assert scheduler.requests == 50
+    assert scheduler.writes <= 2
+    data = json.loads((tmp_path / "items.json").read_text())
+    assert data["items"]["A"]["Price"] == 49
+
+def test_item_service_defers_writes_until_flush(tmp_path):
+    file_service = FileService(str(tmp_path / "items.json"))
+    scheduler = SaveScheduler(file_service, interval_ms=10_000)
+    item_service = ItemService(file_service, scheduler)
+    item_service.add_item(Item("A", 1000, adjustment=5))
+    item_service.add_item(Item("B", 1500))
+    assert item_service.flush()
+    scheduler.close()
+    reloaded = ItemService(FileService(str(tmp_path / "items.json")))
+    assert set(reloaded.items) == {"A", "B"}
+    assert reloaded.items["A"].adjustment == 5
+
+def test_captured_payload_ignores_later_in_place_changes(item_service):
+    name = next(iter(item_service.items))
+    before = item_service.items[name].to_dict()
+    build = item_service._capture_save_payload()
+    item_service.items[name].calculate_total_weight({key: 100.0 for key in item_service.output_weights})
+    items_dict, _, _, _ = build()
+    assert list(items_dict) == list(item_service.items)
+    assert items_dict[name] == before
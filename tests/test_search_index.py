@@ -0,0 +1,73 @@
+import sys
+import os
+import random
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.search_index import SearchIndex
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.models.category import Category
+from src.models.item import Item
+
+CATEGORIES = [Category.WEAPON, Category.ABILITY, Category.SURVIVAL]
+
+def _scan(items, text, categories):
+    text = text.lower().strip()
+    return [
+        name for name, item in items.items()
+        if (not text or text in name.lower())
+        and (categories is None or item.category in categories)
+    ]
+
+def test_index_matches_linear_scan_under_edits():
+    rng = random.Random(5)
+    words = ["Plasma", "Shield", "Boots", "Rifle", "Core", "Amp", "Nano", "Kit"]
+    items = {}
+    index = SearchIndex()
+    for step in range(1500):
+        name = f"{rng.choice(words)} {rng.choice(words)} {rng.randrange(50)}"
+        if name in items and rng.random() < 0.4:
+            del items[name]
+            index.remove(name)
+        else:
+            items[name] = Item(name, 1000, category=rng.choice(CATEGORIES))
+            index.put(name, items[name])
+    for query in ["", "p", "pl", "plasma", "plasma s", "PLASMA SHIELD", "d 4", "zz", "s 1"]:
+        for categories in [None, [], [Category.WEAPON], CATEGORIES[1:]]:
+            assert index.search(query, categories) == _scan(items, query, categories)
+
+def test_extending_query_narrows_previous_result():
+    items = {name: Item(name, 1000) for name in ["Shield Amp", "Shield Core", "Shiv", "Boots"]}
+    index = SearchIndex(items)
+    assert index.search("sh") == ["Shield Amp", "Shield Core", "Shiv"]
+    assert index.search("shie") == ["Shield Amp", "Shield Core"]
+    assert index.search("shield c") == ["Shield Core"]
+    assert index.search("s") == ["Shield Amp", "Shield Core", "Shiv", "Boots"]
+
+def test_item_service_keeps_index_current(tmp_path):
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    item_service.add_item(Item("Shield Amp", 1000, category=Category.ABILITY))
+    item_service.update_item("Shield Amp", Item("Shield Amp", 1000, category=Category.WEAPON))
+    assert list(item_service.get_filtered_items("amp", [Category.WEAPON])) == ["Shield Amp"]
+    assert list(item_service.get_filtered_items("amp", [Category.ABILITY])) == []
+    item_service.update_item("Shield Amp", Item("Power Amp", 1000, category=Category.WEAPON))
+    item_service.delete_item("Missing")
+    assert list(item_service.get_filtered_items("amp")) == ["Power Amp"]
+    with item_service.batch():
+        item_service.delete_item("Power Amp")
+    assert list(item_service.get_filtered_items("amp")) == []
+
+def test_reindexed_item_keeps_its_position_and_views_narrow(tmp_path):
+    item_service = ItemService(FileService(str(tmp_path / "items.json")))
+    for name in ["Shield Amp", "Shield Core", "Shiv"]:
+        item_service.add_item(Item(name, 1000, category=Category.ABILITY))
+    item_service.update_item("Shield Amp", Item("Shield Amp", 1000, category=Category.WEAPON))
+    assert list(item_service.get_filtered_items("sh")) == ["Shield Amp", "Shield Core", "Shiv"]
+
+    index = item_service.search_index
+    assert list(item_service.item_view("shi").items) == ["Shield Amp", "Shield Core", "Shiv"]
+    assert index._last[0] == "shi"
+    assert set(item_service.item_view("shield").items) == {"Shield Amp", "Shield Core"}
+    assert index._last[0] == "shield"
@@ -0,0 +1,77 @@
+import io
+import json
+import asyncio
+import contextlib
+
+from src.server import OptimizationServer, parse_query_string
+
+def _server(item_service):
+    server = OptimizationServer(item_service, processes=0)
+    server.start()
+    return server
+
+def test_parse_query_string():
+    fields = parse_query_string("budget=9000&profiles=A%20B,C&scales=A%20B:0.25&query=category:weapon")
+    assert fields == {"budget": 9000, "profiles": ["A B", "C"], "scales": {"A B": 0.25},
+                      "query": "category:weapon"}
+    assert parse_query_string("profiles=") == {"profiles": []}
+
+def test_coalescing_cache_and_deadline(item_service):
+    server = _server(item_service)
+
+    async def scenario():
+        first, second = await asyncio.gather(
+            server.dispatch("GET", "/optimize?budget=7000", b""),
+            server.dispatch("POST", "/optimize", json.dumps({"budget": 7000, "id": "x"}).encode()))
+        assert first == second and first[0] == 200
+        assert server.counters["solves"] == 1 and server.counters["coalesced"] == 1
+
+        status, body = await server.dispatch("GET", "/optimize?budget=7000", b"")
+        assert status == 200 and server.counters["cache_hits"] == 1
+
+        status, body = await server.dispatch("GET", "/optimize?budget=9000&deadline_ms=1", b"")
+        assert status == 504
+        # The solve keeps running and serves the next request
+        status, late = await server.dispatch("GET", "/optimize?budget=9000", b"")
+        assert status == 200 and late["price"] <= 9000
+
+        status, frontier = await server.dispatch("GET", "/frontier?max=7000&step=1000", b"")
+        weights = [point["weight"] for point in frontier["results"]]
+        assert status == 200 and weights == sorted(set(weights))
+
+        assert (await server.dispatch("GET", "/optimize?budget=x", b""))[0] == 400
+        assert (await server.dispatch("GET", "/top-k?budget=5000&k=0", b""))[0] == 400
+        assert (await server.dispatch("GET", "/nowhere", b""))[0] == 404
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(scenario())
+    server.close()
+
+def test_http_round_trip(item_service):
+    server = _server(item_service)
+
+    async def scenario():
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = []
+        for target in ("/top-k?budget=5000&k=2", "/health"):
+            writer.write(f"GET {target} HTTP/1.1\r\nHost: test\r\n\r\n".encode())
+            await writer.drain()
+            status = int((await reader.readline()).split()[1])
+            headers = {}
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                headers[name.lower()] = value.strip()
+            responses.append((status, json.loads(await reader.readexactly(int(headers["content-length"])))))
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return responses
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        (status, top), (_, health) = asyncio.run(scenario())
+    server.close()
+    assert status == 200 and len(top["builds"]) == 2
+    assert top["builds"][0]["weight"] >= top["builds"][1]["weight"]
+    assert health["requests"] == 2 and health["status"] == "ok"
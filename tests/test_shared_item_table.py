@@ -0,0 +1,67 @@
+import io
+import json
+import contextlib
+
+from src.models.item_table import ItemTable
+from src.services.batch_runner import BatchRunner, BatchSolver
+from src.services.shared_item_table import SharedItemTable, SharedItemView
+
+def _fields(items):
+    return {name: (item.price, item.adjustment, item.effect_value, item.category,
+                   item.total_weight, item.stats)
+            for name, item in items.items()}
+
+def test_view_matches_table_and_follows_new_versions(item_service):
+    items = item_service.snapshot()
+    table = ItemTable.from_items(items.values())
+    shared = SharedItemTable()
+    try:
+        shared.publish(table, 1)
+        view = SharedItemView(shared.name)
+        assert view.version == 1 and view.names == list(items)
+        assert list(view.column("prices")) == [item.price for item in items.values()]
+        assert _fields(view.to_items()) == _fields(table.to_items())
+        assert not view.refresh()
+
+        name = view.names[0]
+        changed = table.to_items()
+        changed[name].price += 100
+        shared.publish(ItemTable.from_items(changed.values()), 2)
+        assert view.refresh() and view.version == 2
+        assert view.to_items()[name].price == items[name].price + 100
+        view.close()
+    finally:
+        shared.close()
+
+def test_batch_solver_reloads_and_shared_runner_matches_pickled(item_service):
+    runner = BatchRunner(item_service, processes=0)
+    # A few items keep the pure Python search small once every price is 1
+    items = dict(list(item_service.snapshot().items())[:12])
+    shared = SharedItemTable()
+    try:
+        shared.publish(ItemTable.from_items(items.values()), 1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            solver = BatchSolver(shared.name, runner.weights)
+            query = runner.validate({"budget": 4000}, 1)
+            before = solver.solve(query)
+            cheaper = ItemTable.from_items(items.values()).to_items()
+            for item in cheaper.values():
+                item.price = 1
+            shared.publish(ItemTable.from_items(cheaper.values()), 2)
+            after = solver.solve(query)
+        assert solver.shared.version == 2
+        assert after["price"] == len(after["names"]) and after["weight"] >= before["weight"]
+        solver.shared.close()
+    finally:
+        shared.close()
+
+    lines = [json.dumps({"id": i, "budget": 3500 + 500 * (i % 4),
+                         "profiles": ["1 Weapon Power"] if i % 2 else []})
+             for i in range(8)]
+    records = {}
+    for shared_memory in (False, True):
+        out = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            BatchRunner(item_service, processes=1, shared_memory=shared_memory).run(lines, out.append)
+        records[shared_memory] = [(r["id"], r["price"], r["weight"]) for r in out]
+    assert records[True] == records[False]
@@ -0,0 +1,51 @@
+import sys
+import os
+import shutil
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.file_service import FileService
+from src.services.item_service import ItemService
+from src.services.snapshot_cache import SnapshotCache
+from src.models.item import Item
+from src.models.item_table import ItemTable
+
+REPO_ITEMS = os.path.join(os.path.dirname(__file__), "..", "src", "items.json")
+
+def _service(tmp_path, journal=False):
+    file_service = FileService(str(tmp_path / "items.json"), journal=journal)
+    return ItemService(file_service, snapshot_cache=SnapshotCache(str(tmp_path / "items.snapshot")))
+
+def test_item_table_round_trip():
+    items = [Item("A", 1000, adjustment=2, effects="x", favorite=True, total_weight=3.5,
+                  stats={"Armor": 10}),
+             Item("B", 500, stats={"Health": 25, "Armor": 0})]
+    table = ItemTable.from_state(ItemTable.from_items(items).to_state())
+    assert table.to_items() == {item.name: item for item in items}
+
+def test_warm_start_matches_cold_start(tmp_path):
+    shutil.copy(REPO_ITEMS, tmp_path / "items.json")
+    cold = _service(tmp_path)
+    assert (tmp_path / "items.snapshot").exists()
+    warm = _service(tmp_path)
+    assert warm.items == cold.items
+    assert list(warm.items) == list(cold.items)
+    assert warm.weights == cold.weights
+    assert warm.output_weights == cold.output_weights
+    assert warm.enabled_profiles == cold.enabled_profiles
+
+def test_changed_source_invalidates_cache(tmp_path):
+    shutil.copy(REPO_ITEMS, tmp_path / "items.json")
+    service = _service(tmp_path)
+    service.add_item(Item("Brand New", 1234))
+    assert "Brand New" in _service(tmp_path).items
+
+def test_warm_start_keeps_journal_position(tmp_path):
+    service = _service(tmp_path, journal=True)
+    service.add_item(Item("A", 1000))
+    service.flush()
+    _service(tmp_path, journal=True)  # cold load stores the cache
+    warm = _service(tmp_path, journal=True)
+    warm.add_item(Item("B", 1000))
+    assert set(_service(tmp_path, journal=True).items) == {"A", "B"}
@@ -0,0 +1,52 @@
+import sys
+import os
+
+# Adjust path for local imports 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.file_service import FileService
+from src.services.sqlite_file_service import SqliteFileService
+from src.services.item_service import ItemService
+from src.models.category import Category
+from src.models.item import Item
+
+def test_round_trip_matches_json_contract(tmp_path):
+    db = SqliteFileService(str(tmp_path / "items.db"))
+    items = {"A": {"Price": 1000, "Category": "Weapon"}, "B": {"Price": 500, "Category": "Ability"}}
+    weights = {"Base Weights": {"Armor": 2.0}, "Tank": {"Armor": 3.0, "_enabled": True}}
+    assert db.save_data(items, weights, {"Armor": 6.0})
+    loaded = db.load_data()
+    assert loaded == (items, weights, {"Armor": 6.0})
+    assert list(loaded[1]) == ["Base Weights", "Tank"]
+    
+    assert db.save_data({"B": items["B"]}, weights, {})
+    assert list(db.load_data()[0]) == ["B"]
+
+def test_empty_database_returns_defaults(tmp_path):
+    items, weights, output_weights = SqliteFileService(str(tmp_path / "items.db")).load_data()
+    assert items == {}
+    assert "Base Weights" in weights
+    assert output_weights == weights["Base Weights"]
+
+def test_item_service_persists_per_item_upserts(tmp_path):
+    path = str(tmp_path / "items.db")
+    item_service = ItemService(SqliteFileService(path))
+    item_service.add_item(Item("Alpha", 1000, category=Category.WEAPON))
+    item_service.add_item(Item("Beta", 1500, category=Category.ABILITY))
+    item_service.update_item("Alpha", Item("Gamma", 2000, category=Category.WEAPON))
+    item_service.delete_item("Beta")
+    item_service.file_service.close()
+    
+    reloaded = ItemService(SqliteFileService(path))
+    assert set(reloaded.items) == {"Gamma"}
+    assert reloaded.items["Gamma"].price == 2000
+
+def test_filters_are_pushed_down_to_sql(tmp_path):
+    json_service = ItemService(FileService())
+    db = SqliteFileService(str(tmp_path / "items.db"))
+    assert db.import_from(FileService())
+    sql_service = ItemService(db)
+    for text, categories in [("", None), ("am", None), ("AM", [Category.WEAPON]),
+                             ("", [Category.ABILITY, Category.SURVIVAL]), ("x", [])]:
+        expected = json_service.get_filtered_items(text, categories)
+        assert list(sql_service.get_filtered_items(text, categories)) == list(expected)
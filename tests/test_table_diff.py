@@ -0,0 +1,67 @@
+import sys
+import os
+
+# Adjust path for local imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.ui.table_diff import TreeviewDiffer
+
+class FakeTree:
+    """Records Treeview calls on a plain list of top-level rows."""
+    def __init__(self):
+        self.rows = []
+        self.values = {}
+        self.calls = []
+
+    def insert(self, parent, index, iid, values):
+        self.calls.append("insert")
+        self.rows.insert(index, iid)
+        self.values[iid] = values
+
+    def item(self, iid, values):
+        self.calls.append("item")
+        self.values[iid] = values
+
+    def move(self, iid, parent, index):
+        self.calls.append("move")
+        self.rows.remove(iid)
+        self.rows.insert(index, iid)
+
+    def delete(self, *iids):
+        self.calls.append("delete")
+        for iid in iids:
+            self.rows.remove(iid)
+            del self.values[iid]
+
+def _format(name, value):
+    return (name, f"{value:.2f}")
+
+def test_sync_applies_only_differences():
+    tree = FakeTree()
+    rows = TreeviewDiffer(tree, _format)
+    weights = {f"Stat {i:03}": float(i) for i in range(300)}
+    assert rows.sync(weights) == (300, 0, 0)
+    assert tree.rows == sorted(weights)
+
+    tree.calls.clear()
+    weights["Stat 007"] = 1.234
+    weights["Added"] = 2.0
+    del weights["Stat 100"]
+    assert rows.sync(weights) == (1, 1, 1)
+    assert sorted(tree.calls) == ["delete", "insert", "item"]
+    assert tree.rows == sorted(weights)
+    assert tree.values["Stat 007"] == ("Stat 007", "1.23")
+
+    tree.calls.clear()
+    assert rows.sync(weights) == (0, 0, 0) and tree.calls == []
+
+def test_patch_moves_rows_when_sort_key_changes():
+    tree = FakeTree()
+    rows = TreeviewDiffer(tree, _format, sort_key=lambda name, value: -value)
+    weights = {"A": 1.0, "B": 2.0, "C": 3.0}
+    rows.sync(weights)
+    assert tree.rows == ["C", "B", "A"]
+    weights["A"] = 5.0
+    del weights["B"]
+    assert rows.patch(weights, ["A", "B"]) == (0, 1, 1)
+    assert tree.rows == ["A", "C"]